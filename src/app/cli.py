@@ -0,0 +1,197 @@
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+# Тяжёлые модули (docker, SQLAlchemy, pandas) импортируются внутри функций:
+# CLI не должен тянуть PyQt6, matplotlib и langchain и платить за них при запуске.
+
+EXIT_OK = 0
+EXIT_FAILURE = 1
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.app.cli",
+        description="Запуск сценария тестирования СУБД без графического интерфейса.",
+    )
+    scenario = parser.add_mutually_exclusive_group(required=True)
+    scenario.add_argument("--scenario", help="Имя сценария в хранилище")
+    scenario.add_argument(
+        "--scenario-file",
+        type=Path,
+        help="JSON со сценарием: список шагов или объект {name, steps}",
+    )
+    image = parser.add_mutually_exclusive_group(required=True)
+    image.add_argument("--image", help="Имя конфигурации Docker-образа в хранилище")
+    image.add_argument(
+        "--image-file",
+        type=Path,
+        help="JSON с конфигурацией образа: {image_name, config_name, config}",
+    )
+    image.add_argument(
+        "--matrix-file",
+        type=Path,
+        help="JSON с матрицей запусков: {images, config_variants, step_params, "
+        "parallelism, cpus_per_run, load_cpus_per_run}; "
+        "images – имена конфигураций или объекты образов",
+    )
+    parser.add_argument(
+        "--use-existing",
+        action="store_true",
+        help="Подключиться к уже запущенному контейнеру",
+    )
+    after = parser.add_mutually_exclusive_group()
+    after.add_argument("--stop-after", action="store_true", help="Остановить контейнер")
+    after.add_argument(
+        "--remove-after",
+        action="store_true",
+        help="Остановить и удалить контейнер",
+    )
+    parser.add_argument(
+        "--stats-interval-ms",
+        type=int,
+        default=None,
+        help="Период опроса cgroup контейнера (10–100 мс); по умолчанию docker stats",
+    )
+    parser.add_argument(
+        "--db-cpus",
+        type=int,
+        default=None,
+        help="Выделить СУБД столько ядер, генератору нагрузки – остальные (локальный Docker)",
+    )
+    parser.add_argument(
+        "--pull",
+        choices=["always", "if_not_present", "never"],
+        default="if_not_present",
+        help="Политика загрузки образа из registry",
+    )
+    parser.add_argument("--docker-url", default=None, help="URL удалённого Docker daemon")
+    return parser
+
+
+def load_scenario_steps(name: str | None = None, path: Path | None = None) -> list:
+    """Шаги сценария из хранилища по имени или из JSON-файла."""
+    if path is not None:
+        from src.app.core.scenario_steps import deserialize_step
+
+        data = _read_json(path)
+        steps = data["steps"] if isinstance(data, dict) else data
+        return [deserialize_step(step) for step in steps]
+
+    from src.app.storage.db_manager.scenario_storage import scenario_db_manager
+
+    scenario = scenario_db_manager.get_scenario(name=name)
+    if scenario is None:
+        msg = f"Сценарий '{name}' не найден."
+        raise ValueError(msg)
+    return scenario.get_steps()
+
+
+def load_image(config_name: str | None = None, path: Path | None = None):
+    """DockerImage из хранилища по имени конфигурации или из JSON-файла."""
+    if path is None:
+        from src.app.storage.db_manager.docker_storage import docker_db_manager
+
+        return docker_db_manager.get_image(config_name=config_name)
+
+    return _image_from_dict(_read_json(path))
+
+
+def load_matrix(path: Path, scenario_steps: list, test_system_config, docker_host):
+    """MatrixConf из JSON-файла; образы – по имени конфигурации или описанием."""
+    from src.app.core.matrix_runner import MatrixConf
+
+    data = _read_json(path)
+    images = [
+        load_image(config_name=image) if isinstance(image, str) else _image_from_dict(image)
+        for image in data.pop("images")
+    ]
+    return MatrixConf(
+        images=images,
+        scenario_steps=scenario_steps,
+        test_system_config=test_system_config,
+        docker_host=docker_host,
+        **data,
+    )
+
+
+def _image_from_dict(data: dict[str, Any]):
+    from src.app.storage.model import DockerImage
+
+    config = data.get("config", {})
+    return DockerImage(
+        image_name=data["image_name"],
+        config_name=data.get("config_name", data["image_name"]),
+        config=config if isinstance(config, str) else json.dumps(config),
+    )
+
+
+def run(args: argparse.Namespace) -> None:
+    from src.app.schemas.schema import DbTestConf, DockerHostConfig, TestSystemConfig
+
+    scenario_steps = load_scenario_steps(args.scenario, args.scenario_file)
+    test_system_config = TestSystemConfig(
+        use_existing=args.use_existing,
+        stop_after=args.stop_after,
+        remove_after=args.remove_after,
+        stats_interval_ms=args.stats_interval_ms,
+        db_cpu_count=args.db_cpus,
+        pull_policy=args.pull,
+    )
+    docker_host = DockerHostConfig(base_url=args.docker_url)
+
+    if args.matrix_file is not None:
+        from src.app.core.matrix_runner import run_matrix
+
+        matrix = load_matrix(args.matrix_file, scenario_steps, test_system_config, docker_host)
+        failed = [result for result in run_matrix(matrix, log_fn=_print) if not result.ok]
+        if failed:
+            msg = f"Запусков с ошибкой: {len(failed)}"
+            raise RuntimeError(msg)
+        return
+
+    from src.app.core.docker_test import run_test
+
+    db_test_conf = DbTestConf(
+        db_config=load_image(args.image, args.image_file),
+        scenario_steps=scenario_steps,
+        test_system_config=test_system_config,
+        docker_host=docker_host,
+    )
+    _print(
+        f"✨ Запускаем тест: {len(db_test_conf.scenario_steps)} шагов, "
+        f"образ '{db_test_conf.db_config.image_name}'…",
+    )
+    run_test(db_test_conf, log_fn=_print)
+    _print("🟢 Тест завершён.")
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        run(args)
+    except KeyboardInterrupt:
+        print("❗️ Тест прерван.", file=sys.stderr, flush=True)
+        return EXIT_FAILURE
+    except Exception as e:
+        from src.app.config.log import get_logger
+
+        get_logger(__name__).exception(f"❗️ Ошибка запуска теста из CLI: {e}")
+        print(f"❗️ Ошибка: {e}", file=sys.stderr, flush=True)
+        return EXIT_FAILURE
+    return EXIT_OK
+
+
+def _print(message: str) -> None:
+    print(message, flush=True)
+
+
+def _read_json(path: Path) -> Any:
+    with path.open(encoding="utf-8") as f:
+        return json.load(f)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
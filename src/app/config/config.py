@@ -21,7 +21,7 @@ class Settings(BaseSettings):
     DB_PASSWORD: str = "mysecretpassword"
     DB_DIALECT: str = "postgresql+psycopg"
 
-    CSV_FILE_WITH_TEST_DATA: str = "test_data.csv"
+    DATA_CHUNK_SIZE: int = 100_000
     ICONS_PATH: str = "./src/app/resources/icons"
 
     class Config:
@@ -1,16 +1,62 @@
-import concurrent.futures
+import datetime
+import json
 import re
+import secrets
 import time
+import uuid
+from typing import Any
 
-from src.app.core.scenario_steps import ScenarioStep, StepType
+from src.app.core.insert_runner import run_insert_range
+from src.app.core.process_driver import run_insert_in_processes, run_query_in_processes
+from src.app.core.query_runner import run_query_step
+from src.app.core.repeat_stats import summarize
+from src.app.core.scenario_steps import InsertDataStep, ScenarioStep, StepType
+from src.app.manager.cpu_affinity import (
+    available_cpus,
+    format_cpuset,
+    parse_cpuset,
+    pinned_thread,
+    split_cores,
+)
 from src.app.manager.db.base_adapter import BaseAdapter
 from src.app.manager.db.redis_adapter import RedisAdapter
 from src.app.manager.db.sql_adapter import SQLAdapter
 from src.app.manager.docker_manager import DockerManager
-from src.app.schemas.schema import DbTestConf
+from src.app.manager.readiness import wait_for_database
+from src.app.schemas.enums import ExecutionMode
+from src.app.schemas.schema import ContainerResources, DbTestConf, ReadinessConfig
 from src.app.storage.db_manager.result_storage import result_manager
+from src.app.storage.db_manager.result_writer import ResultWriter
 from src.app.storage.model import TestResults
 
+# Метрики, которые усредняются по повторам шага
+REPEATED_METRICS = (
+    "execution_time",
+    "memory_used",
+    "cpu_percent",
+    "latency_p50",
+    "latency_p95",
+    "latency_p99",
+    "throughput",
+    "pool_wait_p95",
+    "blk_read_bytes",
+    "blk_write_bytes",
+    "blk_read_ops",
+    "blk_write_ops",
+    "net_rx_bytes",
+    "net_tx_bytes",
+)
+INTEGER_METRICS = frozenset(
+    {
+        "blk_read_bytes",
+        "blk_write_bytes",
+        "blk_read_ops",
+        "blk_write_ops",
+        "net_rx_bytes",
+        "net_tx_bytes",
+    },
+)
+
 
 def run_test(db_test_conf: DbTestConf, log_fn: callable(str)) -> None:
     """
@@ -19,24 +65,31 @@ def run_test(db_test_conf: DbTestConf, log_fn: callable(str)) -> None:
     docker_manager = DockerManager(
         host_config=db_test_conf.docker_host,
         log_fn=log_fn,
+        stats_interval_ms=db_test_conf.test_system_config.stats_interval_ms,
     )
 
     db_image = db_test_conf.db_config.image_name
     config = db_test_conf.db_config.get_config_as_json()
 
-    docker_manager.pull_image(db_image)
+    image_digest = docker_manager.ensure_image(
+        db_image,
+        db_test_conf.test_system_config.pull_policy,
+    )
 
     # Получаем конфигурацию для данного образа (порт, тип БД и т. д.)
     # Формируем имя контейнера, переменные окружения, порты и т. д.
-    container_name = f"{_clear_container_name(db_image)}_test"
+    container_name = db_test_conf.container_name or f"{_clear_container_name(db_image)}_test"
     environment = config.get("env", {})
     exposed_port = config["port"]
-    ports = {exposed_port: exposed_port}
+    random_port = db_test_conf.test_system_config.random_host_port
+    ports = {exposed_port: None if random_port else exposed_port}
 
     # Определяем хост для подключения к БД
     db_host = docker_manager.get_host()
+    resources, load_cpus = _plan_resources(db_test_conf, config, local=db_host == "localhost")
 
     # 1) Запускаем контейнер
+    connected = False
     if db_test_conf.test_system_config.use_existing:
         log_fn(
             f"🛠 Пытаемся подключиться к существующему контейнеру '{container_name}'…",
@@ -46,31 +99,69 @@ def run_test(db_test_conf: DbTestConf, log_fn: callable(str)) -> None:
             log_fn(f"✅ Подключились к контейнеру '{container_name}'.")
         else:
             log_fn(f"❗ Контейнер '{container_name}' не запущен, запускаем новый.")
-            docker_manager.run_container(
-                image_name=db_image,
-                container_name=container_name,
-                ports=ports,
-                environment=environment,
-            )
-    else:
+    if not connected:
         log_fn(f"🚀 Запускаем контейнер '{container_name}' с образом '{db_image}'…")
+        if resources.cpuset_cpus:
+            log_fn(f"📌 Ядра СУБД: {resources.cpuset_cpus}")
         docker_manager.run_container(
             image_name=db_image,
             container_name=container_name,
             ports=ports,
             environment=environment,
+            resources=resources,
         )
+        # Ограничения сохраняются с результатами: без них замеры несравнимы
+        run_tags = {"container_resources": resources.model_dump(exclude_none=True)}
+        if load_cpus:
+            run_tags["load_cpus"] = format_cpuset(load_cpus)
+        db_test_conf = db_test_conf.model_copy(
+            update={"run_tags": {**db_test_conf.run_tags, **run_tags}},
+        )
+    if load_cpus:
+        log_fn(f"📌 Ядра генератора нагрузки: {format_cpuset(load_cpus)}")
+
+    # Порт хоста может отличаться от порта СУБД (случайный порт, чужой контейнер)
+    db_port = docker_manager.get_host_port(exposed_port) or exposed_port
 
     # 2) Определяем, какой адаптер использовать (SQLAdapter, RedisAdapter, ...)
     db_type = config["db_type"].lower()
 
-    adapter = _get_db_adapter(config, db_host, db_type, exposed_port)
+    adapter = _get_db_adapter(config, db_host, db_type, db_port)
+
+    # Ждём, пока СУБД начнёт отвечать на запросы, а не только откроет порт
+    readiness_time = wait_for_database(
+        adapter,
+        ReadinessConfig(**config.get("readiness", {})),
+        host=db_host,
+        port=db_port,
+        container=docker_manager.container,
+        log_fn=log_fn,
+    )
+
+    # Каждый результат относится к запуску; у матрицы он общий для всех ячеек
+    run_group_id = db_test_conf.run_group_id or uuid.uuid4().hex
+    result_manager.ensure_run(run_group_id)
 
-    # 3) Подключаемся к базе через адаптер
-    adapter.connect()
+    # Результаты пишутся в фоне пакетами и дописываются при выходе, в том числе
+    # при ошибке. Поток записи создаётся до привязки и не занимает ядра нагрузки;
+    # потоки и процессы нагрузки наследуют привязку к ядрам
+    with ResultWriter(result_manager) as result_writer, pinned_thread(load_cpus):
+        # 3) Подключаемся к базе через адаптер; пул – под самый нагруженный шаг
+        adapter.connect(max_connections=_max_concurrency(db_test_conf.scenario_steps))
 
-    # 4) Выполняем непосредственно тест (замеряем время, память)
-    _run_scenario_steps(adapter, docker_manager, db_test_conf, log_fn=log_fn)
+        # 4) Выполняем непосредственно тест (замеряем время, память)
+        _run_scenario_steps(
+            adapter,
+            docker_manager,
+            db_test_conf,
+            log_fn=log_fn,
+            result_writer=result_writer,
+            run_fields={
+                "run_group_id": run_group_id,
+                "readiness_time": readiness_time,
+                "image_digest": image_digest,
+            },
+        )
 
     # 5) Останавливаем контейнер
     test_system_config = db_test_conf.test_system_config
@@ -80,6 +171,40 @@ def run_test(db_test_conf: DbTestConf, log_fn: callable(str)) -> None:
     )
 
 
+def _plan_resources(
+    db_test_conf: DbTestConf,
+    config: dict[str, Any],
+    *,
+    local: bool,
+) -> tuple[ContainerResources, list[int] | None]:
+    """
+    Ограничения контейнера СУБД и ядра генератора нагрузки. Ядра СУБД берутся
+    из конфигурации образа, иначе – назначенные матрицей, иначе db_cpu_count
+    ядер выделяется автоматически. При локальном Docker генератор нагрузки
+    получает назначенные матрицей ядра, иначе – ядра, не занятые СУБД.
+    """
+    resources = ContainerResources(**config.get("resources", {}))
+    if resources.cpuset_cpus is None:
+        resources.cpuset_cpus = db_test_conf.cpuset_cpus
+    if not local:
+        return resources, None
+
+    if db_test_conf.load_cpuset_cpus:
+        return resources, parse_cpuset(db_test_conf.load_cpuset_cpus)
+
+    cpus = available_cpus()
+    db_cpu_count = db_test_conf.test_system_config.db_cpu_count
+    if resources.cpuset_cpus is None:
+        if not db_cpu_count:
+            return resources, None
+        db_cpus, load_cpus = split_cores(cpus, db_cpu_count)
+        resources.cpuset_cpus = format_cpuset(db_cpus)
+        return resources, load_cpus
+
+    db_cpus = set(parse_cpuset(resources.cpuset_cpus))
+    return resources, [cpu for cpu in cpus if cpu not in db_cpus] or None
+
+
 def _get_db_adapter(config, db_host, db_type, exposed_port) -> BaseAdapter:
     if db_type in ["postgresql", "mysql", "sqlite", "mssql"]:
         adapter = SQLAdapter(
@@ -110,58 +235,185 @@ def _run_scenario_steps(
     docker_manager: DockerManager,
     db_test_conf: DbTestConf,
     log_fn: callable(str),
+    result_writer: ResultWriter,
+    run_fields: dict[str, Any] | None = None,
 ) -> None:
+    """run_fields – общие для всех результатов запуска поля TestResults."""
 
     for step in db_test_conf.scenario_steps:
-        if step.measure:
-            docker_manager.get_container_stats(start=True)
-            time_start = time.perf_counter()
+        if not step.measure:
             _execute_step(adapter, step)
-            test_time = time.perf_counter() - time_start
-            stats_on_finish = docker_manager.get_container_stats(start=False)
-
-            timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-
-            result_manager.insert_result(
-                TestResults(
-                    timestamp=timestamp,
-                    db_image=db_test_conf.db_config.image_name,
-                    operation=step.step_type.value,
-                    num_records=getattr(step, "num_records", 0),
-                    step_description=str(step),
-                    execution_time=test_time,
-                    memory_used=stats_on_finish.max_mem_mb,
-                    cpu_percent=stats_on_finish.max_cpu_percent,
-                ),
-            )
-        else:
+            continue
+
+        runs = 0
+        for i in range(step.warmup_iterations):
+            log_fn(f"🔥 Прогрев {i + 1}/{step.warmup_iterations}: {step}")
+            _reset_before_run(adapter, step, runs)
             _execute_step(adapter, step)
+            runs += 1
+
+        iterations = []
+        repeat = max(1, step.repeat)
+        for i in range(repeat):
+            if repeat > 1:
+                log_fn(f"🔁 Повтор {i + 1}/{repeat}: {step}")
+            _reset_before_run(adapter, step, runs)
+            iterations.append(_measure_step(adapter, docker_manager, step))
+            runs += 1
+
+        result_writer.put(
+            TestResults(
+                timestamp=datetime.datetime.now(),
+                db_image=db_test_conf.db_config.image_name,
+                operation=step.step_type.value,
+                num_records=getattr(step, "num_records", 0),
+                step_description=str(step),
+                **(run_fields or {}),
+                **_aggregate_iterations(iterations, run_tags=db_test_conf.run_tags),
+            ),
+        )
 
 
-def _execute_step(adapter: BaseAdapter, step: ScenarioStep) -> None:
+def _reset_before_run(adapter: BaseAdapter, step: ScenarioStep, runs: int) -> None:
+    """Очищает таблицу шага вставки перед каждым прогоном, кроме первого."""
+    if runs and step.step_type == StepType.insert and step.reset_between_repeats:
+        adapter.truncate_table(step.table_name)
+
+
+def _measure_step(
+    adapter: BaseAdapter,
+    docker_manager: DockerManager,
+    step: ScenarioStep,
+) -> dict[str, Any]:
+    """Один замеренный прогон шага: значения полей TestResults."""
+    docker_manager.get_container_stats(start=True)
+    time_start = time.perf_counter()
+    step_params = _execute_step(adapter, step)
+    test_time = time.perf_counter() - time_start
+    stats_on_finish = docker_manager.get_container_stats(start=False)
+
+    step_params = step_params or {}
+    # Многопроцессный драйвер замеряет нагрузку без запуска процессов
+    test_time = step_params.get("elapsed", test_time)
+    latency = step_params.get("latency", {})
+    io = stats_on_finish.io_delta
+    if step.step_type == StepType.insert and step.num_records:
+        # Байт, записанных на диск, на вставленную строку – сравнимо между СУБД
+        step_params["blk_write_bytes_per_row"] = io["blk_write"] / step.num_records
+
+    return {
+        "execution_time": test_time,
+        "memory_used": stats_on_finish.max_mem_mb,
+        "cpu_percent": stats_on_finish.max_cpu_percent,
+        "latency_p50": latency.get("p50_ms"),
+        "latency_p95": latency.get("p95_ms"),
+        "latency_p99": latency.get("p99_ms"),
+        "throughput": step_params.get("rows_per_sec", step_params.get("qps")),
+        "error_count": latency.get("errors"),
+        "pool_wait_p95": step_params.get("pool_wait", {}).get("p95_ms"),
+        "blk_read_bytes": io["blk_read"],
+        "blk_write_bytes": io["blk_write"],
+        "blk_read_ops": io["blk_read_ops"],
+        "blk_write_ops": io["blk_write_ops"],
+        "net_rx_bytes": io["net_rx"],
+        "net_tx_bytes": io["net_tx"],
+        "step_params": step_params,
+        "resource_series": stats_on_finish.series,
+    }
+
+
+def _aggregate_iterations(
+    iterations: list[dict[str, Any]],
+    run_tags: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """
+    Объединяет повторы в одну запись: числовые метрики – среднее по повторам
+    (ошибки – сумма), сводка по каждой метрике (stddev, min, max, медиана,
+    95% ДИ) – в step_params["repeats"]. Параметры шага и временной ряд
+    ресурсов – от последнего повтора; метки запуска – в step_params["run_tags"],
+    прореживание ряда – в step_params["resource_series_stride"].
+    """
+    result = dict(iterations[-1])
+    step_params = dict(result.pop("step_params"))
+    series = result.pop("resource_series")
+
+    if len(iterations) > 1:
+        summary = {}
+        for name in REPEATED_METRICS:
+            values = [it[name] for it in iterations if it[name] is not None]
+            if not values:
+                continue
+            summary[name] = summarize(values)
+            mean = summary[name]["mean"]
+            result[name] = round(mean) if name in INTEGER_METRICS else mean
+        errors = [it["error_count"] for it in iterations if it["error_count"] is not None]
+        result["error_count"] = sum(errors) if errors else None
+
+        step_params["repeats"] = summary
+        execution_time = summary["execution_time"]
+        result["repeat_count"] = len(iterations)
+        result["execution_time_stddev"] = execution_time["stddev"]
+        result["execution_time_ci95"] = execution_time["ci95_high"] - execution_time["mean"]
+
+    if run_tags:
+        step_params["run_tags"] = run_tags
+    if series.stride > 1:
+        # Длинный шаг: точка временного ряда объединяет несколько отсчётов
+        step_params["resource_series_stride"] = series.stride
+    result["step_params"] = json.dumps(step_params) if step_params else None
+    result["resource_series"] = json.dumps(series.to_dict())
+    return result
+
+
+def _max_concurrency(steps: list[ScenarioStep]) -> int:
+    """
+    Размер пула адаптера раннера: наибольшее число одновременных операций среди
+    шагов, которые раннер выполняет в своих потоках. Процессы нагрузки и движок
+    asyncio открывают собственные соединения – под них пул раннера не растёт,
+    иначе сервер держал бы вдвое больше соединений, а простаивающий пул искажал
+    бы ожидание соединения.
+    """
+    concurrency = 1
+    for step in steps:
+        if getattr(step, "process_count", 1) > 1:
+            continue
+        if step.step_type == StepType.query:
+            if step.execution_mode == ExecutionMode.asyncio:
+                continue
+            concurrency = max(concurrency, step.thread_count)
+        elif step.step_type == StepType.insert:
+            concurrency = max(concurrency, step.parallel_writers)
+    return concurrency
+
+
+def _execute_step(adapter: BaseAdapter, step: ScenarioStep) -> dict[str, Any] | None:
+    """
+    Выполняет шаг и возвращает фактические параметры его выполнения
+    (для сохранения вместе с результатом), если они есть.
+    """
     if step.step_type == StepType.create:
         adapter.create_table(step)
 
     elif step.step_type == StepType.insert:
-        adapter.insert_data(step)
+        return _execute_insert(adapter, step)
 
     elif step.step_type == StepType.query:
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=step.thread_count,
-        ) as executor:
-            futures = [
-                executor.submit(adapter.execute_query, step)
-                for _ in range(step.request_count)
-            ]
-            for fut in concurrent.futures.as_completed(futures):
-                try:
-                    fut.result()
-                except Exception:
-                    raise
+        if step.process_count > 1:
+            return run_query_in_processes(adapter, step)
+        return run_query_step(adapter, step)
 
     else:
         msg = f"Неизвестный шаг: {type(step).__name__}"
         raise NotImplementedError(msg)
+    return None
+
+
+def _execute_insert(adapter: BaseAdapter, step: InsertDataStep) -> dict[str, Any]:
+    # Общий seed: диапазоны всех писателей дают непересекающиеся ключи
+    seed = secrets.randbits(63)
+    if step.process_count > 1:
+        return run_insert_in_processes(adapter, step, seed)
+    return run_insert_range(adapter, step, (0, step.num_records), seed)
 
 
 def _clear_container_name(name: str) -> str:
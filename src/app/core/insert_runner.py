@@ -0,0 +1,61 @@
+import concurrent.futures
+import time
+from typing import Any
+
+from src.app.core.scenario_steps import InsertDataStep
+from src.app.manager.db.base_adapter import BaseAdapter
+
+
+def run_insert_range(
+    adapter: BaseAdapter,
+    step: InsertDataStep,
+    row_range: tuple[int, int],
+    seed: int,
+) -> dict[str, Any]:
+    """
+    Делит row_range на parallel_writers непересекающихся диапазонов и пишет
+    их параллельно – каждый поток через своё соединение адаптера.
+    """
+    range_start, range_stop = row_range
+    rows = range_stop - range_start
+    writers = max(1, min(step.parallel_writers, rows))
+    bounds = [range_start + rows * i // writers for i in range(writers + 1)]
+
+    time_start = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=writers) as executor:
+        futures = [
+            executor.submit(
+                _insert_partition,
+                adapter,
+                step,
+                (bounds[i], bounds[i + 1]),
+                seed,
+            )
+            for i in range(writers)
+        ]
+        partitions = [fut.result() for fut in futures]
+    elapsed = time.perf_counter() - time_start
+
+    params, _ = partitions[0]
+    params["parallel_writers"] = writers
+    params["rows_per_sec"] = rows / elapsed if elapsed else 0.0
+    params["writers"] = [stats for _, stats in partitions]
+    return params
+
+
+def _insert_partition(
+    adapter: BaseAdapter,
+    step: InsertDataStep,
+    row_range: tuple[int, int],
+    seed: int,
+) -> tuple[dict[str, Any], dict[str, float]]:
+    time_start = time.perf_counter()
+    params = adapter.insert_data(step, row_range=row_range, seed=seed)
+    elapsed = time.perf_counter() - time_start
+
+    rows = row_range[1] - row_range[0]
+    return params, {
+        "rows": rows,
+        "seconds": elapsed,
+        "rows_per_sec": rows / elapsed if elapsed else 0.0,
+    }
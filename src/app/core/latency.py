@@ -0,0 +1,153 @@
+import threading
+import time
+from collections import Counter
+from typing import Any
+
+# 2^PRECISION_BITS линейных корзин на каждую двоичную декаду:
+# относительная погрешность значения не больше 2^-(PRECISION_BITS-1) (~0.1%).
+PRECISION_BITS = 11
+_SUB_BUCKETS = 1 << PRECISION_BITS
+_HALF_SUB_BUCKETS = _SUB_BUCKETS >> 1
+
+SUMMARY_PERCENTILES = (50.0, 90.0, 95.0, 99.0, 99.9)
+
+
+class LatencyHistogram:
+    """
+    Гистограмма задержек в духе HdrHistogram: значения в микросекундах
+    раскладываются по лог-линейным корзинам, поэтому память не зависит
+    от числа замеров, а перцентили считаются с фиксированной точностью.
+    """
+
+    def __init__(self) -> None:
+        self.counts: Counter[int] = Counter()
+        self.count = 0
+        self.errors = 0
+        self.total_us = 0
+        self.min_us: int | None = None
+        self.max_us = 0
+
+    def record(self, value_us: int) -> None:
+        value_us = max(0, int(value_us))
+        self.counts[_bucket_index(value_us)] += 1
+        self.count += 1
+        self.total_us += value_us
+        if self.min_us is None or value_us < self.min_us:
+            self.min_us = value_us
+        self.max_us = max(value_us, self.max_us)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        self.counts.update(other.counts)
+        self.count += other.count
+        self.errors += other.errors
+        self.total_us += other.total_us
+        if other.min_us is not None and (self.min_us is None or other.min_us < self.min_us):
+            self.min_us = other.min_us
+        self.max_us = max(other.max_us, self.max_us)
+
+    def percentile(self, q: float) -> int:
+        """Значение (мкс), не меньше которого q% замеров."""
+        if not self.count:
+            return 0
+        target = max(1, round(self.count * q / 100.0))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(_bucket_upper_value(index), self.max_us)
+        return self.max_us
+
+    @property
+    def mean_us(self) -> float:
+        return self.total_us / self.count if self.count else 0.0
+
+    def summary(self) -> dict[str, Any]:
+        """Сводка в миллисекундах для сохранения вместе с результатом."""
+        summary = {
+            "count": self.count,
+            "errors": self.errors,
+            "min_ms": (self.min_us or 0) / 1000,
+            "mean_ms": self.mean_us / 1000,
+            "max_ms": self.max_us / 1000,
+        }
+        for q in SUMMARY_PERCENTILES:
+            summary[f"p{q:g}_ms".replace(".", "")] = self.percentile(q) / 1000
+        return summary
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "counts": {str(k): v for k, v in self.counts.items()},
+            "count": self.count,
+            "errors": self.errors,
+            "total_us": self.total_us,
+            "min_us": self.min_us,
+            "max_us": self.max_us,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "LatencyHistogram":
+        histogram = cls()
+        histogram.counts = Counter({int(k): v for k, v in data["counts"].items()})
+        histogram.count = data["count"]
+        histogram.errors = data["errors"]
+        histogram.total_us = data["total_us"]
+        histogram.min_us = data["min_us"]
+        histogram.max_us = data["max_us"]
+        return histogram
+
+
+class LatencyRecorder:
+    """
+    Сбор замеров из многих потоков без блокировок: каждый поток пишет
+    в свою гистограмму, а merged() объединяет их после завершения нагрузки.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._histograms: list[LatencyHistogram] = []
+
+    def _histogram(self) -> LatencyHistogram:
+        histogram = getattr(self._local, "histogram", None)
+        if histogram is None:
+            histogram = LatencyHistogram()
+            self._local.histogram = histogram
+            self._histograms.append(histogram)
+        return histogram
+
+    def record(self, seconds: float) -> None:
+        self._histogram().record(seconds * 1_000_000)
+
+    def record_error(self) -> None:
+        self._histogram().errors += 1
+
+    def time(self, fn, *args, **kwargs) -> Any:
+        """Вызывает fn, записывая задержку либо ошибку."""
+        time_start = time.perf_counter()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception:
+            self.record_error()
+            raise
+        self.record(time.perf_counter() - time_start)
+        return result
+
+    def merged(self) -> LatencyHistogram:
+        result = LatencyHistogram()
+        for histogram in self._histograms:
+            result.merge(histogram)
+        return result
+
+
+def _bucket_index(value: int) -> int:
+    if value < _SUB_BUCKETS:
+        return value
+    exponent = value.bit_length() - PRECISION_BITS
+    return exponent * _HALF_SUB_BUCKETS + (value >> exponent)
+
+
+def _bucket_upper_value(index: int) -> int:
+    if index < _SUB_BUCKETS:
+        return index
+    exponent = (index >> (PRECISION_BITS - 1)) - 1
+    sub_bucket = index - exponent * _HALF_SUB_BUCKETS
+    return ((sub_bucket + 1) << exponent) - 1
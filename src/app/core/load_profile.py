@@ -0,0 +1,83 @@
+import math
+import random
+from collections.abc import Iterator
+from itertools import count
+
+from src.app.schemas.enums import RateProfile
+
+
+def arrival_times(
+    profile: RateProfile,
+    rate: float,
+    duration: float,
+    start_rate: float | None = None,
+    steps: int = 4,
+    seed: int | None = None,
+) -> Iterator[float]:
+    """
+    Плановые моменты отправки запросов (секунды от начала) для открытой модели нагрузки.
+
+    constant – ровно rate запросов в секунду;
+    poisson  – пуассоновский поток со средней интенсивностью rate;
+    ramp     – интенсивность линейно растёт от start_rate до rate за duration;
+    step     – интенсивность ступенями (steps штук) от start_rate до rate.
+    """
+    if rate <= 0 or duration <= 0:
+        msg = f"Интенсивность и длительность должны быть положительными: {rate}, {duration}"
+        raise ValueError(msg)
+    start_rate = rate if start_rate is None else max(start_rate, 0.0)
+
+    if profile == RateProfile.constant:
+        yield from _until(duration, (i / rate for i in count()))
+    elif profile == RateProfile.poisson:
+        rng = random.Random(seed)  # noqa: S311 – не криптография
+        yield from _until(duration, _accumulate(rng.expovariate(rate) for _ in count()))
+    elif profile == RateProfile.ramp:
+        yield from _until(duration, _ramp(start_rate, rate, duration))
+    elif profile == RateProfile.step:
+        yield from _until(duration, _steps(start_rate, rate, duration, max(1, steps)))
+    else:
+        msg = f"Неизвестный профиль нагрузки: {profile}"
+        raise ValueError(msg)
+
+
+def _ramp(start_rate: float, rate: float, duration: float) -> Iterator[float]:
+    # Число запросов к моменту t: N(t) = r0*t + k*t^2/2, k = (r1 - r0) / duration.
+    # i-й запрос отправляется в момент, когда N(t) = i.
+    slope = (rate - start_rate) / duration
+    for i in count():
+        if slope == 0:
+            yield i / start_rate
+            continue
+        discriminant = start_rate**2 + 2 * slope * i
+        if discriminant < 0:  # убывающая интенсивность исчерпана
+            return
+        yield (-start_rate + math.sqrt(discriminant)) / slope
+
+
+def _steps(start_rate: float, rate: float, duration: float, steps: int) -> Iterator[float]:
+    step_duration = duration / steps
+    for n in range(steps):
+        step_rate = start_rate + (rate - start_rate) * n / (steps - 1) if steps > 1 else rate
+        step_start = n * step_duration
+        if step_rate <= 0:
+            continue
+        for i in count():
+            offset = i / step_rate
+            if offset >= step_duration:
+                break
+            yield step_start + offset
+
+
+def _until(duration: float, times: Iterator[float]) -> Iterator[float]:
+    for t in times:
+        if t >= duration:
+            return
+        yield t
+
+
+def _accumulate(intervals: Iterator[float]) -> Iterator[float]:
+    total = 0.0
+    for interval in intervals:
+        yield total
+        total += interval
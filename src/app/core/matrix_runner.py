@@ -0,0 +1,257 @@
+import itertools
+import json
+import threading
+import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field
+from src.app.config.log import get_logger
+from src.app.core.docker_test import _clear_container_name, run_test
+from src.app.core.scenario_steps import ScenarioStep
+from src.app.manager.cpu_affinity import available_cpus, format_cpuset, split_cores
+from src.app.schemas.schema import DbTestConf, DockerHostConfig, TestSystemConfig
+from src.app.storage.model import DockerImage
+
+logger = get_logger(__name__)
+
+DEFAULT_VARIANT = "default"
+
+
+class MatrixConf(BaseModel):
+    """
+    Матрица запусков: один сценарий на всех сочетаниях образов, вариантов их
+    конфигурации и значений параметров шагов.
+    """
+
+    images: list[DockerImage]
+    scenario_steps: list[ScenarioStep]
+    # Имя варианта -> поля, которые накладываются на конфигурацию образа (env – по ключам)
+    config_variants: dict[str, dict[str, Any]] = Field(
+        default_factory=lambda: {DEFAULT_VARIANT: {}},
+    )
+    # Поле шага -> значения; применяются ко всем шагам, у которых такое поле есть
+    step_params: dict[str, list[Any]] = Field(default_factory=dict)
+    parallelism: int = Field(default=1, ge=1)
+    # Ядер на контейнер СУБД; None – без привязки к ядрам
+    cpus_per_run: int | None = Field(default=None, ge=1)
+    # Ядер генератору нагрузки на запуск; None – столько же, сколько СУБД.
+    # Берутся из того же распределителя, чтобы нагрузка одной ячейки не
+    # занимала ядра СУБД других ячеек
+    load_cpus_per_run: int | None = Field(default=None, ge=1)
+    # Ядра хоста для распределения; None – доступные текущему процессу (локальный Docker)
+    cpus: list[int] | None = None
+    test_system_config: TestSystemConfig = Field(default_factory=TestSystemConfig)
+    docker_host: DockerHostConfig | None = None
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+@dataclass
+class MatrixCell:
+    """Одна ячейка матрицы: образ с вариантом конфигурации и значения параметров."""
+
+    index: int
+    image: DockerImage
+    variant: str
+    params: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def label(self) -> str:
+        params = ", ".join(f"{key}={value}" for key, value in self.params.items())
+        label = f"{self.image.image_name} [{self.variant}]"
+        return f"{label} {params}" if params else label
+
+
+@dataclass
+class MatrixCellResult:
+    cell: MatrixCell
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class CpuSetAllocator:
+    """
+    Раздаёт запускам непересекающиеся наборы ядер: acquire блокируется,
+    пока свободных ядер меньше cpus_per_run.
+    """
+
+    def __init__(self, cpus: list[int], cpus_per_run: int) -> None:
+        if cpus_per_run > len(cpus):
+            msg = f"Запрошено {cpus_per_run} ядер на запуск, доступно {len(cpus)}."
+            raise ValueError(msg)
+        self.cpus_per_run = cpus_per_run
+        self._free = sorted(cpus)
+        self._condition = threading.Condition()
+
+    @property
+    def slots(self) -> int:
+        """Сколько запусков можно держать одновременно."""
+        return len(self._free) // self.cpus_per_run
+
+    def acquire(self) -> list[int]:
+        with self._condition:
+            self._condition.wait_for(lambda: len(self._free) >= self.cpus_per_run)
+            cpus = self._free[: self.cpus_per_run]
+            del self._free[: self.cpus_per_run]
+            return cpus
+
+    def release(self, cpus: list[int]) -> None:
+        with self._condition:
+            self._free = sorted(self._free + cpus)
+            self._condition.notify_all()
+
+
+def expand_matrix(matrix: MatrixConf) -> list[MatrixCell]:
+    """Декартово произведение образов, вариантов конфигурации и значений параметров."""
+    keys = list(matrix.step_params)
+    combinations = list(itertools.product(*(matrix.step_params[key] for key in keys)))
+    cells = []
+    for image, variant in itertools.product(matrix.images, matrix.config_variants):
+        for values in combinations:
+            cells.append(
+                MatrixCell(
+                    index=len(cells),
+                    image=image,
+                    variant=variant,
+                    params=dict(zip(keys, values, strict=True)),
+                ),
+            )
+    return cells
+
+
+def run_matrix(
+    matrix: MatrixConf,
+    log_fn: Callable[[str], None],
+    run_group_id: str | None = None,
+) -> list[MatrixCellResult]:
+    """
+    Запускает все ячейки матрицы не более чем по parallelism одновременно.
+    Ошибка одной ячейки не прерывает остальные; все результаты помечаются
+    общим run_group_id.
+    """
+    run_group_id = run_group_id or uuid.uuid4().hex
+    cells = expand_matrix(matrix)
+
+    allocator = None
+    parallelism = min(matrix.parallelism, len(cells)) or 1
+    if matrix.cpus_per_run:
+        cpus = matrix.cpus if matrix.cpus is not None else available_cpus()
+        load_cpus_per_run = matrix.load_cpus_per_run or matrix.cpus_per_run
+        allocator = CpuSetAllocator(cpus, matrix.cpus_per_run + load_cpus_per_run)
+        parallelism = max(1, min(parallelism, allocator.slots))
+
+    log_fn(
+        f"🧮 Матрица {run_group_id}: {len(cells)} запусков, одновременно до {parallelism}.",
+    )
+    with ThreadPoolExecutor(max_workers=parallelism) as executor:
+        futures = [
+            executor.submit(
+                _run_cell,
+                matrix,
+                cell,
+                run_group_id,
+                allocator,
+                parallel=parallelism > 1,
+                log_fn=log_fn,
+            )
+            for cell in cells
+        ]
+        results = [future.result() for future in futures]
+
+    failed = sum(not result.ok for result in results)
+    log_fn(f"🏁 Матрица {run_group_id}: успешно {len(results) - failed}, с ошибкой {failed}.")
+    return results
+
+
+def _run_cell(
+    matrix: MatrixConf,
+    cell: MatrixCell,
+    run_group_id: str,
+    allocator: CpuSetAllocator | None,
+    *,
+    parallel: bool,
+    log_fn: Callable[[str], None],
+) -> MatrixCellResult:
+    def cell_log(message: str) -> None:
+        log_fn(f"[{cell.index}] {message}")
+
+    cpus = allocator.acquire() if allocator else None
+    db_cpus, load_cpus = split_cores(cpus, matrix.cpus_per_run) if cpus else (None, None)
+    try:
+        cores = ""
+        if cpus:
+            cores = f", ядра СУБД {format_cpuset(db_cpus)}, нагрузки {format_cpuset(load_cpus)}"
+        cell_log(f"▶️ {cell.label}{cores}")
+        test_conf = _cell_test_conf(
+            matrix,
+            cell,
+            run_group_id,
+            db_cpus,
+            parallel=parallel,
+            load_cpus=load_cpus,
+        )
+        run_test(test_conf, cell_log)
+        cell_log(f"🟢 {cell.label}")
+        return MatrixCellResult(cell)
+    except Exception as e:
+        logger.exception(f"❗️ Ошибка в ячейке матрицы {cell.label}: {e}")
+        cell_log(f"❗️ {cell.label}: {e}")
+        return MatrixCellResult(cell, error=str(e))
+    finally:
+        if cpus:
+            allocator.release(cpus)
+
+
+def _cell_test_conf(
+    matrix: MatrixConf,
+    cell: MatrixCell,
+    run_group_id: str,
+    cpus: list[int] | None,
+    *,
+    parallel: bool,
+    load_cpus: list[int] | None = None,
+) -> DbTestConf:
+    test_system_config = matrix.test_system_config
+    if parallel:
+        # Контейнеры одной СУБД не должны делить порт хоста
+        test_system_config = test_system_config.model_copy(update={"random_host_port": True})
+
+    container_name = f"{_clear_container_name(cell.image.image_name)}_{run_group_id[:8]}"
+    return DbTestConf(
+        db_config=_image_variant(cell.image, cell.variant, matrix.config_variants[cell.variant]),
+        scenario_steps=[_apply_params(step, cell.params) for step in matrix.scenario_steps],
+        test_system_config=test_system_config,
+        docker_host=matrix.docker_host,
+        container_name=f"{container_name}_{cell.index}",
+        cpuset_cpus=format_cpuset(cpus) if cpus else None,
+        load_cpuset_cpus=format_cpuset(load_cpus) if load_cpus else None,
+        run_group_id=run_group_id,
+        run_tags={"config_variant": cell.variant, **cell.params},
+    )
+
+
+def _image_variant(image: DockerImage, variant: str, overrides: dict[str, Any]) -> DockerImage:
+    """Копия образа с конфигурацией, на которую наложен вариант."""
+    config = image.get_config_as_json() if image.config else {}
+    merged = {**config, **overrides}
+    if "env" in overrides:
+        merged["env"] = {**config.get("env", {}), **overrides["env"]}
+    return DockerImage(
+        image_name=image.image_name,
+        config_name=f"{image.config_name}:{variant}",
+        config=json.dumps(merged),
+    )
+
+
+def _apply_params(step: ScenarioStep, params: dict[str, Any]) -> ScenarioStep:
+    """Шаг с подставленными значениями параметров (с валидацией, как при загрузке)."""
+    update = {key: value for key, value in params.items() if key in type(step).model_fields}
+    if not update:
+        return step
+    return type(step).model_validate({**step.model_dump(), **update})
@@ -0,0 +1,170 @@
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any
+
+from src.app.config.log import get_logger
+from src.app.core.insert_runner import run_insert_range
+from src.app.core.query_runner import (
+    QueryRun,
+    query_result,
+    run_query_engine,
+)
+from src.app.core.scenario_steps import InsertDataStep, QueryStep
+from src.app.manager.db.base_adapter import BaseAdapter
+from src.app.schemas.enums import ExecutionMode
+
+logger = get_logger(__name__)
+
+# Сколько секунд ждать, пока все процессы подключатся к базе
+START_TIMEOUT = 300
+
+
+def run_query_in_processes(adapter: BaseAdapter, step: QueryStep) -> dict[str, Any]:
+    """
+    Делит потоки, запросы и интенсивность шага между процессами поровну,
+    объединяет гистограммы задержек и считает QPS по общему времени нагрузки.
+    """
+    processes = max(1, min(step.process_count, step.thread_count))
+    if not step.target_rate:
+        processes = min(processes, step.request_count)
+
+    shares = []
+    for i in range(processes):
+        update = {
+            "thread_count": _share(step.thread_count, processes, i),
+            "request_count": _share(step.request_count, processes, i),
+            "process_count": 1,
+        }
+        if step.target_rate:
+            update["target_rate"] = step.target_rate / processes
+            update["duration"] = step.duration or step.request_count / step.target_rate
+            if step.start_rate is not None:
+                update["start_rate"] = step.start_rate / processes
+        shares.append(step.model_copy(update=update))
+
+    # Сдвиг фаз, чтобы равномерные расписания процессов не совпадали по времени
+    phases = [i / step.target_rate if step.target_rate else 0.0 for i in range(processes)]
+
+    runs, elapsed = _run_in_processes(
+        processes,
+        _query_worker,
+        [(adapter, share, phase) for share, phase in zip(shares, phases, strict=True)],
+    )
+    run = runs[0]
+    for other in runs[1:]:
+        run.merge(other)
+    run.elapsed = elapsed
+
+    result = query_result(step, run)
+    result.update(process_count=processes, elapsed=elapsed)
+    return result
+
+
+def run_insert_in_processes(
+    adapter: BaseAdapter,
+    step: InsertDataStep,
+    seed: int,
+) -> dict[str, Any]:
+    """
+    Делит [0, num_records) на process_count непересекающихся диапазонов;
+    внутри процесса диапазон пишут parallel_writers потоков.
+    """
+    processes = max(1, min(step.process_count, step.num_records))
+    bounds = [step.num_records * i // processes for i in range(processes + 1)]
+
+    partitions, elapsed = _run_in_processes(
+        processes,
+        _insert_worker,
+        [(adapter, step, (bounds[i], bounds[i + 1]), seed) for i in range(processes)],
+    )
+
+    params = partitions[0]
+    params["process_count"] = processes
+    params["parallel_writers"] = sum(p["parallel_writers"] for p in partitions)
+    params["rows_per_sec"] = step.num_records / elapsed if elapsed else 0.0
+    params["writers"] = [stats for p in partitions for stats in p["writers"]]
+    params["elapsed"] = elapsed
+    return params
+
+
+def _run_in_processes(processes: int, worker, args: list[tuple]) -> tuple[list, float]:
+    """
+    Запускает worker в processes процессах (у каждого свой интерпретатор без
+    общего GIL и свои соединения) и возвращает результаты и время нагрузки.
+    Процессы сначала подключаются к базе и ждут общего старта на барьере,
+    поэтому запуск интерпретаторов и подключение не попадают в замер.
+    """
+    context = multiprocessing.get_context("spawn")
+    logger.info(f"Запуск нагрузки в {processes} процессах.")
+    with context.Manager() as manager, ProcessPoolExecutor(
+        max_workers=processes,
+        mp_context=context,
+    ) as executor:
+        barrier = manager.Barrier(processes + 1)
+        futures = [executor.submit(worker, barrier, *worker_args) for worker_args in args]
+        try:
+            barrier.wait(timeout=START_TIMEOUT)
+        except threading.BrokenBarrierError:
+            barrier.abort()
+            _raise_first_error(futures)
+            raise
+        time_start = time.perf_counter()
+        results = _raise_first_error(futures)
+        elapsed = time.perf_counter() - time_start
+    return results, elapsed
+
+
+def _raise_first_error(futures: list[Future]) -> list:
+    """Результаты всех процессов; ошибка барьера – следствие, а не причина сбоя."""
+    errors = [fut.exception() for fut in futures]
+    for error in errors:
+        if error is not None and not isinstance(error, threading.BrokenBarrierError):
+            raise error
+    for error in errors:
+        if error is not None:
+            raise error
+    return [fut.result() for fut in futures]
+
+
+def _start(adapter: BaseAdapter, barrier, max_connections: int | None) -> None:
+    """
+    Подключается к базе и ждёт общего старта. При max_connections=None процесс
+    только ждёт старта: соединения откроет сам движок нагрузки.
+    """
+    try:
+        if max_connections is not None:
+            adapter.connect(max_connections=max_connections)
+    except Exception:
+        barrier.abort()
+        raise
+    barrier.wait(timeout=START_TIMEOUT)
+
+
+def _query_worker(barrier, adapter: BaseAdapter, step: QueryStep, phase: float) -> QueryRun:
+    # Движок asyncio открывает свой асинхронный пул – синхронный был бы лишним
+    asyncio_engine = step.execution_mode == ExecutionMode.asyncio
+    _start(adapter, barrier, None if asyncio_engine else step.thread_count)
+    if phase:
+        time.sleep(phase)
+    run = run_query_engine(adapter, step)
+    if run.last_error is not None:
+        # Исключения драйверов не всегда переживают pickle
+        run.last_error = RuntimeError(f"{type(run.last_error).__name__}: {run.last_error}")
+    return run
+
+
+def _insert_worker(
+    barrier,
+    adapter: BaseAdapter,
+    step: InsertDataStep,
+    row_range: tuple[int, int],
+    seed: int,
+) -> dict[str, Any]:
+    _start(adapter, barrier, step.parallel_writers)
+    return run_insert_range(adapter, step, row_range, seed)
+
+
+def _share(total: int, parts: int, index: int) -> int:
+    return total * (index + 1) // parts - total * index // parts
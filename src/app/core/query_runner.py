@@ -0,0 +1,284 @@
+import asyncio
+import concurrent.futures
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.app.config.log import get_logger
+from src.app.core.latency import LatencyHistogram, LatencyRecorder
+from src.app.core.load_profile import arrival_times
+from src.app.core.scenario_steps import QueryStep
+from src.app.manager.db.base_adapter import AsyncBaseAdapter, BaseAdapter
+from src.app.schemas.enums import ExecutionMode
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class QueryRun:
+    """Сырые результаты нагрузки запросами; объединяются между процессами."""
+
+    histogram: LatencyHistogram
+    elapsed: float
+    last_error: Exception | None = None
+    service_histogram: LatencyHistogram | None = None
+    # Ожидание соединения: очередь пула или новое подключение
+    pool_wait_histogram: LatencyHistogram | None = None
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    def merge(self, other: "QueryRun") -> None:
+        self.histogram.merge(other.histogram)
+        self.elapsed = max(self.elapsed, other.elapsed)
+        self.last_error = other.last_error or self.last_error
+        for attr in ("service_histogram", "pool_wait_histogram"):
+            histogram = getattr(other, attr)
+            if histogram is None:
+                continue
+            if getattr(self, attr) is None:
+                setattr(self, attr, LatencyHistogram())
+            getattr(self, attr).merge(histogram)
+        for key, value in other.extra.items():
+            self.extra[key] = max(self.extra.get(key, value), value)
+
+
+def run_query_step(adapter: BaseAdapter, step: QueryStep) -> dict[str, Any]:
+    """
+    Выполняет QueryStep выбранным движком нагрузки и возвращает метрики шага.
+    Ошибки запросов считаются, а не прерывают шаг, пока хотя бы один
+    запрос выполнился успешно.
+    """
+    return query_result(step, run_query_engine(adapter, step))
+
+
+def run_query_engine(adapter: BaseAdapter, step: QueryStep) -> QueryRun:
+    if step.execution_mode == ExecutionMode.asyncio:
+        return asyncio.run(_run_async(adapter, step))
+
+    pool_wait = adapter.track_pool_wait()
+    try:
+        if step.target_rate:
+            run = _run_open_loop(adapter, step)
+        else:
+            run = _run_closed_loop(adapter, step)
+    finally:
+        adapter.release_connections()
+    if pool_wait is not None:
+        run.pool_wait_histogram = pool_wait.merged()
+    return run
+
+
+def _run_closed_loop(adapter: BaseAdapter, step: QueryStep) -> QueryRun:
+    """request_count запросов в thread_count потоках, каждый замеряется отдельно."""
+    recorder = LatencyRecorder()
+    last_error = None
+
+    time_start = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=step.thread_count,
+    ) as executor:
+        futures = [
+            executor.submit(recorder.time, adapter.execute_query, step)
+            for _ in range(step.request_count)
+        ]
+        for fut in concurrent.futures.as_completed(futures):
+            try:
+                fut.result()
+            except Exception as e:
+                last_error = e
+    elapsed = time.perf_counter() - time_start
+
+    return QueryRun(recorder.merged(), elapsed, last_error)
+
+
+def _run_open_loop(adapter: BaseAdapter, step: QueryStep) -> QueryRun:
+    """
+    Открытая модель: запросы отправляются по расписанию профиля нагрузки
+    независимо от того, успевает ли база. Задержка отсчитывается от планового
+    момента отправки (без coordinated omission), время обслуживания – от
+    фактического начала выполнения.
+    """
+    duration = _open_loop_duration(step)
+    recorder = LatencyRecorder()
+    service_recorder = LatencyRecorder()
+    futures = []
+    max_dispatch_lag = 0.0
+
+    def timed_query(scheduled_at: float) -> None:
+        started = time.perf_counter()
+        try:
+            adapter.execute_query(step)
+        except Exception:
+            recorder.record_error()
+            raise
+        finished = time.perf_counter()
+        recorder.record(finished - scheduled_at)
+        service_recorder.record(finished - started)
+
+    time_start = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=step.thread_count,
+    ) as executor:
+        for offset in _schedule(step, duration):
+            scheduled_at = time_start + offset
+            delay = scheduled_at - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                max_dispatch_lag = max(max_dispatch_lag, -delay)
+            futures.append(executor.submit(timed_query, scheduled_at))
+
+    last_error = None
+    for fut in futures:
+        if fut.exception() is not None:
+            last_error = fut.exception()
+    elapsed = time.perf_counter() - time_start
+
+    return QueryRun(
+        recorder.merged(),
+        elapsed,
+        last_error,
+        service_histogram=service_recorder.merged(),
+        extra={"duration": duration, "max_dispatch_lag_ms": max_dispatch_lag * 1000},
+    )
+
+
+async def _run_async(adapter: BaseAdapter, step: QueryStep) -> QueryRun:
+    """
+    Асинхронный движок: до thread_count запросов одновременно в одном потоке
+    через асинхронный двойник адаптера. Поддерживает обе модели нагрузки.
+    """
+    async_adapter = adapter.async_adapter()
+    await async_adapter.connect(
+        max_connections=step.thread_count,
+        connection_mode=step.connection_mode,
+    )
+    pool_wait = async_adapter.track_pool_wait()
+    try:
+        if step.target_rate:
+            run = await _run_async_open_loop(async_adapter, step)
+        else:
+            run = await _run_async_closed_loop(async_adapter, step)
+    finally:
+        await async_adapter.close()
+    if pool_wait is not None:
+        run.pool_wait_histogram = pool_wait.merged()
+    return run
+
+
+async def _run_async_closed_loop(
+    async_adapter: AsyncBaseAdapter,
+    step: QueryStep,
+) -> QueryRun:
+    histogram = LatencyHistogram()
+    remaining = step.request_count
+    last_error = None
+
+    async def worker() -> None:
+        nonlocal remaining, last_error
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            try:
+                await async_adapter.execute_query(step)
+            except Exception as e:
+                histogram.errors += 1
+                last_error = e
+                continue
+            histogram.record((time.perf_counter() - started) * 1_000_000)
+
+    time_start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(step.thread_count)))
+    elapsed = time.perf_counter() - time_start
+
+    return QueryRun(histogram, elapsed, last_error)
+
+
+async def _run_async_open_loop(
+    async_adapter: AsyncBaseAdapter,
+    step: QueryStep,
+) -> QueryRun:
+    duration = _open_loop_duration(step)
+    histogram = LatencyHistogram()
+    service_histogram = LatencyHistogram()
+    in_flight = asyncio.Semaphore(step.thread_count)
+    tasks = []
+    last_error = None
+    max_dispatch_lag = 0.0
+
+    async def timed_query(scheduled_at: float) -> None:
+        nonlocal last_error
+        async with in_flight:
+            started = time.perf_counter()
+            try:
+                await async_adapter.execute_query(step)
+            except Exception as e:
+                histogram.errors += 1
+                last_error = e
+                return
+        finished = time.perf_counter()
+        histogram.record((finished - scheduled_at) * 1_000_000)
+        service_histogram.record((finished - started) * 1_000_000)
+
+    time_start = time.perf_counter()
+    for offset in _schedule(step, duration):
+        scheduled_at = time_start + offset
+        delay = scheduled_at - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        else:
+            max_dispatch_lag = max(max_dispatch_lag, -delay)
+        tasks.append(asyncio.create_task(timed_query(scheduled_at)))
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - time_start
+
+    return QueryRun(
+        histogram,
+        elapsed,
+        last_error,
+        service_histogram=service_histogram,
+        extra={"duration": duration, "max_dispatch_lag_ms": max_dispatch_lag * 1000},
+    )
+
+
+def _open_loop_duration(step: QueryStep) -> float:
+    return step.duration or step.request_count / step.target_rate
+
+
+def _schedule(step: QueryStep, duration: float):
+    return arrival_times(
+        step.rate_profile,
+        step.target_rate,
+        duration,
+        start_rate=step.start_rate,
+        steps=step.rate_steps,
+    )
+
+
+def query_result(step: QueryStep, run: QueryRun) -> dict[str, Any]:
+    """Метрики шага для сохранения вместе с результатом."""
+    histogram = run.histogram
+    request_count = histogram.count + histogram.errors
+    if histogram.errors:
+        logger.warning(
+            f"Запрос завершился ошибкой {histogram.errors} раз(а) "
+            f"из {request_count}: {run.last_error}",
+        )
+    if not histogram.count and run.last_error is not None:
+        raise run.last_error
+
+    result = {
+        "execution_mode": str(step.execution_mode),
+        "connection_mode": str(step.connection_mode),
+        "thread_count": step.thread_count,
+        "request_count": request_count,
+        "qps": histogram.count / run.elapsed if run.elapsed else 0.0,
+        "latency": histogram.summary(),
+    }
+    if step.target_rate:
+        result.update(target_rate=step.target_rate, rate_profile=str(step.rate_profile))
+    result.update(run.extra)
+    if run.service_histogram is not None:
+        result["service_latency"] = run.service_histogram.summary()
+    if run.pool_wait_histogram is not None:
+        result["pool_wait"] = run.pool_wait_histogram.summary()
+    return result
@@ -0,0 +1,59 @@
+import math
+import statistics
+
+# Квантили t-распределения Стьюдента t(0.975; df) для двустороннего 95% интервала
+_T_975 = {
+    1: 12.706,
+    2: 4.303,
+    3: 3.182,
+    4: 2.776,
+    5: 2.571,
+    6: 2.447,
+    7: 2.365,
+    8: 2.306,
+    9: 2.262,
+    10: 2.228,
+    12: 2.179,
+    15: 2.131,
+    20: 2.086,
+    25: 2.060,
+    30: 2.042,
+    40: 2.021,
+    60: 2.000,
+    120: 1.980,
+}
+_Z_975 = 1.960
+
+
+def t_quantile_975(df: int) -> float:
+    """t(0.975; df); для df между узлами таблицы – ближайший меньший df (интервал шире)."""
+    if df < 1:
+        msg = f"Число степеней свободы должно быть положительным: {df}"
+        raise ValueError(msg)
+    if df > max(_T_975):
+        return _Z_975
+    return _T_975[max(k for k in _T_975 if k <= df)]
+
+
+def summarize(values: list[float]) -> dict[str, float]:
+    """
+    Сводка по повторам: среднее, стандартное отклонение, min, max, медиана
+    и 95% доверительный интервал среднего (по t-распределению).
+    """
+    if not values:
+        msg = "Нет значений для сводки."
+        raise ValueError(msg)
+    n = len(values)
+    mean = statistics.fmean(values)
+    stddev = statistics.stdev(values) if n > 1 else 0.0
+    half_width = t_quantile_975(n - 1) * stddev / math.sqrt(n) if n > 1 else 0.0
+    return {
+        "n": n,
+        "mean": mean,
+        "stddev": stddev,
+        "min": min(values),
+        "max": max(values),
+        "median": statistics.median(values),
+        "ci95_low": mean - half_width,
+        "ci95_high": mean + half_width,
+    }
@@ -0,0 +1,140 @@
+from typing import Any
+
+import numpy as np
+
+# Поля отсчёта; счётчики блочного (байты, операции) и сетевого ввода-вывода накопительные
+SERIES_FIELDS = (
+    "timestamp",  # секунды (epoch)
+    "cpu_percent",
+    "rss",  # байт
+    "cache",  # байт
+    "blk_read",
+    "blk_write",
+    "blk_read_ops",
+    "blk_write_ops",
+    "net_rx",
+    "net_tx",
+    "pids",
+)
+IO_COUNTER_FIELDS = (
+    "blk_read",
+    "blk_write",
+    "blk_read_ops",
+    "blk_write_ops",
+    "net_rx",
+    "net_tx",
+)
+COUNTER_FIELDS = frozenset({"timestamp", *IO_COUNTER_FIELDS})
+
+# Точек ряда; при 1 отсчёте в секунду – около часа без прореживания
+DEFAULT_CAPACITY = 3600
+
+_COUNTER_MASK = np.array([name in COUNTER_FIELDS for name in SERIES_FIELDS])
+
+
+class ResourceSeries:
+    """
+    Временной ряд потребления ресурсов контейнером на массиве numpy
+    фиксированной ёмкости. Когда ёмкость исчерпана, ряд прореживается вдвое
+    (соседние точки объединяются) и дальше каждая точка собирается из вдвое
+    большего числа отсчётов – ряд всегда покрывает шаг целиком, с разрешением,
+    зависящим от его длины. stride – сколько отсчётов приходится на точку.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        self.capacity = max(2, capacity)
+        self.stride = 1
+        self._data = np.zeros((self.capacity, len(SERIES_FIELDS)), dtype=np.float64)
+        self._length = 0
+        # Точка, которая ещё набирает stride отсчётов
+        self._pending = np.zeros(len(SERIES_FIELDS), dtype=np.float64)
+        self._pending_count = 0
+
+    def __len__(self) -> int:
+        return self._length + (1 if self._pending_count else 0)
+
+    def append(self, **values: float) -> None:
+        """Добавляет отсчёт; отсутствующие поля записываются нулями."""
+        row = np.array([values.get(name, 0.0) for name in SERIES_FIELDS], dtype=np.float64)
+        if self._pending_count:
+            row = _merge(self._pending, row)
+        self._pending = row
+        self._pending_count += 1
+        if self._pending_count < self.stride:
+            return
+
+        self._data[self._length] = self._pending
+        self._length += 1
+        self._pending_count = 0
+        if self._length == self.capacity:
+            self._halve()
+
+    def _halve(self) -> None:
+        """Объединяет соседние точки попарно и удваивает stride."""
+        pairs = self._length // 2
+        merged = _merge(self._data[0 : 2 * pairs : 2], self._data[1 : 2 * pairs : 2])
+        self._data[:pairs] = merged
+        if self._length % 2:
+            # Непарная последняя точка становится незавершённой точкой нового шага
+            self._pending = self._data[self._length - 1].copy()
+            self._pending_count = self.stride
+        self._length = pairs
+        self.stride *= 2
+
+    def to_array(self) -> np.ndarray:
+        """Точки в хронологическом порядке, по строке на точку."""
+        data = self._data[: self._length]
+        if self._pending_count:
+            data = np.vstack((data, self._pending))
+        return data.copy()
+
+    def column(self, name: str) -> np.ndarray:
+        return self.to_array()[:, SERIES_FIELDS.index(name)]
+
+    def downsample(self, max_points: int) -> dict[str, np.ndarray]:
+        """
+        Сокращает ряд до max_points точек для графика: в каждой группе подряд
+        идущих отсчётов мгновенные значения берутся по максимуму (пики не
+        теряются), накопительные счётчики и время – по последнему отсчёту.
+        """
+        data = self.to_array()
+        if len(data) <= max_points:
+            return {name: data[:, i] for i, name in enumerate(SERIES_FIELDS)}
+
+        group = -(-len(data) // max_points)
+        starts = np.arange(0, len(data), group)
+        lasts = np.minimum(starts + group, len(data)) - 1
+        result = {}
+        for i, name in enumerate(SERIES_FIELDS):
+            if name in COUNTER_FIELDS:
+                result[name] = data[lasts, i]
+            else:
+                result[name] = np.maximum.reduceat(data[:, i], starts)
+        return result
+
+    def to_dict(self) -> dict[str, Any]:
+        """Поколоночное представление для сохранения в JSON."""
+        data = self.to_array()
+        result = {name: data[:, i].tolist() for i, name in enumerate(SERIES_FIELDS)}
+        result["stride"] = self.stride
+        return result
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ResourceSeries":
+        length = len(data.get("timestamp", []))
+        # Ёмкость с запасом: восстановленный ряд не прореживается сразу
+        series = cls(capacity=length + 1)
+        for i, name in enumerate(SERIES_FIELDS):
+            if name in data:
+                series._data[:length, i] = data[name]
+        series._length = length
+        series.stride = data.get("stride", 1)
+        return series
+
+
+def _merge(earlier: np.ndarray, later: np.ndarray) -> np.ndarray:
+    """
+    Объединение отсчётов в одну точку: мгновенные значения – максимум (пики
+    не теряются), накопительные счётчики и время – последнее значение.
+    """
+    return np.where(_COUNTER_MASK, later, np.maximum(earlier, later))
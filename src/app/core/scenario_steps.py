@@ -2,7 +2,14 @@ import enum
 from dataclasses import dataclass
 
 from pydantic import BaseModel, ConfigDict
-from src.app.schemas.enums import DataType
+from src.app.schemas.enums import (
+    ConnectionMode,
+    DataType,
+    ExecutionMode,
+    InsertMethod,
+    KeyOrder,
+    RateProfile,
+)
 
 
 class StepType(enum.Enum):
@@ -16,6 +23,9 @@ class ScenarioStep(BaseModel):
 
     step_type: StepType
     measure: bool = False
+    # Для измеряемых шагов: прогоны без замера, затем repeat замеров со сводкой
+    warmup_iterations: int = 0
+    repeat: int = 1
 
     def __str__(self) -> str:
         return f"{self.step_type.value}"
@@ -25,6 +35,19 @@ class ScenarioStep(BaseModel):
 class ColumnDefinition:
     data_type: DataType
     primary_key: bool = False
+    # Параметры генерации строк (DataType.str)
+    str_length: int = 10  # максимальная длина строки
+    str_min_length: int | None = None  # если задано – длина равномерна в [min, max]
+    alphabet: str = "letters"  # имя из STR_ALPHABETS или набор ASCII-символов
+    # Порядок уникальных ключей (primary_key)
+    key_order: KeyOrder = KeyOrder.random
+    cluster_size: int = 1000  # длина последовательной серии для KeyOrder.clustered
+
+    def __post_init__(self) -> None:
+        # numpy хранит строки с дополнением нулями: "\0" из алфавита молча пропал бы
+        if not self.alphabet or "\0" in self.alphabet:
+            msg = f"Алфавит должен быть непустым и без символа NUL: {self.alphabet!r}"
+            raise ValueError(msg)
 
 
 class CreateTableStep(ScenarioStep):
@@ -46,44 +69,94 @@ class InsertDataStep(ScenarioStep):
     table_name: str
     num_records: int
     columns: dict[str, ColumnDefinition]
+    insert_method: InsertMethod = InsertMethod.app
+    # Строк в одном операторе / pipeline; None – значение адаптера по умолчанию
+    batch_size: int | None = None
+    # Строк между фиксациями транзакции; None – фиксируется каждая пачка
+    rows_per_transaction: int | None = None
+    # Число потоков-писателей, каждый пишет свой диапазон ключей своим соединением
+    parallel_writers: int = 1
+    # Число процессов нагрузки; у каждого свои parallel_writers потоков
+    process_count: int = 1
+    # Очищать таблицу перед каждым повтором и прогревом, кроме самого первого
+    # прогона (иначе повторная вставка тех же ключей нарушит primary key)
+    reset_between_repeats: bool = False
 
     def __str__(self) -> str:
-        return f"Имя таблицы={self.table_name}, Число записей={self.num_records}"
+        return (
+            f"Имя таблицы={self.table_name}, Число записей={self.num_records}, "
+            f"Метод={self.insert_method}"
+        )
 
 
 class QueryStep(ScenarioStep):
     step_type: StepType = StepType.query
 
     query: str
-    thread_count: int
+    thread_count: int  # потоков; для asyncio – одновременных запросов
     request_count: int
+    execution_mode: ExecutionMode = ExecutionMode.threads
+    connection_mode: ConnectionMode = ConnectionMode.pooled
+    # Открытая модель нагрузки: если задана target_rate (запросов/с), запросы
+    # отправляются по расписанию в течение duration секунд, а не request_count штук
+    target_rate: float | None = None
+    rate_profile: RateProfile = RateProfile.constant
+    start_rate: float | None = None  # начальная интенсивность для ramp/step
+    rate_steps: int = 4  # число ступеней для step
+    duration: float | None = None  # None – request_count / target_rate
+    # Число процессов нагрузки; нагрузка шага делится между ними поровну
+    process_count: int = 1
 
     def __str__(self) -> str:
+        if self.target_rate:
+            return f"Запрос: {self.query} ({self.rate_profile} {self.target_rate:g} rps)"
         return f"Запрос: {self.query}"
 
 
 def deserialize_step(data: dict):
     step_type = data.get("step_type")
     measure = data.get("measure", False)
+    warmup_iterations = data.get("warmup_iterations", 0)
+    repeat = data.get("repeat", 1)
     if step_type == StepType.create.value:
         return CreateTableStep(
             table_name=data["table_name"],
             columns=data["columns"],
             measure=measure,
+            warmup_iterations=warmup_iterations,
+            repeat=repeat,
         )
     if step_type == StepType.insert.value:
         return InsertDataStep(
             table_name=data["table_name"],
             num_records=data["num_records"],
             columns=data["columns"],
+            insert_method=data.get("insert_method", InsertMethod.app),
+            batch_size=data.get("batch_size"),
+            rows_per_transaction=data.get("rows_per_transaction"),
+            parallel_writers=data.get("parallel_writers", 1),
+            process_count=data.get("process_count", 1),
+            reset_between_repeats=data.get("reset_between_repeats", False),
             measure=measure,
+            warmup_iterations=warmup_iterations,
+            repeat=repeat,
         )
     if step_type == StepType.query.value:
         return QueryStep(
             query=data["query"],
             thread_count=data.get("thread_count", 1),
             request_count=data.get("request_count", 1),
+            execution_mode=data.get("execution_mode", ExecutionMode.threads),
+            connection_mode=data.get("connection_mode", ConnectionMode.pooled),
+            target_rate=data.get("target_rate"),
+            rate_profile=data.get("rate_profile", RateProfile.constant),
+            start_rate=data.get("start_rate"),
+            rate_steps=data.get("rate_steps", 4),
+            duration=data.get("duration"),
+            process_count=data.get("process_count", 1),
             measure=measure,
+            warmup_iterations=warmup_iterations,
+            repeat=repeat,
         )
     msg = f"Неизвестный тип шага: {step_type}"
     raise ValueError(msg)
@@ -1,5 +1,6 @@
 import json
 
+from pydantic import ValidationError
 from PyQt6.QtWidgets import (
     QDialog,
     QFormLayout,
@@ -11,6 +12,7 @@ from PyQt6.QtWidgets import (
     QTextEdit,
     QVBoxLayout,
 )
+from src.app.schemas.schema import ContainerResources
 
 
 class ConfigEditorDialog(QDialog):
@@ -32,6 +34,7 @@ class ConfigEditorDialog(QDialog):
         self.port_edit = QLineEdit(self)
         self.db_edit = QLineEdit(self)
         self.env_edit = QTextEdit(self)
+        self.resources_edit = QTextEdit(self)
 
         self.label_db_type = QLabel(self)
         self.label_driver = QLabel(self)
@@ -40,6 +43,7 @@ class ConfigEditorDialog(QDialog):
         self.label_port = QLabel(self)
         self.label_db = QLabel(self)
         self.label_env = QLabel(self)
+        self.label_resources = QLabel(self)
 
         self.save_btn = QPushButton(self)
         self.cancel_btn = QPushButton(self)
@@ -65,6 +69,13 @@ class ConfigEditorDialog(QDialog):
         env_json_str = json.dumps(env_dict, indent=2, ensure_ascii=False)
         self.env_edit.setPlainText(env_json_str)
 
+        # Ограничения ресурсов контейнера (ContainerResources)
+        resources_dict = self.original_config.get("resources", {})
+        self.resources_edit.setPlainText(json.dumps(resources_dict, indent=2, ensure_ascii=False))
+        self.resources_edit.setPlaceholderText(
+            '{"cpuset_cpus": "2-5", "mem_limit": "4g", "memswap_limit": "4g", "shm_size": "1g"}',
+        )
+
         form_layout.addRow(self.label_db_type, self.db_type_edit)
         form_layout.addRow(self.label_driver, self.driver)
         form_layout.addRow(self.label_user, self.user_edit)
@@ -72,6 +83,7 @@ class ConfigEditorDialog(QDialog):
         form_layout.addRow(self.label_port, self.port_edit)
         form_layout.addRow(self.label_db, self.db_edit)
         form_layout.addRow(self.label_env, self.env_edit)
+        form_layout.addRow(self.label_resources, self.resources_edit)
         layout.addLayout(form_layout)
 
         layout.addLayout(form_layout)
@@ -102,6 +114,7 @@ class ConfigEditorDialog(QDialog):
         self.label_port.setText(self.tr("port:"))
         self.label_db.setText(self.tr("db:"))
         self.label_env.setText(self.tr("env (JSON):"))
+        self.label_resources.setText(self.tr("resources (JSON):"))
 
         # Кнопки
         self.save_btn.setText(self.tr("Сохранить"))
@@ -119,6 +132,7 @@ class ConfigEditorDialog(QDialog):
         port_val_str = self.port_edit.text().strip()
         dbname_val = self.db_edit.text().strip()
         env_json_str = self.env_edit.toPlainText()
+        resources_json_str = self.resources_edit.toPlainText().strip()
 
         # Проверяем и конвертируем порт
         try:
@@ -137,8 +151,16 @@ class ConfigEditorDialog(QDialog):
             QMessageBox.warning(self, "Ошибка", f"Ошибка в JSON env: {e}")
             return
 
+        try:
+            resources = ContainerResources.model_validate_json(resources_json_str or "{}")
+        except ValidationError as e:
+            QMessageBox.warning(self, "Ошибка", f"Ошибка в resources: {e}")
+            return
+
         # Собираем словарь
+        # Остальные ключи (например, readiness) сохраняются как были
         self.edited_config = {
+            **self.original_config,
             "db_type": db_type_val,
             "driver": driver,
             "user": user_val,
@@ -147,6 +169,11 @@ class ConfigEditorDialog(QDialog):
             "db": dbname_val,
             "env": env_dict,
         }
+        resources_dict = resources.model_dump(exclude_none=True)
+        if resources_dict:
+            self.edited_config["resources"] = resources_dict
+        else:
+            self.edited_config.pop("resources", None)
 
         self.accept()  # Закрываем диалог с результатом Accepted
 
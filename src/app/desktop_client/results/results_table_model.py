@@ -0,0 +1,209 @@
+from typing import Any
+
+from PyQt6.QtCore import QT_TRANSLATE_NOOP, QAbstractTableModel, QModelIndex, Qt
+from src.app.storage.db_manager.result_storage import PAGE_SIZE, result_manager
+from src.app.storage.model import TestResults
+
+MB = 1024 * 1024
+
+# Заголовок столбца и поле TestResults, по которому он сортируется в SQL.
+# Заголовки переводятся в контексте вкладки TestResultsApp.
+COLUMNS = (
+    (QT_TRANSLATE_NOOP("TestResultsApp", "Timestamp"), "timestamp"),
+    (QT_TRANSLATE_NOOP("TestResultsApp", "DB Image"), "db_image"),
+    (QT_TRANSLATE_NOOP("TestResultsApp", "Operation"), "operation"),
+    (QT_TRANSLATE_NOOP("TestResultsApp", "Num Records"), "num_records"),
+    (QT_TRANSLATE_NOOP("TestResultsApp", "Test info"), "step_description"),
+    (QT_TRANSLATE_NOOP("TestResultsApp", "Exec Time"), "execution_time"),
+    (QT_TRANSLATE_NOOP("TestResultsApp", "Memory"), "memory_used"),
+    (QT_TRANSLATE_NOOP("TestResultsApp", "CPU %"), "cpu_percent"),
+    (QT_TRANSLATE_NOOP("TestResultsApp", "p50, ms"), "latency_p50"),
+    (QT_TRANSLATE_NOOP("TestResultsApp", "p95, ms"), "latency_p95"),
+    (QT_TRANSLATE_NOOP("TestResultsApp", "p99, ms"), "latency_p99"),
+    (QT_TRANSLATE_NOOP("TestResultsApp", "Throughput, ops/s"), "throughput"),
+    (QT_TRANSLATE_NOOP("TestResultsApp", "Errors"), "error_count"),
+    (QT_TRANSLATE_NOOP("TestResultsApp", "Pool wait p95, ms"), "pool_wait_p95"),
+    (QT_TRANSLATE_NOOP("TestResultsApp", "Disk R/W, MB"), "blk_read_bytes"),
+    (QT_TRANSLATE_NOOP("TestResultsApp", "Disk IOPS R/W"), "blk_read_ops"),
+    (QT_TRANSLATE_NOOP("TestResultsApp", "Net rx/tx, MB"), "net_rx_bytes"),
+)
+
+
+class ResultsTableModel(QAbstractTableModel):
+    """
+    Результаты тестирования для QTableView. Строки подгружаются страницами
+    по мере прокрутки (canFetchMore/fetchMore), сортировка и фильтры
+    выполняются в SQL, поэтому таблица не держит и не отрисовывает все строки сразу.
+    """
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.headers = [header for header, _ in COLUMNS]
+        self.db_image: str | None = None
+        self.operation: str | None = None
+        self.sort_field = "timestamp"
+        self.sort_order = "desc"
+        self._rows: list[TestResults] = []
+        self._total = 0
+        # Наибольший id на момент загрузки: всё, что больше, – новые результаты
+        self._max_id = 0
+
+    # ------------------------------------------------------------------
+    # Интерфейс QAbstractTableModel
+    # ------------------------------------------------------------------
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: B008
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: B008
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(self, section: int, orientation, role=Qt.ItemDataRole.DisplayRole) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.headers[section]
+        return None
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        result = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return _CELL_TEXT[index.column()](result)
+        if role == Qt.ItemDataRole.UserRole:
+            return result.id
+        return None
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:  # noqa: B008
+        return not parent.isValid() and len(self._rows) < self._total
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:  # noqa: B008
+        if parent.isValid():
+            return
+        last = self._rows[-1] if self._rows else None
+        page = result_manager.select_results_page(
+            db_image=self.db_image,
+            operation=self.operation,
+            sort=self.sort_field,
+            order=self.sort_order,
+            after=(getattr(last, self.sort_field), last.id) if last else None,
+        )
+        if not page:
+            # Строки удалили после подсчёта – больше загружать нечего
+            self._total = len(self._rows)
+            return
+        self.beginInsertRows(QModelIndex(), len(self._rows), len(self._rows) + len(page) - 1)
+        self._rows.extend(page)
+        self.endInsertRows()
+
+    def sort(self, column: int, order=Qt.SortOrder.AscendingOrder) -> None:
+        self.sort_field = COLUMNS[column][1]
+        self.sort_order = "desc" if order == Qt.SortOrder.DescendingOrder else "asc"
+        self.reload()
+
+    # ------------------------------------------------------------------
+    # Загрузка
+    # ------------------------------------------------------------------
+    def set_filters(self, db_image: str | None, operation: str | None) -> None:
+        self.db_image = db_image or None
+        self.operation = operation or None
+        self.reload()
+
+    def reload(self, keep_loaded: bool = False) -> None:
+        """
+        Перечитывает результаты с начала. С keep_loaded загружает столько же
+        строк, сколько было загружено, чтобы не сбрасывать прокрутку.
+        """
+        limit = max(PAGE_SIZE, len(self._rows)) if keep_loaded else PAGE_SIZE
+        self.beginResetModel()
+        self._max_id = result_manager.max_result_id()
+        self._total = result_manager.count_results(self.db_image, self.operation)
+        self._rows = result_manager.select_results_page(
+            db_image=self.db_image,
+            operation=self.operation,
+            sort=self.sort_field,
+            order=self.sort_order,
+            limit=limit,
+        )
+        self.endResetModel()
+
+    def refresh(self) -> None:
+        """
+        Подтягивает результаты, добавленные после последней загрузки. Если
+        строки ещё и удаляли или порядок не по времени, перечитывает загруженное.
+        """
+        new_rows = result_manager.select_results_since(
+            self._max_id,
+            db_image=self.db_image,
+            operation=self.operation,
+        )
+        total = result_manager.count_results(self.db_image, self.operation)
+        # Строка, вставленная во время reload, могла уже попасть в загруженную страницу
+        loaded_ids = {result.id for result in self._rows if result.id > self._max_id}
+        if new_rows:
+            self._max_id = new_rows[-1].id
+        new_rows = [result for result in new_rows if result.id not in loaded_ids]
+        if total != self._total + len(new_rows) or (new_rows and self.sort_field != "timestamp"):
+            self.reload(keep_loaded=True)
+            return
+        if not new_rows:
+            return
+
+        self._total = total
+        if self.sort_order == "desc":
+            # Новые результаты – самые свежие, их место в начале таблицы
+            self.beginInsertRows(QModelIndex(), 0, len(new_rows) - 1)
+            self._rows[:0] = reversed(new_rows)
+            self.endInsertRows()
+        # При сортировке по возрастанию новые строки подгрузит fetchMore в конце
+
+    def result_at(self, row: int) -> TestResults:
+        return self._rows[row]
+
+    def row_of(self, result_id: int) -> int | None:
+        for row, result in enumerate(self._rows):
+            if result.id == result_id:
+                return row
+        return None
+
+
+def _seconds(result: TestResults) -> float | None:
+    return result.execution_time or None
+
+
+# Текст ячейки по номеру столбца (порядок как в COLUMNS)
+_CELL_TEXT = (
+    lambda r: r.timestamp.strftime("%Y-%m-%d %H:%M:%S"),
+    lambda r: r.db_image,
+    lambda r: r.operation,
+    lambda r: str(r.num_records),
+    lambda r: r.step_description or "",
+    lambda r: _format_execution_time(r),
+    lambda r: f"{r.memory_used:.2f}",
+    lambda r: f"{r.cpu_percent:.2f}",
+    lambda r: _format_optional(r.latency_p50),
+    lambda r: _format_optional(r.latency_p95),
+    lambda r: _format_optional(r.latency_p99),
+    lambda r: _format_optional(r.throughput),
+    lambda r: _format_optional(r.error_count, "{}"),
+    lambda r: _format_optional(r.pool_wait_p95),
+    lambda r: _format_pair(r.blk_read_bytes, r.blk_write_bytes, MB),
+    lambda r: _format_pair(r.blk_read_ops, r.blk_write_ops, _seconds(r)),
+    lambda r: _format_pair(r.net_rx_bytes, r.net_tx_bytes, MB),
+)
+
+
+def _format_optional(value: float | None, fmt: str = "{:.2f}") -> str:
+    return "" if value is None else fmt.format(value)
+
+
+def _format_execution_time(result) -> str:
+    """Время шага; для повторов – среднее ± полуширина 95% ДИ."""
+    if result.repeat_count and result.execution_time_ci95 is not None:
+        return f"{result.execution_time:.2f} ± {result.execution_time_ci95:.2f}"
+    return f"{result.execution_time:.2f}"
+
+
+def _format_pair(first: float | None, second: float | None, divisor: float | None) -> str:
+    """«first / second», делённые на divisor (МБ, секунды шага)."""
+    if first is None or second is None or not divisor:
+        return ""
+    return f"{first / divisor:.2f} / {second / divisor:.2f}"
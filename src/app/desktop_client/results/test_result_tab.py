@@ -1,6 +1,6 @@
 import os
 
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import QCoreApplication, QItemSelectionModel, Qt, QTimer
 from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import (
     QAbstractItemView,
@@ -10,12 +10,12 @@ from PyQt6.QtWidgets import (
     QLabel,
     QMessageBox,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 from src.app.config.config import settings
+from src.app.desktop_client.results.results_table_model import COLUMNS, ResultsTableModel
 from src.app.desktop_client.results.visualizer import (
     Diagram,
     TestResultsVisualizer,
@@ -33,6 +33,9 @@ class TestResultsApp(QWidget):
         self.retranslateUi()
         self.load_possible_filter_key_values()
         self.visualizer = TestResultsVisualizer()
+        # Версия базы, с которой синхронизирована таблица; берётся до загрузки,
+        # чтобы не пропустить результаты, записанные во время неё
+        self.data_version = result_manager.data_version()
         self.get_results()
         self.refresh_timer = QTimer(self)
         self.refresh_timer.setInterval(5000)
@@ -64,14 +67,18 @@ class TestResultsApp(QWidget):
         # === Results group ===
         self.results_group = QGroupBox()
         results_layout = QVBoxLayout()
-        self.results_table = QTableWidget()
+        # Строки подгружаются страницами при прокрутке, сортировка – в SQL
+        self.results_model = ResultsTableModel(self)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
         self.results_table.setSelectionBehavior(
-            QTableWidget.SelectionBehavior.SelectRows,
+            QAbstractItemView.SelectionBehavior.SelectRows,
         )
         self.results_table.setSelectionMode(
             QAbstractItemView.SelectionMode.ExtendedSelection,
         )
-        self.results_table.setColumnCount(8)
+        self.results_table.horizontalHeader().setSortIndicator(0, Qt.SortOrder.DescendingOrder)
+        self.results_table.setSortingEnabled(True)
         self.delete_button = QPushButton()
         self.delete_button.clicked.connect(self.delete_selected_results)
         results_layout.addWidget(self.results_table)
@@ -103,17 +110,14 @@ class TestResultsApp(QWidget):
 
         # Translate results group
         self.results_group.setTitle(self.tr("Результаты тестирования"))
-        headers = [
-            self.tr("Timestamp"),
-            self.tr("DB Image"),
-            self.tr("Operation"),
-            self.tr("Num Records"),
-            self.tr("Test info"),
-            self.tr("Exec Time"),
-            self.tr("Memory"),
-            self.tr("CPU %"),
+        self.results_model.headers = [
+            QCoreApplication.translate("TestResultsApp", header) for header, _ in COLUMNS
         ]
-        self.results_table.setHorizontalHeaderLabels(headers)
+        self.results_model.headerDataChanged.emit(
+            Qt.Orientation.Horizontal,
+            0,
+            len(COLUMNS) - 1,
+        )
         self.delete_button.setText(self.tr("Удалить результат(ы)"))
 
         # Translate visualization
@@ -148,49 +152,17 @@ class TestResultsApp(QWidget):
         db_image: str | None = None,
         operation: str | None = None,
     ) -> None:
-        results = result_manager.select_all_results(
-            db_image=db_image,
-            operation=operation,
-        )
-        # Обновляем таблицу
-        self.results_table.setRowCount(0)
-        self.results_table.setRowCount(len(results))
-        for row, result in enumerate(results):
-            # Создаём ячейку для Timestamp и сохраняем result.id в данных ячейки
-            item_timestamp = QTableWidgetItem(result.timestamp)
-            item_timestamp.setData(Qt.ItemDataRole.UserRole, result.id)
-            self.results_table.setItem(row, 0, item_timestamp)
-            self.results_table.setItem(row, 1, QTableWidgetItem(result.db_image))
-            self.results_table.setItem(row, 2, QTableWidgetItem(result.operation))
-            self.results_table.setItem(
-                row,
-                3,
-                QTableWidgetItem(str(result.num_records)),
-            )
-            self.results_table.setItem(
-                row,
-                4,
-                QTableWidgetItem(result.step_description),
-            )
-            self.results_table.setItem(
-                row,
-                5,
-                QTableWidgetItem(f"{result.execution_time:.2f}"),
-            )
-            self.results_table.setItem(
-                row,
-                6,
-                QTableWidgetItem(f"{result.memory_used:.2f}"),
-            )
-            self.results_table.setItem(
-                row,
-                7,
-                QTableWidgetItem(f"{result.cpu_percent:.2f}"),
-            )
+        self.results_model.set_filters(db_image, operation)
+
+    def selected_result_ids(self) -> list[int]:
+        return [
+            self.results_model.result_at(index.row()).id
+            for index in self.results_table.selectionModel().selectedRows()
+        ]
 
     def delete_selected_results(self) -> None:
-        selected_indexes = self.results_table.selectionModel().selectedRows()
-        if not selected_indexes:
+        selected_ids = self.selected_result_ids()
+        if not selected_ids:
             QMessageBox.warning(self, "Ошибка", "Выберите результат(ы) для удаления.")
             return
 
@@ -202,26 +174,23 @@ class TestResultsApp(QWidget):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            for model_index in selected_indexes:
-                row = model_index.row()
-                result_id = self.results_table.item(row, 0).data(
-                    Qt.ItemDataRole.UserRole,
-                )
+            for result_id in selected_ids:
                 result_manager.delete_result(result_id)
             self.get_results()
 
     def on_timer_refresh(self) -> None:
         """
-        Каждые 5 секунд обновляем таблицу результатов,
-        используя текущие фильтры и восстанавливая выделенные строки.
+        Каждые 5 секунд проверяем, менялась ли база. Если нет – ничего не делаем;
+        если да – дописываем в таблицу только новые результаты с текущими
+        фильтрами и восстанавливаем выделенные строки.
         """
+        data_version = result_manager.data_version()
+        if data_version == self.data_version:
+            return
+        self.data_version = data_version
+
         # Сохраняем id выбранных результатов
-        selected_ids = []
-        for model_index in self.results_table.selectionModel().selectedRows():
-            row = model_index.row()
-            item = self.results_table.item(row, 0)
-            if item:
-                selected_ids.append(item.data(Qt.ItemDataRole.UserRole))
+        selected_ids = self.selected_result_ids()
 
         # Сохраняем выбранные значения фильтров
         old_db_image_data = self.db_image_filter_combo.currentData()
@@ -253,17 +222,31 @@ class TestResultsApp(QWidget):
             self.operation_filter_combo.setCurrentIndex(0)
         self.operation_filter_combo.blockSignals(False)
 
-        # Обновляем таблицу с результатами
-        self.get_results()
+        # Обновляем таблицу; если выбранное значение фильтра пропало – перечитываем
+        db_image = self.db_image_filter_combo.currentData() or None
+        operation = self.operation_filter_combo.currentData() or None
+        if (db_image, operation) != (self.results_model.db_image, self.results_model.operation):
+            self.results_model.set_filters(db_image, operation)
+        else:
+            self.results_model.refresh()
 
         # Восстанавливаем выделение строк по сохранённым id
-        for row in range(self.results_table.rowCount()):
-            item = self.results_table.item(row, 0)
-            if item and (item.data(Qt.ItemDataRole.UserRole) in selected_ids):
-                self.results_table.selectRow(row)
+        selection = self.results_table.selectionModel()
+        for result_id in selected_ids:
+            row = self.results_model.row_of(result_id)
+            if row is not None:
+                selection.select(
+                    self.results_model.index(row, 0),
+                    QItemSelectionModel.SelectionFlag.Select
+                    | QItemSelectionModel.SelectionFlag.Rows,
+                )
 
     def visualize_results(self) -> None:
         """Визуализирует данные на основе выбранного типа визуализации."""
+        if self.visualization_type.currentText() == Diagram.RESOURCE_TIMELINE.value:
+            self.visualize_resource_timeline()
+            return
+
         db_image_filter = self.db_image_filter_combo.currentData()
         operation_filter = self.operation_filter_combo.currentData()
 
@@ -282,3 +265,22 @@ class TestResultsApp(QWidget):
             self.visualizer.plot_records_vs_execution_time(results)
         elif vis_type == Diagram.EXECUTION_TIME_DISTRIBUTION.value:
             self.visualizer.plot_execution_time_distribution(results)
+
+    def visualize_resource_timeline(self) -> None:
+        """Временные ряды ресурсов для выделенных в таблице результатов."""
+        series_by_label = {}
+        for index in self.results_table.selectionModel().selectedRows():
+            result = self.results_model.result_at(index.row())
+            series = result_manager.select_resource_series(result.id)
+            if series is not None and len(series):
+                label = f"#{result.id} {result.db_image}"
+                series_by_label[label] = series
+
+        if not series_by_label:
+            QMessageBox.warning(
+                self,
+                "Ошибка",
+                "Выберите результат(ы) с записанным временным рядом ресурсов.",
+            )
+            return
+        self.visualizer.plot_resource_timeline(series_by_label)
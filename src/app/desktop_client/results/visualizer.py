@@ -2,12 +2,17 @@ import enum
 
 import numpy as np
 from matplotlib import pyplot as plt
+from src.app.core.resource_series import ResourceSeries
+
+# Больше точек на графике всё равно не различить
+MAX_PLOT_POINTS = 1000
 
 
 class Diagram(enum.Enum):
     RESOURCE_USAGE_BY_DB = "Потребление памяти и CPU по БД"
     EXECUTION_TIME_DISTRIBUTION = "Распределение времени выполнения по операциям"
     RECORDS_VS_EXECUTION_TIME = "Связь между количеством записей и временем выполнения"
+    RESOURCE_TIMELINE = "Потребление ресурсов во времени (выбранные результаты)"
 
 
 diagrams = [diagram.value for diagram in Diagram]
@@ -97,3 +102,59 @@ class TestResultsVisualizer:
         ax.set_title("Зависимость времени выполнения от количества записей")
         plt.tight_layout()
         plt.show()
+
+    @staticmethod
+    def plot_resource_timeline(series_by_label: dict[str, ResourceSeries]) -> None:
+        """
+        Строит графики CPU, памяти, блочного и сетевого ввода-вывода и числа
+        процессов во времени для выбранных результатов на общей оси времени шага.
+        """
+        fig, axes = plt.subplots(5, 1, figsize=(12, 12), sharex=True)
+        ax_cpu, ax_mem, ax_blk, ax_net, ax_pids = axes
+
+        for label, series in series_by_label.items():
+            points = series.downsample(MAX_PLOT_POINTS)
+            seconds = points["timestamp"] - points["timestamp"][0]
+            ax_cpu.plot(seconds, points["cpu_percent"], label=label)
+            ax_mem.plot(seconds, points["rss"] / 1024 / 1024, label=f"{label} RSS")
+            ax_mem.plot(
+                seconds,
+                points["cache"] / 1024 / 1024,
+                linestyle="--",
+                label=f"{label} cache",
+            )
+            ax_blk.plot(seconds, _rate_mb(seconds, points["blk_read"]), label=f"{label} read")
+            ax_blk.plot(
+                seconds,
+                _rate_mb(seconds, points["blk_write"]),
+                linestyle="--",
+                label=f"{label} write",
+            )
+            ax_net.plot(seconds, _rate_mb(seconds, points["net_rx"]), label=f"{label} rx")
+            ax_net.plot(
+                seconds,
+                _rate_mb(seconds, points["net_tx"]),
+                linestyle="--",
+                label=f"{label} tx",
+            )
+            ax_pids.plot(seconds, points["pids"], label=label)
+
+        ax_cpu.set_ylabel("CPU (%)")
+        ax_mem.set_ylabel("Память (MB)")
+        ax_blk.set_ylabel("Диск (MB/s)")
+        ax_net.set_ylabel("Сеть (MB/s)")
+        ax_pids.set_ylabel("Процессы")
+        ax_pids.set_xlabel("Время от начала шага (сек)")
+        ax_cpu.set_title("Потребление ресурсов во времени")
+        for ax in axes:
+            ax.legend(fontsize="small")
+        plt.tight_layout()
+        plt.show()
+
+
+def _rate_mb(seconds: np.ndarray, counter: np.ndarray) -> np.ndarray:
+    """Скорость накопительного счётчика байт в MB/s между соседними точками."""
+    rate = np.zeros_like(counter)
+    elapsed = np.diff(seconds)
+    np.divide(np.diff(counter), elapsed, out=rate[1:], where=elapsed > 0)
+    return rate / 1024 / 1024
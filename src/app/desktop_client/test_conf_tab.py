@@ -29,6 +29,7 @@ from src.app.config.log import get_logger
 from src.app.desktop_client.config import PageIndex
 from src.app.desktop_client.docker_page.docker_config import docker_image_icon_path
 from src.app.desktop_client.test_runner import DockerTestRunner
+from src.app.schemas.enums import PullPolicy
 from src.app.schemas.schema import DockerHostConfig, TestSystemConfig
 from src.app.storage.db_manager.docker_storage import docker_db_manager
 from src.app.storage.db_manager.scenario_storage import scenario_db_manager
@@ -124,6 +125,34 @@ class ConfigApp(QWidget):
         )
         host_layout.addWidget(self.docker_endpoint_label, 1, 0)
         host_layout.addWidget(self.docker_endpoint_edit, 1, 1, 1, 2)
+        # период опроса cgroup (только локальный Docker), 0 – docker stats
+        self.stats_interval_label = QLabel(self.tr("Период опроса метрик, мс:"))
+        self.stats_interval_spin = QSpinBox()
+        self.stats_interval_spin.setRange(0, 100)
+        self.stats_interval_spin.setSingleStep(10)
+        self.stats_interval_spin.setSpecialValueText(self.tr("docker stats"))
+        self.stats_interval_spin.setValue(50)
+        host_layout.addWidget(self.stats_interval_label, 2, 0)
+        host_layout.addWidget(self.stats_interval_spin, 2, 1)
+
+        # выделенные ядра СУБД (только локальный Docker), остальные – нагрузке
+        self.db_cpu_count_label = QLabel(self.tr("Ядер для СУБД:"))
+        self.db_cpu_count_spin = QSpinBox()
+        self.db_cpu_count_spin.setRange(0, 1024)
+        self.db_cpu_count_spin.setSpecialValueText(self.tr("без привязки"))
+        host_layout.addWidget(self.db_cpu_count_label, 3, 0)
+        host_layout.addWidget(self.db_cpu_count_spin, 3, 1)
+
+        # политика загрузки образа из registry
+        self.pull_policy_label = QLabel(self.tr("Загрузка образа:"))
+        self.pull_policy_combo = QComboBox()
+        for policy in PullPolicy:
+            self.pull_policy_combo.addItem(policy.value, policy)
+        self.pull_policy_combo.setCurrentIndex(
+            self.pull_policy_combo.findData(PullPolicy.if_not_present),
+        )
+        host_layout.addWidget(self.pull_policy_label, 4, 0)
+        host_layout.addWidget(self.pull_policy_combo, 4, 1)
         docker_host_group.setLayout(host_layout)
         main_layout.addWidget(docker_host_group)
 
@@ -286,10 +315,14 @@ class ConfigApp(QWidget):
         )
         selected_cfg = self.db_image_combo.currentData()
 
+        stats_interval = self.stats_interval_spin.value()
         test_system_config = TestSystemConfig(
             use_existing=self.connect_existing_db_radio.isChecked(),
             stop_after=self.stop_radio.isChecked(),
             remove_after=self.remove_radio.isChecked(),
+            stats_interval_ms=max(stats_interval, 10) if stats_interval else None,
+            db_cpu_count=self.db_cpu_count_spin.value() or None,
+            pull_policy=self.pull_policy_combo.currentData(),
         )
 
         if self.remote_docker_radio.isChecked():
@@ -167,10 +167,13 @@ class ScenarioBuilderWidget(QWidget):
             dialog = InsertDataDialog(table_names, self)
             dialog.combo_table_name.setObjectName(step.table_name)
             dialog.spin_num_records.setValue(step.num_records)
+            dialog.set_options(step)
             if dialog.exec() == QDialog.DialogCode.Accepted:
                 table_name, num_records, data_types = dialog.get_data()
                 step.table_name = table_name
                 step.num_records = num_records
+                for option, value in dialog.get_options().items():
+                    setattr(step, option, value)
         elif step.step_type == StepType.query:
             dialog = QueryDialog(
                 query=step.query,
@@ -178,11 +181,14 @@ class ScenarioBuilderWidget(QWidget):
                 initial_requests=step.request_count,
                 parent=self,
             )
+            dialog.set_options(step)
             if dialog.exec() == QDialog.DialogCode.Accepted:
                 query, additional_steps, thread_count, request_count = dialog.get_data()
                 step.query = query
                 step.thread_count = thread_count
                 step.request_count = request_count
+                for option, value in dialog.get_options().items():
+                    setattr(step, option, value)
 
         self.update_step_table()
 
@@ -233,6 +239,7 @@ class ScenarioBuilderWidget(QWidget):
                 num_records=num_records,
                 columns=columns,
                 measure=False,
+                **dialog.get_options(),
             )
             self.steps.append(step)
             self.update_step_table()
@@ -246,6 +253,7 @@ class ScenarioBuilderWidget(QWidget):
                 thread_count=thread_count,
                 request_count=request_count,
                 measure=False,
+                **dialog.get_options(),
             )
             if additional_steps:
                 for add_step in additional_steps:
@@ -1,3 +1,5 @@
+from dataclasses import dataclass
+
 from PyQt6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -7,12 +9,36 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QLineEdit,
+    QMessageBox,
     QPushButton,
+    QSpinBox,
     QVBoxLayout,
     QWidget,
 )
 from src.app.core.scenario_steps import ColumnDefinition
-from src.app.schemas.enums import data_type_list
+from src.app.manager.db.utils import STR_ALPHABETS
+from src.app.schemas.enums import DataType, data_type_list
+
+# Значение спинбокса минимальной длины, означающее «все строки максимальной длины»
+NO_MIN_LENGTH = -1
+
+
+@dataclass
+class ColumnFields:
+    """Поля ввода одной колонки."""
+
+    name: QLineEdit
+    data_type: QComboBox
+    primary_key: QCheckBox
+    str_length: QSpinBox
+    str_min_length: QSpinBox
+    alphabet: QComboBox
+
+    def update_str_enabled(self) -> None:
+        """Параметры строк доступны только для колонок типа str."""
+        is_str = self.data_type.currentText() == DataType.str.value
+        for widget in (self.str_length, self.str_min_length, self.alphabet):
+            widget.setEnabled(is_str)
 
 
 class CreateTableDialog(QDialog):
@@ -21,9 +47,7 @@ class CreateTableDialog(QDialog):
         self.setWindowTitle("Create Table Step")
         self.table_name = ""
         self.columns = {}
-        self.column_fields: list[tuple[QLineEdit, QComboBox, QCheckBox]] = (
-            []
-        )  # список для хранения полей колонок
+        self.column_fields: list[ColumnFields] = []  # список для хранения полей колонок
         self.line_table_name = QLineEdit()
         self.columns_layout = QVBoxLayout()
 
@@ -66,30 +90,68 @@ class CreateTableDialog(QDialog):
 
         pk_checkbox = QCheckBox("PK")
 
+        # Параметры генерации строк
+        str_length_box = QSpinBox()
+        str_length_box.setRange(1, 10000)
+        str_length_box.setValue(10)
+
+        str_min_length_box = QSpinBox()
+        str_min_length_box.setRange(NO_MIN_LENGTH, 10000)
+        str_min_length_box.setValue(NO_MIN_LENGTH)
+        str_min_length_box.setSpecialValueText("нет")
+
+        # Имя готового алфавита или свой набор ASCII-символов
+        alphabet_combo = QComboBox()
+        alphabet_combo.setEditable(True)
+        alphabet_combo.addItems(list(STR_ALPHABETS))
+
         col_layout.addWidget(QLabel("Имя:"))
         col_layout.addWidget(col_name_edit)
         col_layout.addWidget(QLabel("Тип:"))
         col_layout.addWidget(col_type_combo)
         col_layout.addWidget(pk_checkbox)
+        col_layout.addWidget(QLabel("Длина:"))
+        col_layout.addWidget(str_length_box)
+        col_layout.addWidget(QLabel("Мин. длина:"))
+        col_layout.addWidget(str_min_length_box)
+        col_layout.addWidget(QLabel("Алфавит:"))
+        col_layout.addWidget(alphabet_combo)
 
         container = QWidget()
         container.setLayout(col_layout)
         self.columns_layout.addWidget(container)
 
-        self.column_fields.append((col_name_edit, col_type_combo, pk_checkbox))
+        fields = ColumnFields(
+            name=col_name_edit,
+            data_type=col_type_combo,
+            primary_key=pk_checkbox,
+            str_length=str_length_box,
+            str_min_length=str_min_length_box,
+            alphabet=alphabet_combo,
+        )
+        col_type_combo.currentTextChanged.connect(fields.update_str_enabled)
+        fields.update_str_enabled()
+        self.column_fields.append(fields)
 
     def accept(self) -> None:
         self.table_name = self.line_table_name.text().strip()
         self.columns = {}
-        for name_edit, type_combo, pk_checkbox in self.column_fields:
-            name = name_edit.text().strip()
-            typ = type_combo.currentText().strip()
-            primary_key = pk_checkbox.isChecked()
-            if name:
+        for fields in self.column_fields:
+            name = fields.name.text().strip()
+            if not name:
+                continue
+            min_length = fields.str_min_length.value()
+            try:
                 self.columns[name] = ColumnDefinition(
-                    data_type=typ,
-                    primary_key=primary_key,
+                    data_type=fields.data_type.currentText().strip(),
+                    primary_key=fields.primary_key.isChecked(),
+                    str_length=fields.str_length.value(),
+                    str_min_length=None if min_length == NO_MIN_LENGTH else min_length,
+                    alphabet=fields.alphabet.currentText(),
                 )
+            except ValueError as e:
+                QMessageBox.warning(self, "Ошибка", f"Колонка {name}: {e}")
+                return
         super().accept()
 
     def get_data(self) -> tuple[str, dict[str, ColumnDefinition]]:
@@ -1,4 +1,14 @@
-from PyQt6.QtWidgets import QComboBox, QDialog, QDialogButtonBox, QFormLayout, QSpinBox
+from typing import Any
+
+from PyQt6.QtWidgets import (
+    QCheckBox,
+    QComboBox,
+    QDialog,
+    QDialogButtonBox,
+    QFormLayout,
+    QSpinBox,
+)
+from src.app.schemas.enums import InsertMethod
 
 
 class InsertDataDialog(QDialog):
@@ -15,12 +25,47 @@ class InsertDataDialog(QDialog):
         self.spin_num_records = QSpinBox()
         self.spin_num_records.setRange(1, 10000000)
 
+        self.combo_insert_method = QComboBox()
+        for method in InsertMethod:
+            self.combo_insert_method.addItem(method.value, method)
+
+        # 0 – значение адаптера по умолчанию
+        self.spin_batch_size = QSpinBox()
+        self.spin_batch_size.setRange(0, 10000000)
+        self.spin_batch_size.setSpecialValueText("по умолчанию")
+
+        self.spin_rows_per_transaction = QSpinBox()
+        self.spin_rows_per_transaction.setRange(0, 10000000)
+        self.spin_rows_per_transaction.setSpecialValueText("каждая пачка")
+
+        self.spin_parallel_writers = QSpinBox()
+        self.spin_parallel_writers.setRange(1, 256)
+
+        self.spin_process_count = QSpinBox()
+        self.spin_process_count.setRange(1, 256)
+
+        self.spin_warmup = QSpinBox()
+        self.spin_warmup.setRange(0, 1000)
+
+        self.spin_repeat = QSpinBox()
+        self.spin_repeat.setRange(1, 1000)
+
+        self.check_reset_between_repeats = QCheckBox("Очищать таблицу перед каждым прогоном")
+
         self.init_ui()
 
     def init_ui(self) -> None:
         layout = QFormLayout()
         layout.addRow("Имя таблицы:", self.combo_table_name)
         layout.addRow("Количество записей:", self.spin_num_records)
+        layout.addRow("Метод вставки:", self.combo_insert_method)
+        layout.addRow("Строк в пачке:", self.spin_batch_size)
+        layout.addRow("Строк в транзакции:", self.spin_rows_per_transaction)
+        layout.addRow("Параллельных писателей:", self.spin_parallel_writers)
+        layout.addRow("Процессов:", self.spin_process_count)
+        layout.addRow("Прогревов:", self.spin_warmup)
+        layout.addRow("Повторов:", self.spin_repeat)
+        layout.addRow("", self.check_reset_between_repeats)
 
         btnBox = QDialogButtonBox(
             QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel,
@@ -37,3 +82,29 @@ class InsertDataDialog(QDialog):
 
     def get_data(self):
         return self.table_name, self.num_records, self.data_types
+
+    def set_options(self, step) -> None:
+        """Заполняет дополнительные параметры из существующего шага."""
+        index = self.combo_insert_method.findData(step.insert_method)
+        if index >= 0:
+            self.combo_insert_method.setCurrentIndex(index)
+        self.spin_batch_size.setValue(step.batch_size or 0)
+        self.spin_rows_per_transaction.setValue(step.rows_per_transaction or 0)
+        self.spin_parallel_writers.setValue(step.parallel_writers)
+        self.spin_process_count.setValue(step.process_count)
+        self.spin_warmup.setValue(step.warmup_iterations)
+        self.spin_repeat.setValue(step.repeat)
+        self.check_reset_between_repeats.setChecked(step.reset_between_repeats)
+
+    def get_options(self) -> dict[str, Any]:
+        """Дополнительные параметры InsertDataStep."""
+        return {
+            "insert_method": self.combo_insert_method.currentData(),
+            "batch_size": self.spin_batch_size.value() or None,
+            "rows_per_transaction": self.spin_rows_per_transaction.value() or None,
+            "parallel_writers": self.spin_parallel_writers.value(),
+            "process_count": self.spin_process_count.value(),
+            "warmup_iterations": self.spin_warmup.value(),
+            "repeat": self.spin_repeat.value(),
+            "reset_between_repeats": self.check_reset_between_repeats.isChecked(),
+        }
@@ -1,9 +1,12 @@
+from typing import Any
+
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import (
     QApplication,
     QComboBox,
     QDialog,
     QDialogButtonBox,
+    QDoubleSpinBox,
     QHBoxLayout,
     QLabel,
     QListWidget,
@@ -15,6 +18,10 @@ from PyQt6.QtWidgets import (
 )
 from src.app.core.llm.predictor import get_tables_list, possible_llm
 from src.app.core.scenario_steps import CreateTableStep
+from src.app.schemas.enums import ConnectionMode, ExecutionMode, RateProfile
+
+# Значение спинбокса начальной интенсивности, означающее «не задана»
+NO_START_RATE = -1.0
 
 
 class SelectTableStepsDialog(QDialog):
@@ -79,13 +86,54 @@ class QueryDialog(QDialog):
         self.text_edit = QTextEdit()
 
         self.thread_count_box = QSpinBox()
-        self.thread_count_box.setRange(1, 100)
+        self.thread_count_box.setRange(1, 10000)
         self.thread_count_box.setValue(initial_threads)
 
         self.request_count_box = QSpinBox()
         self.request_count_box.setRange(1, 10000)
         self.request_count_box.setValue(initial_requests)
 
+        self.execution_mode_combo = QComboBox()
+        for mode in ExecutionMode:
+            self.execution_mode_combo.addItem(mode.value, mode)
+
+        self.connection_mode_combo = QComboBox()
+        for mode in ConnectionMode:
+            self.connection_mode_combo.addItem(mode.value, mode)
+
+        self.process_count_box = QSpinBox()
+        self.process_count_box.setRange(1, 256)
+
+        self.warmup_box = QSpinBox()
+        self.warmup_box.setRange(0, 1000)
+
+        self.repeat_box = QSpinBox()
+        self.repeat_box.setRange(1, 1000)
+
+        # Открытая модель нагрузки: 0 – закрытая модель (request_count запросов)
+        self.target_rate_box = QDoubleSpinBox()
+        self.target_rate_box.setRange(0, 1000000)
+        self.target_rate_box.setSpecialValueText("нет")
+
+        self.rate_profile_combo = QComboBox()
+        for profile in RateProfile:
+            self.rate_profile_combo.addItem(profile.value, profile)
+
+        # Минимум (-1) – «не задана»: профиль без разгона с target_rate;
+        # 0 – разгон с нуля, самый частый профиль прогрева
+        self.start_rate_box = QDoubleSpinBox()
+        self.start_rate_box.setRange(NO_START_RATE, 1000000)
+        self.start_rate_box.setSpecialValueText("нет")
+
+        # Число ступеней задаётся только для профиля step
+        self.rate_steps_box = QSpinBox()
+        self.rate_steps_box.setRange(1, 1000)
+        self.rate_steps_box.setValue(4)
+
+        self.duration_box = QDoubleSpinBox()
+        self.duration_box.setRange(0, 86400)
+        self.duration_box.setSpecialValueText("авто")
+
         self.init_ui()
 
     def init_ui(self) -> None:
@@ -111,8 +159,41 @@ class QueryDialog(QDialog):
         h_load.addSpacing(20)
         h_load.addWidget(QLabel("Запросов:"))
         h_load.addWidget(self.request_count_box)
+        h_load.addSpacing(20)
+        h_load.addWidget(QLabel("Движок:"))
+        h_load.addWidget(self.execution_mode_combo)
+        h_load.addSpacing(20)
+        h_load.addWidget(QLabel("Соединения:"))
+        h_load.addWidget(self.connection_mode_combo)
+        h_load.addSpacing(20)
+        h_load.addWidget(QLabel("Процессов:"))
+        h_load.addWidget(self.process_count_box)
         layout.addLayout(h_load)
 
+        h_repeat = QHBoxLayout()
+        h_repeat.addWidget(QLabel("Прогревов:"))
+        h_repeat.addWidget(self.warmup_box)
+        h_repeat.addSpacing(20)
+        h_repeat.addWidget(QLabel("Повторов:"))
+        h_repeat.addWidget(self.repeat_box)
+        h_repeat.addStretch()
+        layout.addLayout(h_repeat)
+
+        h_rate = QHBoxLayout()
+        h_rate.addWidget(QLabel("Целевая интенсивность, rps:"))
+        h_rate.addWidget(self.target_rate_box)
+        h_rate.addWidget(QLabel("Профиль:"))
+        h_rate.addWidget(self.rate_profile_combo)
+        h_rate.addWidget(QLabel("Начальная, rps:"))
+        h_rate.addWidget(self.start_rate_box)
+        h_rate.addWidget(QLabel("Ступеней:"))
+        h_rate.addWidget(self.rate_steps_box)
+        h_rate.addWidget(QLabel("Длительность, с:"))
+        h_rate.addWidget(self.duration_box)
+        layout.addLayout(h_rate)
+        self.rate_profile_combo.currentIndexChanged.connect(self.update_rate_steps_enabled)
+        self.update_rate_steps_enabled()
+
         # ОК/Отмена
         btn_box = QDialogButtonBox(
             QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel,
@@ -123,6 +204,9 @@ class QueryDialog(QDialog):
 
         self.setLayout(layout)
 
+    def update_rate_steps_enabled(self) -> None:
+        self.rate_steps_box.setEnabled(self.rate_profile_combo.currentData() == RateProfile.step)
+
     def analyze_query_for_init(self) -> None:
         QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
         try:
@@ -152,3 +236,43 @@ class QueryDialog(QDialog):
             self.thread_count_box.value(),
             self.request_count_box.value(),
         )
+
+    def set_options(self, step) -> None:
+        """Заполняет дополнительные параметры из существующего шага."""
+        index = self.execution_mode_combo.findData(step.execution_mode)
+        if index >= 0:
+            self.execution_mode_combo.setCurrentIndex(index)
+        index = self.connection_mode_combo.findData(step.connection_mode)
+        if index >= 0:
+            self.connection_mode_combo.setCurrentIndex(index)
+        self.target_rate_box.setValue(step.target_rate or 0)
+        index = self.rate_profile_combo.findData(step.rate_profile)
+        if index >= 0:
+            self.rate_profile_combo.setCurrentIndex(index)
+        self.start_rate_box.setValue(
+            NO_START_RATE if step.start_rate is None else step.start_rate,
+        )
+        self.rate_steps_box.setValue(step.rate_steps)
+        self.duration_box.setValue(step.duration or 0)
+        self.process_count_box.setValue(step.process_count)
+        self.warmup_box.setValue(step.warmup_iterations)
+        self.repeat_box.setValue(step.repeat)
+
+    def get_options(self) -> dict[str, Any]:
+        """Дополнительные параметры QueryStep."""
+        return {
+            "execution_mode": self.execution_mode_combo.currentData(),
+            "connection_mode": self.connection_mode_combo.currentData(),
+            "target_rate": self.target_rate_box.value() or None,
+            "rate_profile": self.rate_profile_combo.currentData(),
+            "start_rate": (
+                None
+                if self.start_rate_box.value() == NO_START_RATE
+                else self.start_rate_box.value()
+            ),
+            "rate_steps": self.rate_steps_box.value(),
+            "duration": self.duration_box.value() or None,
+            "process_count": self.process_count_box.value(),
+            "warmup_iterations": self.warmup_box.value(),
+            "repeat": self.repeat_box.value(),
+        }
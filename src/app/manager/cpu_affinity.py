@@ -0,0 +1,91 @@
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from src.app.config.log import get_logger
+
+logger = get_logger(__name__)
+
+CPU_SYSFS = Path("/sys/devices/system/cpu")
+
+
+def available_cpus() -> list[int]:
+    """Ядра, на которых разрешено работать текущему процессу."""
+    return sorted(os.sched_getaffinity(0))
+
+
+def parse_cpuset(cpuset: str) -> list[int]:
+    """'0-3,8' -> [0, 1, 2, 3, 8] (формат docker --cpuset-cpus)."""
+    cpus = set()
+    for part in cpuset.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        first, _, last = part.partition("-")
+        cpus.update(range(int(first), int(last or first) + 1))
+    return sorted(cpus)
+
+
+def format_cpuset(cpus: list[int]) -> str:
+    return ",".join(str(cpu) for cpu in sorted(cpus))
+
+
+def split_cores(cpus: list[int], db_cores: int) -> tuple[list[int], list[int]]:
+    """
+    Делит ядра между контейнером СУБД и генератором нагрузки. СУБД получает
+    db_cores логических ядер с конца списка (ядро 0 обычно занято прерываниями
+    и системой), целыми физическими ядрами – гиперпотоки одного ядра не
+    делятся между СУБД и нагрузкой. Генератор получает остальное.
+    """
+    if not 0 < db_cores < len(cpus):
+        msg = f"Нельзя выделить СУБД {db_cores} из {len(cpus)} ядер и оставить ядра нагрузке."
+        raise ValueError(msg)
+
+    db_cpus: list[int] = []
+    for group in reversed(_physical_core_groups(cpus)):
+        if len(db_cpus) >= db_cores:
+            break
+        db_cpus.extend(group)
+    load_cpus = [cpu for cpu in cpus if cpu not in db_cpus]
+    if not load_cpus:
+        # Физических ядер не хватило, чтобы не делить гиперпотоки – делим по логическим
+        db_cpus = cpus[-db_cores:]
+        load_cpus = cpus[:-db_cores]
+    return sorted(db_cpus), load_cpus
+
+
+@contextmanager
+def pinned_thread(cpus: list[int] | None) -> Iterator[None]:
+    """
+    Привязывает текущий поток к ядрам на время блока. Потоки и процессы,
+    созданные внутри блока, наследуют привязку.
+    """
+    if not cpus:
+        yield
+        return
+
+    previous = os.sched_getaffinity(0)
+    os.sched_setaffinity(0, cpus)
+    try:
+        yield
+    finally:
+        os.sched_setaffinity(0, previous)
+
+
+def _physical_core_groups(cpus: list[int]) -> list[list[int]]:
+    """Логические ядра, сгруппированные по физическому ядру (thread_siblings_list)."""
+    groups: list[list[int]] = []
+    seen: set[int] = set()
+    for cpu in cpus:
+        if cpu in seen:
+            continue
+        try:
+            siblings = (CPU_SYSFS / f"cpu{cpu}" / "topology" / "thread_siblings_list").read_text()
+            group = [sibling for sibling in parse_cpuset(siblings) if sibling in cpus]
+        except (OSError, ValueError):
+            group = [cpu]
+        group = group or [cpu]
+        seen.update(group)
+        groups.append(group)
+    return groups
@@ -2,32 +2,120 @@ from abc import ABC
 from typing import Any
 
 from src.app.config.log import get_logger
+from src.app.core.latency import LatencyRecorder
 from src.app.core.scenario_steps import CreateTableStep, InsertDataStep, QueryStep
+from src.app.schemas.enums import ConnectionMode
 
 logger = get_logger(__name__)
 
 
 class BaseAdapter(ABC):
+    # Атрибуты с живыми соединениями: при передаче адаптера в дочерний процесс
+    # они обнуляются, и процесс подключается заново через connect().
+    _connection_attrs: tuple[str, ...] = ()
+
     def __init__(self) -> None:
         pass
 
-    def connect(self, **kwargs) -> None:
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        for attr in self._connection_attrs:
+            state[attr] = None
+        return state
+
+    def connect(self, max_connections: int | None = None, **kwargs) -> None:
+        """max_connections – наибольшее число одновременных операций сценария."""
         raise NotImplementedError
 
     def test_connection(self, retries: int = 5, delay: int = 2) -> bool:
         raise NotImplementedError
 
+    def probe(self) -> bool:
+        """
+        Одна проверка готовности СУБД отдельным коротким соединением, без connect()
+        и без ожиданий: True, если СУБД уже отвечает на запросы. По умолчанию
+        готовность определяется только открытием TCP-порта.
+        """
+        return True
+
     def create_table(self, create_table_step: CreateTableStep) -> None:
         raise NotImplementedError
 
     def drop_table_if_exists(self, table_name: str) -> None:
         raise NotImplementedError
 
+    def truncate_table(self, table_name: str) -> None:
+        """Удаляет все строки таблицы, сохраняя её схему."""
+        raise NotImplementedError
+
     def insert_data(
         self,
         insert_step: InsertDataStep,
-    ) -> None:
+        row_range: tuple[int, int] | None = None,
+        seed: int | None = None,
+    ) -> dict[str, Any]:
+        """
+        Вставляет строки [start, stop) из row_range (по умолчанию – все num_records).
+        Параллельные писатели передают общий seed, чтобы их ключи не пересекались.
+        Возвращает фактически применённые параметры вставки.
+        """
         raise NotImplementedError
 
     def execute_query(self, query_step: QueryStep) -> Any:
         raise NotImplementedError
+
+    def track_pool_wait(self) -> LatencyRecorder | None:
+        """
+        Начинает замер ожидания соединения (из пула или нового подключения)
+        для последующих запросов; None – адаптер такого замера не ведёт.
+        """
+        return None
+
+    def release_connections(self) -> None:
+        """Закрывает соединения, закреплённые за потоками на время шага."""
+
+    def async_adapter(self) -> "AsyncBaseAdapter":
+        """Асинхронный двойник адаптера с теми же параметрами подключения."""
+        msg = f"{type(self).__name__} не поддерживает асинхронный режим."
+        raise NotImplementedError(msg)
+
+
+class AsyncBaseAdapter(ABC):
+    """Асинхронный интерфейс адаптера для нагрузки запросами из asyncio."""
+
+    async def connect(
+        self,
+        max_connections: int | None = None,
+        connection_mode: ConnectionMode = ConnectionMode.pooled,
+    ) -> None:
+        raise NotImplementedError
+
+    async def execute_query(self, query_step: QueryStep) -> Any:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        raise NotImplementedError
+
+    def track_pool_wait(self) -> LatencyRecorder | None:
+        return None
+
+
+def effective_insert_params(
+    insert_step: InsertDataStep,
+    default_batch_size: int,
+    max_batch_size: int | None = None,
+) -> dict[str, Any]:
+    """
+    Размер пачки и интервал фиксации, которые адаптер реально применит:
+    rows_per_transaction округляется вверх до целого числа пачек.
+    """
+    batch_size = insert_step.batch_size or default_batch_size
+    if max_batch_size:
+        batch_size = min(batch_size, max_batch_size)
+    rows_per_transaction = insert_step.rows_per_transaction or batch_size
+    rows_per_transaction = -(-rows_per_transaction // batch_size) * batch_size
+    return {
+        "insert_method": insert_step.insert_method.value,
+        "batch_size": batch_size,
+        "rows_per_transaction": rows_per_transaction,
+    }
@@ -0,0 +1,247 @@
+import io
+from abc import ABC
+from collections.abc import Iterable
+from contextlib import closing
+
+from sqlalchemy import Engine, column, insert, table
+from src.app.config.log import get_logger
+from src.app.manager.db.utils import DataBatch
+from src.app.schemas.enums import InsertMethod
+
+logger = get_logger(__name__)
+
+
+class BulkLoader(ABC):
+    """
+    Стратегия загрузки порций данных в SQL-таблицу.
+    Каждая порция – один оператор (или один COPY); фиксация транзакции –
+    после того, как в ней накопилось не меньше rows_per_transaction строк.
+    Если rows_per_transaction не задан, фиксируется каждая порция.
+    """
+
+    def load(
+        self,
+        engine: Engine,
+        table_name: str,
+        batches: Iterable[DataBatch],
+        rows_per_transaction: int | None = None,
+    ) -> None:
+        raise NotImplementedError
+
+
+class PandasLoader(BulkLoader):
+    """«Прикладная» вставка: DataFrame.to_sql, т.е. INSERT через executemany."""
+
+    def load(
+        self,
+        engine: Engine,
+        table_name: str,
+        batches: Iterable[DataBatch],
+        rows_per_transaction: int | None = None,
+    ) -> None:
+        with engine.connect() as connection:
+            commit = _CommitCounter(rows_per_transaction)
+            transaction = connection.begin()
+            try:
+                for batch in batches:
+                    # Открытая транзакция не даёт pandas фиксировать каждую порцию
+                    batch.to_frame().to_sql(
+                        table_name,
+                        connection,
+                        if_exists="append",
+                        index=False,
+                    )
+                    if commit.add(len(batch)):
+                        transaction.commit()
+                        transaction = connection.begin()
+                transaction.commit()
+            except Exception:
+                transaction.rollback()
+                raise
+
+
+class ExecuteManyLoader(BulkLoader):
+    """
+    executemany одного параметризованного INSERT напрямую через DBAPI-курсор,
+    без построения DataFrame и ORM-накладных расходов.
+    """
+
+    def load(
+        self,
+        engine: Engine,
+        table_name: str,
+        batches: Iterable[DataBatch],
+        rows_per_transaction: int | None = None,
+    ) -> None:
+        raw_connection = engine.raw_connection()
+        try:
+            self._prepare(raw_connection)
+            with closing(raw_connection.cursor()) as cursor:
+                self._prepare_cursor(cursor)
+                commit = _CommitCounter(rows_per_transaction)
+                statement = bind_names = None
+                for batch in batches:
+                    if statement is None:
+                        statement, bind_names = self._insert_statement(
+                            engine,
+                            table_name,
+                            list(batch.columns),
+                        )
+                    rows = _rows(batch)
+                    if bind_names is not None:
+                        rows = [dict(zip(bind_names, row, strict=True)) for row in rows]
+                    cursor.executemany(statement, rows)
+                    if commit.add(len(batch)):
+                        raw_connection.commit()
+                raw_connection.commit()
+        except Exception:
+            raw_connection.rollback()
+            raise
+        finally:
+            self._restore(raw_connection)
+            raw_connection.close()
+
+    def _prepare(self, raw_connection) -> None:
+        pass
+
+    def _prepare_cursor(self, cursor) -> None:
+        pass
+
+    def _restore(self, raw_connection) -> None:
+        pass
+
+    @staticmethod
+    def _insert_statement(
+        engine: Engine,
+        table_name: str,
+        columns: list[str],
+    ) -> tuple[str, list[str] | None]:
+        """
+        INSERT в paramstyle драйвера (qmark, numeric, format, named, pyformat)
+        – его компилирует сам диалект. Второй элемент – имена параметров для
+        именованных стилей (строки передаются словарями) или None для позиционных.
+        """
+        statement = insert(table(table_name, *(column(c) for c in columns)))
+        compiled = statement.compile(dialect=engine.dialect, column_keys=columns)
+        if engine.dialect.positional:
+            return str(compiled), None
+        escaped = compiled.escaped_bind_names
+        return str(compiled), [escaped.get(c, c) for c in columns]
+
+
+class SQLiteLoader(ExecuteManyLoader):
+    """executemany с ослабленной синхронизацией журнала на время загрузки."""
+
+    _synchronous = None
+    _journal_mode = None
+
+    def _prepare(self, raw_connection) -> None:
+        cursor = raw_connection.cursor()
+        self._synchronous = cursor.execute("PRAGMA synchronous").fetchone()[0]
+        self._journal_mode = cursor.execute("PRAGMA journal_mode").fetchone()[0]
+        cursor.execute("PRAGMA synchronous = OFF")
+        cursor.execute("PRAGMA journal_mode = MEMORY")
+        cursor.close()
+
+    def _restore(self, raw_connection) -> None:
+        if self._synchronous is None:
+            return
+        cursor = raw_connection.cursor()
+        cursor.execute(f"PRAGMA synchronous = {self._synchronous}")
+        cursor.execute(f"PRAGMA journal_mode = {self._journal_mode}")
+        cursor.close()
+
+
+class MySQLLoader(ExecuteManyLoader):
+    """
+    Многострочный INSERT ... VALUES (...), (...): PyMySQL сам склеивает executemany
+    в пакеты до max_allowed_packet. LOAD DATA LOCAL INFILE не используется –
+    он требует файла на диске и local_infile на сервере.
+    """
+
+
+class MSSQLLoader(ExecuteManyLoader):
+    """pyodbc fast_executemany: параметры передаются массивом за один round trip."""
+
+    def _prepare_cursor(self, cursor) -> None:
+        if hasattr(cursor, "fast_executemany"):
+            cursor.fast_executemany = True
+
+
+class PostgresCopyLoader(BulkLoader):
+    """COPY ... FROM STDIN в формате CSV из буфера в памяти (psycopg 3 или psycopg2)."""
+
+    def load(
+        self,
+        engine: Engine,
+        table_name: str,
+        batches: Iterable[DataBatch],
+        rows_per_transaction: int | None = None,
+    ) -> None:
+        quote = engine.dialect.identifier_preparer.quote
+        raw_connection = engine.raw_connection()
+        try:
+            with closing(raw_connection.cursor()) as cursor:
+                commit = _CommitCounter(rows_per_transaction)
+                for batch in batches:
+                    statement = (
+                        f"COPY {quote(table_name)} "
+                        f"({', '.join(quote(c) for c in batch.columns)}) "
+                        "FROM STDIN WITH (FORMAT csv)"
+                    )
+                    buffer = io.StringIO()
+                    batch.to_frame().to_csv(buffer, index=False, header=False)
+                    if hasattr(cursor, "copy_expert"):  # psycopg2
+                        buffer.seek(0)
+                        cursor.copy_expert(statement, buffer)
+                    else:  # psycopg 3
+                        with cursor.copy(statement) as copy:
+                            copy.write(buffer.getvalue())
+                    if commit.add(len(batch)):
+                        raw_connection.commit()
+                raw_connection.commit()
+        except Exception:
+            raw_connection.rollback()
+            raise
+        finally:
+            raw_connection.close()
+
+
+BULK_LOADERS: dict[str, type[BulkLoader]] = {
+    "postgresql": PostgresCopyLoader,
+    "mysql": MySQLLoader,
+    "mariadb": MySQLLoader,
+    "sqlite": SQLiteLoader,
+    "mssql": MSSQLLoader,
+}
+
+
+def get_bulk_loader(dialect_name: str, method: InsertMethod) -> BulkLoader:
+    """
+    InsertMethod.app – вставка так, как это делает типичное приложение (pandas.to_sql),
+    InsertMethod.bulk – самый быстрый доступный путь загрузки для диалекта.
+    """
+    if method == InsertMethod.app:
+        return PandasLoader()
+    loader_cls = BULK_LOADERS.get(dialect_name, ExecuteManyLoader)
+    logger.info(f"Массовая загрузка для {dialect_name}: {loader_cls.__name__}")
+    return loader_cls()
+
+
+class _CommitCounter:
+    """Считает строки в текущей транзакции и сообщает, когда пора фиксировать."""
+
+    def __init__(self, rows_per_transaction: int | None) -> None:
+        self.rows_per_transaction = rows_per_transaction
+        self.rows = 0
+
+    def add(self, rows: int) -> bool:
+        self.rows += rows
+        if not self.rows_per_transaction or self.rows >= self.rows_per_transaction:
+            self.rows = 0
+            return True
+        return False
+
+
+def _rows(batch: DataBatch) -> list[tuple]:
+    return list(zip(*(column.tolist() for column in batch.columns.values()), strict=True))
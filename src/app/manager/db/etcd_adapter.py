@@ -3,14 +3,17 @@ import time
 from typing import Any
 
 import etcd3
-import pandas as pd
 from src.app.config.log import get_logger
 from src.app.core.scenario_steps import CreateTableStep, InsertDataStep, QueryStep
-from src.app.manager.db.base_adapter import BaseAdapter
-from src.app.manager.db.utils import generate_csv
+from src.app.manager.db.base_adapter import BaseAdapter, effective_insert_params
+from src.app.manager.db.utils import generate_batches
 
 logger = get_logger(__name__)
 
+# etcd по умолчанию ограничивает транзакцию 128 операциями (--max-txn-ops)
+MAX_TXN_OPS = 128
+DEFAULT_TXN_OPS = 120
+
 
 class EtcdAdapter(BaseAdapter):
     """
@@ -19,6 +22,8 @@ class EtcdAdapter(BaseAdapter):
     схему – в <table>:schema.
     """
 
+    _connection_attrs = ("client",)
+
     def __init__(
         self,
         host: str = "localhost",
@@ -52,6 +57,25 @@ class EtcdAdapter(BaseAdapter):
             logger.exception("Ошибка при подключении к etcd: %s", e)
             raise ConnectionError("Не удалось подключиться к etcd.") from e
 
+    def probe(self) -> bool:
+        client = None
+        try:
+            client = etcd3.client(
+                host=self.host,
+                port=self.port,
+                user=self.user,
+                password=self.password,
+                timeout=1,
+            )
+            client.status()
+            return True
+        except Exception as e:  # gRPC ошибки идут как generic Exception
+            logger.debug("etcd ещё не готов: %s", e)
+            return False
+        finally:
+            if client is not None:
+                client.close()
+
     def test_connection(self, retries: int = 5, delay: int = 2) -> bool:
         if not self.client:
             logger.error("etcd client не инициализирован. Сначала вызовите connect().")
@@ -88,35 +112,55 @@ class EtcdAdapter(BaseAdapter):
         self.client.delete_prefix(f"{table_name}:")
         logger.info("Удалён префикс %s:* (таблица очищена).", table_name)
 
+    def truncate_table(self, table_name: str) -> None:
+        """Удаляем только строки row:*, схема остаётся."""
+        self._require_client()
+
+        self.client.delete_prefix(f"{table_name}:row:")
+        logger.info("Удалён префикс %s:row:* (строки таблицы).", table_name)
+
     # ---------- «DML» ----------
-    def insert_data(self, insert_step: InsertDataStep) -> None:
+    def insert_data(
+        self,
+        insert_step: InsertDataStep,
+        row_range: tuple[int, int] | None = None,
+        seed: int | None = None,
+    ) -> dict[str, Any]:
         """
-        CSV-генератор → JSON-объекты → put с префиксом row:<idx>.
-        Используем batch через transact() для ускорения.
+        Генератор порций → JSON-объекты → put с префиксом row:<idx>.
+        Каждая пачка – одна transaction(), поэтому её размер ограничен MAX_TXN_OPS.
         """
         self._require_client()
-
-        csv_file = generate_csv(insert_step.num_records, insert_step.columns)
-        df = pd.read_csv(csv_file)
-
-        # etcd транзакция ограничена 128 операций. Разобьём на чанки.
-        BATCH = 120
-        for start in range(0, len(df), BATCH):
-            ops = []
-            for idx, row in df.iloc[start : start + BATCH].iterrows():
-                key = f"{insert_step.table_name}:row:{idx}"
-                ops.append(
-                    self.client.transactions.put(
-                        key,
-                        row.to_json(date_format="iso"),
-                    ),
+        params = effective_insert_params(insert_step, DEFAULT_TXN_OPS, MAX_TXN_OPS)
+        params["rows_per_transaction"] = params["batch_size"]
+
+        for batch in generate_batches(
+            insert_step.num_records,
+            insert_step.columns,
+            seed=seed,
+            batch_size=params["batch_size"],
+            row_range=row_range,
+        ):
+            rows = batch.to_frame().to_json(
+                orient="records",
+                lines=True,
+                date_format="iso",
+            )
+            ops = [
+                self.client.transactions.put(
+                    f"{insert_step.table_name}:row:{idx}",
+                    row,
                 )
+                for idx, row in enumerate(rows.splitlines(), start=batch.start)
+            ]
             self.client.transaction(
                 compare=[],
                 success=ops,
                 failure=[],
             )
-        logger.info("Вставлено %d строк(и) в %s.", len(df), insert_step.table_name)
+        start, stop = row_range or (0, insert_step.num_records)
+        logger.info("Вставлено %d строк(и) в %s.", stop - start, insert_step.table_name)
+        return params
 
     # ---------- «SQL» / QueryStep ----------
     def execute_query(self, query_step: QueryStep) -> Any:
@@ -1,18 +1,29 @@
+import asyncio
 import json
 import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
-import pandas as pd
 import redis
+import redis.asyncio
+from src.app.config.config import settings
 from src.app.config.log import get_logger
 from src.app.core.scenario_steps import CreateTableStep, InsertDataStep, QueryStep
-from src.app.manager.db.base_adapter import BaseAdapter
-from src.app.manager.db.utils import generate_csv
+from src.app.manager.db.base_adapter import (
+    AsyncBaseAdapter,
+    BaseAdapter,
+    effective_insert_params,
+)
+from src.app.manager.db.utils import generate_batches
+from src.app.schemas.enums import ConnectionMode
 
 logger = get_logger(__name__)
 
 
 class RedisAdapter(BaseAdapter):
+    _connection_attrs = ("client",)
+
     def __init__(
         self,
         host: str = "localhost",
@@ -43,6 +54,24 @@ class RedisAdapter(BaseAdapter):
             logger.exception("Ошибка при подключении к Redis: %s", e)
             raise ConnectionError("Не удалось подключиться к Redis.") from e
 
+    def probe(self) -> bool:
+        client = redis.Redis(
+            host=self.host,
+            port=self.port,
+            password=self.password,
+            db=self.db,
+            socket_connect_timeout=1,
+            socket_timeout=1,
+        )
+        try:
+            # Во время загрузки RDB/AOF Redis отвечает на PING ошибкой LOADING
+            return bool(client.ping())
+        except redis.RedisError as e:
+            logger.debug("Redis ещё не готов: %s", e)
+            return False
+        finally:
+            client.close()
+
     def test_connection(self, retries: int = 5, delay: int = 2) -> bool:
         if not self.client:
             logger.error("Redis client не инициализирован ‒ вызовите connect().")
@@ -81,18 +110,48 @@ class RedisAdapter(BaseAdapter):
         pipe.execute()
         logger.info("Таблица %s удалена (с ключами row:*).", table_name)
 
-    def insert_data(self, insert_step: InsertDataStep) -> None:
+    def truncate_table(self, table_name: str) -> None:
+        """Удаляем строки table_name:row:*, схема остаётся."""
         self._require_client()
 
-        csv_file = generate_csv(insert_step.num_records, insert_step.columns)
-        df = pd.read_csv(csv_file)
-
         pipe = self.client.pipeline()
-        for idx, row in df.iterrows():
-            key = f"{insert_step.table_name}:row:{idx}"
-            pipe.hset(key, mapping=row.astype(str).to_dict())
+        for k in self.client.scan_iter(match=f"{table_name}:row:*"):
+            pipe.delete(k)
         pipe.execute()
-        logger.info("Вставлено %d строк(и) в %s.", len(df), insert_step.table_name)
+        logger.info("Таблица %s очищена (ключи row:*).", table_name)
+
+    def insert_data(
+        self,
+        insert_step: InsertDataStep,
+        row_range: tuple[int, int] | None = None,
+        seed: int | None = None,
+    ) -> dict[str, Any]:
+        """
+        Каждая пачка – один pipeline в MULTI/EXEC, поэтому транзакция
+        в Redis всегда равна пачке.
+        """
+        self._require_client()
+        params = effective_insert_params(insert_step, settings.DATA_CHUNK_SIZE)
+        params["rows_per_transaction"] = params["batch_size"]
+
+        for batch in generate_batches(
+            insert_step.num_records,
+            insert_step.columns,
+            seed=seed,
+            batch_size=params["batch_size"],
+            row_range=row_range,
+        ):
+            names = list(batch.columns)
+            values = [col.astype(str).tolist() for col in batch.columns.values()]
+
+            pipe = self.client.pipeline()
+            for idx, row in enumerate(zip(*values), start=batch.start):
+                key = f"{insert_step.table_name}:row:{idx}"
+                pipe.hset(key, mapping=dict(zip(names, row)))
+            pipe.execute()
+        start, stop = row_range or (0, insert_step.num_records)
+        logger.info("Вставлено %d строк(и) в %s.", stop - start, insert_step.table_name)
+        return params
 
     def execute_query(self, query_step: QueryStep) -> Any:
         """
@@ -122,6 +181,116 @@ class RedisAdapter(BaseAdapter):
             )
             raise
 
+    def async_adapter(self) -> "AsyncRedisAdapter":
+        return AsyncRedisAdapter(
+            host=self.host,
+            port=self.port,
+            db=self.db,
+            password=self.password,
+        )
+
     def _require_client(self) -> None:
         if not self.client:
             raise ConnectionError("Redis client не создан: вызовите connect().")
+
+
+class AsyncRedisAdapter(AsyncBaseAdapter):
+    """
+    Асинхронный двойник RedisAdapter на redis.asyncio. Режимы соединений:
+    pooled – общий клиент с пулом до max_connections соединений; persistent –
+    max_connections клиентов с одним соединением, каждое одновременно
+    выполняемое задание держит свой; null – новое соединение на каждый запрос.
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: str | None = None,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.password = password
+        self.db = db
+        self.client: redis.asyncio.Redis | None = None
+        self._persistent: list[redis.asyncio.Redis] = []
+        self._free_persistent: asyncio.Queue | None = None
+
+    async def connect(
+        self,
+        max_connections: int | None = None,
+        connection_mode: ConnectionMode = ConnectionMode.pooled,
+    ) -> None:
+        try:
+            if connection_mode == ConnectionMode.persistent:
+                await self._open_persistent(max_connections or 1)
+            elif connection_mode == ConnectionMode.null:
+                # Только проверка доступности: соединения открываются на каждый запрос
+                async with self._single_connection() as client:
+                    await client.ping()
+            else:
+                self.client = self._new_client(max_connections=max_connections)
+                await self.client.ping()
+        except redis.RedisError as e:
+            logger.exception("Ошибка при подключении к Redis (asyncio): %s", e)
+            await self.close()
+            raise ConnectionError("Не удалось подключиться к Redis.") from e
+
+    async def execute_query(self, query_step: QueryStep) -> Any:
+        cmd_line = query_step.query.strip()
+        if not cmd_line:
+            return None
+        command, *args = cmd_line.split()
+        async with self._client() as client:
+            return await client.execute_command(command, *args)
+
+    async def close(self) -> None:
+        for client in self._persistent:
+            await client.aclose()
+        self._persistent = []
+        self._free_persistent = None
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+
+    def _new_client(self, **kwargs) -> redis.asyncio.Redis:
+        return redis.asyncio.Redis(
+            host=self.host,
+            port=self.port,
+            password=self.password,
+            db=self.db,
+            decode_responses=True,
+            **kwargs,
+        )
+
+    async def _open_persistent(self, count: int) -> None:
+        self._free_persistent = asyncio.Queue()
+        for _ in range(count):
+            client = self._new_client(single_connection_client=True)
+            self._persistent.append(client)
+            await client.ping()
+            self._free_persistent.put_nowait(client)
+
+    @asynccontextmanager
+    async def _single_connection(self) -> AsyncIterator[redis.asyncio.Redis]:
+        client = self._new_client(single_connection_client=True)
+        try:
+            yield client
+        finally:
+            await client.aclose()
+
+    @asynccontextmanager
+    async def _client(self) -> AsyncIterator[redis.asyncio.Redis]:
+        """Клиент для одного запроса в режиме, выбранном при подключении."""
+        if self._free_persistent is not None:
+            client = await self._free_persistent.get()
+            try:
+                yield client
+            finally:
+                self._free_persistent.put_nowait(client)
+        elif self.client is not None:
+            yield self.client
+        else:
+            async with self._single_connection() as client:
+                yield client
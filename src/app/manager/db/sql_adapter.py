@@ -1,11 +1,17 @@
+import asyncio
+import threading
 import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
 from functools import wraps
 from typing import Any
 
-import pandas as pd
 from sqlalchemy import (
     Column,
+    Connection,
     MetaData,
+    NullPool,
+    QueuePool,
     String,
     Table,
     Text,
@@ -13,15 +19,32 @@ from sqlalchemy import (
     text,
 )
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from src.app.config.config import settings
 from src.app.config.log import get_logger
+from src.app.core.latency import LatencyRecorder
 from src.app.core.scenario_steps import CreateTableStep, InsertDataStep, QueryStep
-from src.app.manager.db.base_adapter import BaseAdapter
-from src.app.manager.db.utils import generate_csv
-from src.app.schemas.enums import sql_type_mapping
+from src.app.manager.db.base_adapter import (
+    AsyncBaseAdapter,
+    BaseAdapter,
+    effective_insert_params,
+)
+from src.app.manager.db.bulk_loader import get_bulk_loader
+from src.app.manager.db.utils import generate_batches
+from src.app.schemas.enums import ConnectionMode, sql_type_mapping
 
 logger = get_logger(__name__)
 
+# Асинхронный драйвер по умолчанию для каждого диалекта
+ASYNC_DRIVERS = {
+    "postgresql": "asyncpg",
+    "mysql": "aiomysql",
+    "sqlite": "aiosqlite",
+}
+# Драйверы, которые сами умеют работать в асинхронном режиме
+ASYNC_CAPABLE_DRIVERS = {"asyncpg", "psycopg", "aiomysql", "asyncmy", "aiosqlite"}
+
 
 def require_engine(method):
     @wraps(method)
@@ -35,6 +58,15 @@ def require_engine(method):
 
 
 class SQLAdapter(BaseAdapter):
+    _connection_attrs = (
+        "engine",
+        "null_engine",
+        "Session",
+        "_pool_wait",
+        "_local",
+        "_persistent",
+    )
+
     def __init__(
         self,
         db_type: str,
@@ -54,15 +86,60 @@ class SQLAdapter(BaseAdapter):
         self.port = port or 0
         self.db_name = db_name or ""
         self.engine = None
+        self.null_engine = None  # подключение на каждый запрос (ConnectionMode.null)
         self.Session = None
         self.metadata = MetaData()
+        self._pool_wait: LatencyRecorder | None = None
+        # Соединения потоков в режиме ConnectionMode.persistent
+        self._local = None
+        self._persistent: list[Connection] = []
 
-    def connect(self, **kwargs) -> None:
+    def connect(self, max_connections: int | None = None, **kwargs) -> None:
         """
         Создаёт движок (engine) с помощью SQLAlchemy и проверяет подключение.
+        Пул соединений рассчитан ровно на max_connections одновременных операций
+        и заранее прогрет, чтобы потоки нагрузки не ждали в очереди пула.
         """
+        db_url = self.db_url()
+
+        try:
+            self.engine = create_engine(db_url, **self._pool_kwargs(max_connections))
+            self.null_engine = create_engine(db_url, poolclass=NullPool)
+            self.Session = sessionmaker(bind=self.engine)
+            self._local = threading.local()
+            self._persistent = []
+            logger.info(f"Создан движок для {db_url}")
+        except SQLAlchemyError as e:
+            logger.exception(f"Ошибка при создании engine: {e}")
+            raise
+
+        # Готовность СУБД проверена заранее (wait_for_database), хватает одной попытки
+        if not self.test_connection(retries=1):
+            msg = f"Не удалось подключиться к базе {db_url}."
+            raise ConnectionError(msg)
+        self._prewarm(max_connections)
+
+    def _pool_kwargs(self, max_connections: int | None) -> dict[str, Any]:
+        # In-memory SQLite живёт в одном соединении – пул не настраиваем
+        if not max_connections or self.db_name in ("", ":memory:"):
+            return {}
+        return {"pool_size": max_connections, "max_overflow": 0}
+
+    def _prewarm(self, max_connections: int | None) -> None:
+        """Открывает все соединения пула заранее и возвращает их в пул."""
+        if not max_connections or not isinstance(self.engine.pool, QueuePool):
+            return
+        connections = [self.engine.connect() for _ in range(max_connections)]
+        for connection in connections:
+            connection.close()
+        logger.info(f"Пул соединений прогрет: {max_connections} соединений.")
+
+    def db_url(self, driver: str | None = None) -> str:
+        """URL подключения; driver переопределяет драйвер из конфигурации."""
         # Формируем db_scheme
-        if "+" in self.db_type or self.driver:
+        if driver:
+            db_scheme = f"{self.db_type.split('+')[0]}+{driver}"
+        elif "+" in self.db_type or self.driver:
             db_scheme = self.db_type
             if self.driver and "+" not in db_scheme:
                 db_scheme = f"{self.db_type}+{self.driver}"
@@ -71,22 +148,30 @@ class SQLAdapter(BaseAdapter):
 
         # Формируем URL подключения
         if self.db_type.startswith("sqlite"):
-            db_url = f"sqlite:///{self.db_name}"
-        else:
-            db_url = f"{db_scheme}://{self.username}:{self.password}@{self.host}:{self.port}/{self.db_name}"
+            return f"{db_scheme if driver else 'sqlite'}:///{self.db_name}"
+        return f"{db_scheme}://{self.username}:{self.password}@{self.host}:{self.port}/{self.db_name}"
+
+    def async_adapter(self) -> "AsyncSQLAdapter":
+        base_type = self.db_type.split("+")[0]
+        driver = self.db_type.split("+")[1] if "+" in self.db_type else self.driver
+        if driver not in ASYNC_CAPABLE_DRIVERS:
+            driver = ASYNC_DRIVERS.get(base_type)
+        if driver is None:
+            msg = f"Асинхронный драйвер для {base_type} не настроен."
+            raise NotImplementedError(msg)
+        return AsyncSQLAdapter(self.db_url(driver=driver))
 
+    def probe(self) -> bool:
+        engine = create_engine(self.db_url(), poolclass=NullPool)
         try:
-            self.engine = create_engine(db_url)
-            self.Session = sessionmaker(bind=self.engine)
-            logger.info(f"Создан движок для {db_url}")
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+            return True
         except SQLAlchemyError as e:
-            logger.exception(f"Ошибка при создании engine: {e}")
-            raise
-
-        time.sleep(2)
-        if not self.test_connection():
-            msg = f"Не удалось подключиться к базе {db_url}."
-            raise ConnectionError(msg)
+            logger.debug(f"СУБД ещё не готова: {e}")
+            return False
+        finally:
+            engine.dispose()
 
     @require_engine
     def test_connection(self, retries: int = 6, delay: int = 2) -> bool:
@@ -98,7 +183,8 @@ class SQLAdapter(BaseAdapter):
                 return True
             except SQLAlchemyError as e:
                 logger.warning(f"Ошибка при подключении (попытка {attempt}): {e}")
-                time.sleep(delay)
+                if attempt < retries:
+                    time.sleep(delay)
 
         logger.error(f"Не удалось подключиться к базе за {retries} попыток.")
         return False
@@ -146,25 +232,175 @@ class SQLAdapter(BaseAdapter):
         table.drop(self.engine, checkfirst=True)
         logger.info(f"Таблица {table_name} удалена (если существовала).")
 
+    @require_engine
+    def truncate_table(self, table_name: str) -> None:
+        quoted = self.engine.dialect.identifier_preparer.quote(table_name)
+        if self.engine.dialect.name == "sqlite":
+            statement = f"DELETE FROM {quoted}"  # в SQLite нет TRUNCATE
+        else:
+            statement = f"TRUNCATE TABLE {quoted}"
+        with self.engine.begin() as connection:
+            connection.execute(text(statement))
+        logger.info(f"Таблица {table_name} очищена.")
+
     @require_engine
     def insert_data(
         self,
         insert_step: InsertDataStep,
-    ) -> None:
+        row_range: tuple[int, int] | None = None,
+        seed: int | None = None,
+    ) -> dict[str, Any]:
         table_name = insert_step.table_name
         columns = insert_step.columns
         num_records = insert_step.num_records
+        params = effective_insert_params(insert_step, settings.DATA_CHUNK_SIZE)
 
-        csv_file = generate_csv(num_records, columns)
-        df = pd.read_csv(csv_file)
-
-        df.to_sql(table_name, self.engine, if_exists="append", index=False)
+        loader = get_bulk_loader(self.engine.dialect.name, insert_step.insert_method)
+        loader.load(
+            self.engine,
+            table_name,
+            generate_batches(
+                num_records,
+                columns,
+                seed=seed,
+                batch_size=params["batch_size"],
+                row_range=row_range,
+            ),
+            rows_per_transaction=params["rows_per_transaction"],
+        )
         logger.info(f"Данные вставлены в таблицу {table_name}.")
+        return params
 
     @require_engine
     def execute_query(self, query_step: QueryStep) -> Any:
         query = query_step.query
-        with self.engine.connect() as connection:
+        with self._connection(query_step.connection_mode) as connection:
             result = connection.execute(text(query))
         logger.info(f"Запрос выполнен: {query}")
         return result
+
+    def track_pool_wait(self) -> LatencyRecorder:
+        self._pool_wait = LatencyRecorder()
+        return self._pool_wait
+
+    def release_connections(self) -> None:
+        for connection in self._persistent:
+            connection.close()
+        self._persistent = []
+        self._local = threading.local()
+
+    @contextmanager
+    def _connection(self, mode: ConnectionMode) -> Iterator[Connection]:
+        """Соединение для запроса в заданном режиме с замером ожидания."""
+        started = time.perf_counter()
+        if mode == ConnectionMode.persistent:
+            connection = getattr(self._local, "connection", None)
+            if connection is None:
+                connection = self.engine.connect()
+                self._local.connection = connection
+                self._persistent.append(connection)
+            self._record_pool_wait(started)
+            try:
+                yield connection
+            finally:
+                # Не держим транзакцию открытой между запросами
+                connection.rollback()
+            return
+
+        engine = self.null_engine if mode == ConnectionMode.null else self.engine
+        with engine.connect() as connection:
+            self._record_pool_wait(started)
+            yield connection
+
+    def _record_pool_wait(self, started: float) -> None:
+        if self._pool_wait is not None:
+            self._pool_wait.record(time.perf_counter() - started)
+
+
+class AsyncSQLAdapter(AsyncBaseAdapter):
+    """
+    Асинхронный двойник SQLAdapter на движке SQLAlchemy asyncio. В режиме
+    persistent при подключении открывается max_connections соединений, и каждое
+    одновременно выполняемое задание (воркер закрытой модели или слот открытой)
+    держит своё соединение, не возвращая его в пул движка.
+    """
+
+    def __init__(self, db_url: str) -> None:
+        self.db_url = db_url
+        self.engine: AsyncEngine | None = None
+        self._pool_wait: LatencyRecorder | None = None
+        self._persistent: list[AsyncConnection] = []
+        self._free_persistent: asyncio.Queue | None = None
+
+    async def connect(
+        self,
+        max_connections: int | None = None,
+        connection_mode: ConnectionMode = ConnectionMode.pooled,
+    ) -> None:
+        engine_kwargs = {}
+        if connection_mode == ConnectionMode.null:
+            engine_kwargs = {"poolclass": NullPool}
+        elif max_connections and not self.db_url.startswith("sqlite"):
+            engine_kwargs = {"pool_size": max_connections, "max_overflow": 0}
+        try:
+            self.engine = create_async_engine(self.db_url, **engine_kwargs)
+            async with self.engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+            if connection_mode == ConnectionMode.persistent:
+                await self._open_persistent(max_connections or 1)
+        except ImportError as e:
+            msg = (
+                f"Не установлен асинхронный драйвер для {self.db_url}: {e}. "
+                "Установите зависимости движка asyncio: poetry install --extras async"
+            )
+            raise ConnectionError(msg) from e
+        except SQLAlchemyError as e:
+            logger.exception(f"Ошибка при создании асинхронного engine: {e}")
+            msg = f"Не удалось подключиться к базе {self.db_url} в асинхронном режиме."
+            raise ConnectionError(msg) from e
+        logger.info(f"Создан асинхронный движок для {self.db_url}")
+
+    async def execute_query(self, query_step: QueryStep) -> Any:
+        async with self._connection() as connection:
+            return await connection.execute(text(query_step.query))
+
+    def track_pool_wait(self) -> LatencyRecorder:
+        self._pool_wait = LatencyRecorder()
+        return self._pool_wait
+
+    async def _open_persistent(self, count: int) -> None:
+        self._free_persistent = asyncio.Queue()
+        for _ in range(count):
+            connection = await self.engine.connect()
+            self._persistent.append(connection)
+            self._free_persistent.put_nowait(connection)
+
+    @asynccontextmanager
+    async def _connection(self) -> AsyncIterator[AsyncConnection]:
+        started = time.perf_counter()
+        if self._free_persistent is not None:
+            connection = await self._free_persistent.get()
+            self._record_pool_wait(started)
+            try:
+                yield connection
+            finally:
+                # Не держим транзакцию открытой между запросами
+                await connection.rollback()
+                self._free_persistent.put_nowait(connection)
+            return
+
+        async with self.engine.connect() as connection:
+            self._record_pool_wait(started)
+            yield connection
+
+    def _record_pool_wait(self, started: float) -> None:
+        if self._pool_wait is not None:
+            self._pool_wait.record(time.perf_counter() - started)
+
+    async def close(self) -> None:
+        for connection in self._persistent:
+            await connection.close()
+        self._persistent = []
+        self._free_persistent = None
+        if self.engine is not None:
+            await self.engine.dispose()
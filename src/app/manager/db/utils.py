@@ -1,71 +1,251 @@
 import string
+from collections.abc import Iterator
+from dataclasses import dataclass
 
 import numpy as np
 import pandas as pd
+from src.app.config.config import settings
 from src.app.config.log import get_logger
 from src.app.core.scenario_steps import ColumnDefinition
-from src.app.schemas.enums import DataType
+from src.app.schemas.enums import DataType, KeyOrder
 
 logger = get_logger(__name__)
 
+STR_ALPHABETS = {
+    "letters": string.ascii_letters,
+    "lower": string.ascii_lowercase,
+    "digits": string.digits,
+    "alnum": string.ascii_letters + string.digits,
+    "hex": "0123456789abcdef",
+}
 
-def generate_csv(
+
+@dataclass
+class DataBatch:
+    """Порция сгенерированных данных в колоночном виде."""
+
+    start: int  # глобальный номер первой строки порции
+    columns: dict[str, np.ndarray]
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()), ()))
+
+    @property
+    def stop(self) -> int:
+        return self.start + len(self)
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.columns, copy=False)
+
+    def split(self, size: int) -> Iterator["DataBatch"]:
+        """Делит порцию на части по size строк (срезы без копирования)."""
+        for offset in range(0, len(self), size):
+            yield DataBatch(
+                start=self.start + offset,
+                columns={
+                    col: values[offset : offset + size]
+                    for col, values in self.columns.items()
+                },
+            )
+
+
+class KeyPermutation:
+    """
+    Псевдослучайная биекция [0, n) → [0, n): сбалансированная сеть Фейстеля
+    на 2k битах (2^2k >= n) с cycle walking для значений за пределами n.
+    Ключ i вычисляется независимо от остальных, память – O(размер порции).
+    """
+
+    ROUNDS = 4
+
+    def __init__(self, n: int, seed: int | None = None) -> None:
+        self.n = n
+        bits = max(2, (n - 1).bit_length())
+        bits += bits % 2
+        self._half_bits = np.uint64(bits // 2)
+        self._half_mask = np.uint64((1 << (bits // 2)) - 1)
+        self._round_keys = np.random.default_rng(seed).integers(
+            0,
+            np.iinfo(np.int64).max,
+            size=self.ROUNDS,
+            dtype=np.uint64,
+        )
+
+    def __call__(self, indices: np.ndarray) -> np.ndarray:
+        values = self._encrypt(indices.astype(np.uint64))
+        out_of_range = values >= self.n
+        while out_of_range.any():
+            values[out_of_range] = self._encrypt(values[out_of_range])
+            out_of_range = values >= self.n
+        return values.astype(np.int64)
+
+    def _encrypt(self, values: np.ndarray) -> np.ndarray:
+        left = values >> self._half_bits
+        right = values & self._half_mask
+        for key in self._round_keys:
+            left, right = right, left ^ self._round(right, key)
+        return (left << self._half_bits) | right
+
+    def _round(self, values: np.ndarray, key: np.uint64) -> np.ndarray:
+        # splitmix64-перемешивание половины блока с ключом раунда
+        x = values * np.uint64(0x9E3779B97F4A7C15) + key
+        x ^= x >> np.uint64(31)
+        x *= np.uint64(0xBF58476D1CE4E5B9)
+        x ^= x >> np.uint64(29)
+        return x & self._half_mask
+
+
+class UniqueKeys:
+    """Уникальные ключи [0, n) в заданном порядке, вычисляемые по диапазонам строк."""
+
+    def __init__(
+        self,
+        n: int,
+        order: KeyOrder = KeyOrder.random,
+        cluster_size: int = 1000,
+        seed: int | None = None,
+    ) -> None:
+        self.n = n
+        self.order = KeyOrder(order)
+        self.cluster_size = max(1, cluster_size)
+        if self.order == KeyOrder.random:
+            self._permutation = KeyPermutation(n, seed)
+        elif self.order == KeyOrder.clustered:
+            # Переставляем только полные серии, неполный хвост остаётся на месте
+            self._permutation = KeyPermutation(n // self.cluster_size, seed)
+
+    def __call__(self, start: int, stop: int) -> np.ndarray:
+        positions = np.arange(start, stop, dtype=np.int64)
+        if self.order == KeyOrder.sequential:
+            return positions
+        if self.order == KeyOrder.reversed:
+            return self.n - 1 - positions
+        if self.order == KeyOrder.random:
+            return self._permutation(positions)
+
+        clusters, offsets = np.divmod(positions, self.cluster_size)
+        keys = positions.copy()
+        full = clusters < self._permutation.n
+        keys[full] = self._permutation(clusters[full]) * self.cluster_size + offsets[full]
+        return keys
+
+
+def generate_batches(
     num_records: int,
     data_types: dict[str, ColumnDefinition],
-    file_name: str = "test_data_file.csv",
-) -> str:
-    data = {
-        col: _generate_column_values(
-            col_definition.data_type,
+    chunk_size: int | None = None,
+    seed: int | None = None,
+    batch_size: int | None = None,
+    row_range: tuple[int, int] | None = None,
+) -> Iterator[DataBatch]:
+    """
+    Генерирует данные порциями по chunk_size строк, не записывая их на диск.
+    Пиковое потребление памяти ограничено размером порции, а не num_records.
+    Если задан batch_size, порции отдаются частями по batch_size строк –
+    генерация при этом остаётся крупными порциями.
+    row_range ограничивает генерацию строками [start, stop) из num_records:
+    при одинаковом seed непересекающиеся диапазоны дают непересекающиеся ключи.
+    """
+    chunk_size = max(1, chunk_size or settings.DATA_CHUNK_SIZE, batch_size or 0)
+    batch_size = batch_size or chunk_size
+    rng = np.random.default_rng(seed)
+    unique_keys = {
+        col: UniqueKeys(
             num_records,
-            unique=col_definition.primary_key,
+            order=col_definition.key_order,
+            cluster_size=col_definition.cluster_size,
+            seed=int(rng.integers(np.iinfo(np.int64).max)),
         )
         for col, col_definition in data_types.items()
+        if col_definition.primary_key
     }
-    test_data_df = pd.DataFrame(data)
-    test_data_df.to_csv(file_name, index=False)
 
-    logger.info(f"CSV file {file_name} with {num_records} records generated.")
-    return file_name
+    range_start, range_stop = row_range or (0, num_records)
+    for start in range(range_start, range_stop, chunk_size):
+        stop = min(start + chunk_size, range_stop)
+        chunk = DataBatch(
+            start=start,
+            columns={
+                col: _generate_column_values(
+                    col_definition,
+                    stop - start,
+                    keys=unique_keys[col](start, stop) if col in unique_keys else None,
+                )
+                for col, col_definition in data_types.items()
+            },
+        )
+        yield from chunk.split(batch_size)
+
+    logger.info(
+        f"Сгенерировано {range_stop - range_start} записей порциями по {chunk_size}.",
+    )
 
 
-def _generate_column_values(dt: str, num_records: int, *, unique: bool):
+def _generate_column_values(
+    col_definition: ColumnDefinition,
+    num_records: int,
+    keys: np.ndarray | None = None,
+):
+    """keys – уникальные ключи порции для колонок primary_key, иначе None."""
+    dt = col_definition.data_type
+    unique = keys is not None
     if dt == DataType.int:
         if unique:
-            return np.random.choice(
-                np.arange(num_records + 1),
-                size=num_records,
-                replace=False,
-            )
+            return keys
         return np.random.randint(0, 1000000, size=num_records)
     if dt == DataType.float:
         if unique:
-            return np.random.choice(
-                np.arange(num_records + 1),
-                size=num_records,
-                replace=False,
-            ).astype(np.float64)
+            return keys.astype(np.float64)
         return np.random.uniform(0, 1000000, size=num_records)
     if dt == DataType.bool:
         return np.random.choice([True, False], size=num_records)
     if dt == DataType.date:
         if unique:
-            return (
-                pd.date_range(
-                    start=pd.Timestamp("today"),
-                    periods=num_records,
-                    freq="D",
-                )
-                .strftime("%Y-%m-%d")
-                .tolist()
-            )
+            today = np.datetime64(pd.Timestamp("today").date(), "D")
+            return np.datetime_as_string(today + keys, unit="D")
         return np.full(num_records, pd.Timestamp("today").strftime("%Y-%m-%d"))
     if dt == DataType.str:
         if unique:
-            return np.char.add("str_", np.arange(num_records).astype(str))
-        letters = np.array(list(string.ascii_letters))
-        indices = np.random.randint(0, len(letters), size=(num_records, 10))
-        return np.apply_along_axis(lambda row: "".join(row), 1, letters[indices])
-    letters = np.array(list(string.ascii_letters))
-    indices = np.random.randint(0, len(letters), size=(num_records, 10))
-    return np.apply_along_axis(lambda row: "".join(row), 1, letters[indices])
+            return np.char.add("str_", keys.astype(str))
+    return _random_strings(
+        num_records,
+        col_definition.str_length,
+        col_definition.str_min_length,
+        col_definition.alphabet,
+    )
+
+
+def _random_strings(
+    num_records: int,
+    length: int = 10,
+    min_length: int | None = None,
+    alphabet: str = "letters",
+) -> np.ndarray:
+    """
+    Векторная генерация случайных строк: заполняем байтовый буфер (num_records, length)
+    символами алфавита и смотрим на него как на массив S<length>.
+    Хвост строк короче length обнуляется – numpy отбрасывает завершающие нули.
+    """
+    if length < 1:
+        msg = f"Длина строки должна быть положительной: {length}"
+        raise ValueError(msg)
+
+    chars = STR_ALPHABETS.get(alphabet, alphabet)
+    if not chars or not chars.isascii() or "\0" in chars:
+        msg = f"Алфавит должен быть непустой ASCII-строкой без NUL: {alphabet!r}"
+        raise ValueError(msg)
+    charset = np.frombuffer(chars.encode("ascii"), dtype=np.uint8)
+
+    indices = np.random.randint(
+        0,
+        len(charset),
+        size=(num_records, length),
+        dtype=np.uint8,
+    )
+    buffer = charset[indices]
+
+    if min_length is not None and min_length < length:
+        lengths = np.random.randint(max(min_length, 0), length + 1, size=num_records)
+        buffer[np.arange(length) >= lengths[:, None]] = 0
+
+    return buffer.view(f"S{length}").ravel().astype(f"U{length}")
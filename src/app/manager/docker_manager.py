@@ -1,6 +1,7 @@
 import threading
 import time
-from dataclasses import dataclass
+from collections import defaultdict
+from dataclasses import dataclass, field
 from urllib.parse import urlparse
 
 import docker
@@ -8,33 +9,70 @@ from docker.errors import DockerException, NotFound
 from docker.models.containers import Container
 from docker.models.images import Image
 from src.app.config.log import get_logger
-from src.app.schemas.schema import DockerHostConfig
+from src.app.core.resource_series import IO_COUNTER_FIELDS, ResourceSeries
+from src.app.manager.cgroup_stats import CgroupStats
+from src.app.manager.readiness import wait_until
+from src.app.schemas.enums import PullPolicy
+from src.app.schemas.schema import ContainerResources, DockerHostConfig
 
 logger = get_logger(__name__)
 
+# Дайджесты образов, уже подготовленных в этом процессе: (Docker-хост, образ) -> дайджест.
+# Запуски матрицы с одним образом не обращаются к Docker повторно и не качают его дважды.
+_image_digests: dict[tuple[str, str], str] = {}
+_image_locks: defaultdict[tuple[str, str], threading.Lock] = defaultdict(threading.Lock)
+_image_locks_guard = threading.Lock()
+
 
 @dataclass
 class PeakStats:
     max_mem: int = 0  # максимальное значение memory_stats.usage (байт)
     max_cpu_percent: float = 0.0  # максимальный CPU% за интервал
+    series: ResourceSeries = field(default_factory=ResourceSeries)  # все отсчёты
+    # Счётчики ввода-вывода в первом и последнем отсчёте шага
+    io_start: dict[str, float] = field(default_factory=dict)
+    io_end: dict[str, float] = field(default_factory=dict)
 
     @property
     def max_mem_mb(self) -> float:
         """Возвращает max_mem в мегабайтах."""
         return self.max_mem / 1024 / 1024
 
+    def add_sample(self, **sample: float) -> None:
+        """Записывает отсчёт во временной ряд и обновляет счётчики ввода-вывода."""
+        self.series.append(**sample)
+        counters = {name: sample.get(name, 0) for name in IO_COUNTER_FIELDS}
+        if not self.io_start:
+            self.io_start = counters
+        self.io_end = counters
+
+    @property
+    def io_delta(self) -> dict[str, int]:
+        """
+        Прирост счётчиков за шаг: байты и операции чтения/записи диска, байты сети.
+        Счётчик, сбросившийся за шаг (перезапуск контейнера), даёт 0.
+        """
+        return {
+            name: max(0, int(self.io_end.get(name, 0) - self.io_start.get(name, 0)))
+            for name in IO_COUNTER_FIELDS
+        }
+
 
 class DockerManager:
     def __init__(
         self,
         host_config: DockerHostConfig | None = None,
         log_fn: callable(str) = None,
+        stats_interval_ms: int | None = None,
         **kwargs,
     ) -> None:
         """
         Инициализация DockerManager.
+        stats_interval_ms – период опроса cgroup контейнера на локальном хосте;
+        None – только поток docker stats (около раза в секунду).
         """
         self._host_config = host_config
+        self._stats_interval_ms = stats_interval_ms
         self._tls_config = None
         self.log_fn = log_fn or (lambda _: None)
         try:
@@ -65,6 +103,7 @@ class DockerManager:
         self._stop_event = threading.Event()
         self._stats_thread: threading.Thread | None = None
         self._peak_stats = PeakStats()
+        self._cgroup_stats: CgroupStats | None = None
 
     def pull_image(self, image_name: str) -> Image | None:
         """
@@ -91,15 +130,69 @@ class DockerManager:
             )
         return None
 
+    def ensure_image(
+        self,
+        image_name: str,
+        policy: PullPolicy = PullPolicy.if_not_present,
+    ) -> str | None:
+        """
+        Готовит образ по политике загрузки и возвращает его дайджест
+        (repo@sha256:… или id локально собранного образа). При if_not_present
+        и never повторный вызов берёт дайджест из кэша процесса без обращений к Docker.
+        """
+        key = (self._docker_url(), image_name)
+        with _image_locks_guard:
+            lock = _image_locks[key]
+        with lock:
+            if policy != PullPolicy.always and key in _image_digests:
+                return _image_digests[key]
+
+            image = None
+            if policy != PullPolicy.always:
+                image = self._local_image(image_name)
+                if image is None and policy == PullPolicy.never:
+                    msg = f"Образа {image_name} нет локально, а загрузка запрещена (never)."
+                    self.send_log(f"❌ {msg}", log_level="error")
+                    raise ValueError(msg)
+            if image is None:
+                image = self.pull_image(image_name)
+            if image is None and policy == PullPolicy.always:
+                # Registry недоступен – работаем с локальной копией, если она есть
+                image = self._local_image(image_name)
+                if image is not None:
+                    self.send_log(
+                        f"⚠️ Не удалось обновить {image_name}, используется локальный образ.",
+                        log_level="warning",
+                    )
+            if image is None:
+                return None
+
+            digest = _image_digest(image, image_name)
+            _image_digests[key] = digest
+            self.send_log(f"📦 Образ {image_name}: {digest}")
+            return digest
+
+    def _local_image(self, image_name: str) -> Image | None:
+        try:
+            return self.client.images.get(image_name)
+        except NotFound:
+            return None
+
+    def _docker_url(self) -> str:
+        return (self._host_config.base_url if self._host_config else None) or "local"
+
     def run_container(
         self,
         image_name: str,
         container_name: str,
         ports: dict | None = None,
         environment: dict | None = None,
+        resources: ContainerResources | None = None,
     ) -> Container | None:
         """
         Запускает контейнер с указанным образом.
+        Порт хоста None в ports – Docker выберет свободный (см. get_host_port);
+        resources – ядра и ограничения CPU и памяти контейнера.
         """
         ports = ports or {}
         try:
@@ -111,6 +204,7 @@ class DockerManager:
                 ports=ports,
                 environment=environment,
                 detach=True,
+                **(resources.run_kwargs() if resources else {}),
             )
             self.wait_for_container_ready(container, ports)
             self.send_log(f"✅ Контейнер {container_name} запущен.")
@@ -180,8 +274,11 @@ class DockerManager:
             self._peak_stats = PeakStats()
             self._stop_event.clear()
 
+            cgroup_stats = self._get_cgroup_stats()
+            if cgroup_stats is not None:
+                cgroup_stats.start()
             self._stats_thread = threading.Thread(
-                target=self._measure_peaks,
+                target=self._measure_cgroup if cgroup_stats else self._measure_stats,
                 args=(self._stop_event,),
                 daemon=True,
             )
@@ -194,9 +291,60 @@ class DockerManager:
             self._stats_thread.join()
         return self._peak_stats
 
-    def _measure_peaks(self, stop_event: threading.Event) -> None:
+    def _get_cgroup_stats(self) -> CgroupStats | None:
         """
-        Слушаем docker stats в режиме stream=True. Отслеживаем максимальное usage и CPU%.
+        Прямой сборщик из cgroup v2, если задан период опроса, Docker локальный
+        и cgroup контейнера доступна; иначе – None (используется docker stats).
+        """
+        if not self._stats_interval_ms or self.get_host() != "localhost" or not self.container:
+            return None
+        if self._cgroup_stats is None or self._cgroup_stats.pid != self._container_pid():
+            self._cgroup_stats = CgroupStats.for_container(
+                self.container.id,
+                pid=self._container_pid(),
+            )
+            if self._cgroup_stats is None:
+                self.send_log(
+                    "⚠️ cgroup v2 контейнера недоступна, метрики – из docker stats.",
+                    log_level="warning",
+                )
+            else:
+                self.send_log(f"📈 Метрики из cgroup: {self._cgroup_stats.cgroup_dir}")
+        return self._cgroup_stats
+
+    def _container_pid(self) -> int | None:
+        return self.container.attrs.get("State", {}).get("Pid") or None
+
+    def _measure_cgroup(self, stop_event: threading.Event) -> None:
+        """
+        Опрашивает cgroup контейнера каждые stats_interval_ms до остановки;
+        последний отсчёт снимается уже после сигнала остановки, поэтому даже
+        короткий шаг получает хотя бы один замер CPU.
+        """
+        cgroup_stats = self._cgroup_stats
+        interval = self._stats_interval_ms / 1000
+        try:
+            while True:
+                stopping = stop_event.is_set()
+                sample = cgroup_stats.sample()
+                usage = sample.pop("usage")
+                peak = sample.pop("peak", usage)
+                self._peak_stats.max_mem = max(usage, peak, self._peak_stats.max_mem)
+                self._peak_stats.max_cpu_percent = max(
+                    sample["cpu_percent"],
+                    self._peak_stats.max_cpu_percent,
+                )
+                self._peak_stats.add_sample(**sample)
+                if stopping:
+                    break
+                stop_event.wait(interval)
+        finally:
+            cgroup_stats.close()
+
+    def _measure_stats(self, stop_event: threading.Event) -> None:
+        """
+        Слушаем docker stats в режиме stream=True. Отслеживаем максимальное usage и CPU%
+        и записываем каждый отсчёт во временной ряд.
         """
         prev_total_usage = None
         prev_system_usage = None
@@ -216,6 +364,7 @@ class DockerManager:
             )  # сколько CPU доступно контейнеру
 
             # Рассчитываем CPU%, если есть предыдущее состояние
+            cpu_percent = 0.0
             if (prev_total_usage is not None) and (prev_system_usage is not None):
                 cpu_delta = total_usage - prev_total_usage
                 system_delta = system_usage - prev_system_usage
@@ -227,6 +376,13 @@ class DockerManager:
                         self._peak_stats.max_cpu_percent,
                     )
 
+            # 3. Отсчёт временного ряда
+            self._peak_stats.add_sample(
+                timestamp=time.time(),
+                cpu_percent=cpu_percent,
+                **_resource_sample(raw),
+            )
+
             # Обновляем «предыдущее» состояние
             prev_total_usage = total_usage
             prev_system_usage = system_usage
@@ -263,26 +419,49 @@ class DockerManager:
         timeout: int = 20,
     ) -> bool:
         """
-        Ожидание готовности контейнера.
+        Ожидание запуска контейнера и публикации его портов; готовность самой
+        СУБД проверяет wait_for_database.
         """
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+
+        def started() -> bool:
             container.reload()
-            if container.status == "running":
-                try:
-                    for port in ports:
-                        if self.client.api.port(container.id, port):
-                            self.send_log(f"✅ Контейнер {container.name} готов.")
-                            return True
-                except DockerException:
-                    pass
-            time.sleep(1)
-
-        self.send_log(
-            f"❌ Контейнер {container.name} не готов в течение {timeout} секунд.",
-            log_level="error",
-        )
-        raise TimeoutError
+            if container.status == "exited":
+                msg = f"Контейнер {container.name} завершился при запуске."
+                raise RuntimeError(msg)
+            if container.status != "running":
+                return False
+            try:
+                return all(self.client.api.port(container.id, port) for port in ports)
+            except DockerException:
+                return False
+
+        try:
+            wait_until(
+                started,
+                time.monotonic() + timeout,
+                description=f"контейнер {container.name}",
+            )
+        except (TimeoutError, RuntimeError):
+            self.send_log(
+                f"❌ Контейнер {container.name} не готов в течение {timeout} секунд.",
+                log_level="error",
+            )
+            raise
+        self.send_log(f"✅ Контейнер {container.name} запущен, порты опубликованы.")
+        return True
+
+    def get_host_port(self, container_port: int) -> int | None:
+        """Порт хоста, на который опубликован порт контейнера; None, если не опубликован."""
+        if not self.container:
+            return None
+        try:
+            bindings = self.client.api.port(self.container.id, container_port)
+        except DockerException:
+            return None
+        for binding in bindings or []:
+            if binding.get("HostPort"):
+                return int(binding["HostPort"])
+        return None
 
     def get_host(self) -> str:
         """
@@ -371,6 +550,58 @@ class DockerManager:
             logger.warning(msg)
 
 
+def _resource_sample(raw: dict) -> dict[str, float]:
+    """Память, блочный и сетевой ввод-вывод и число процессов из отсчёта docker stats."""
+    memory_stats = raw.get("memory_stats", {})
+    mem_details = memory_stats.get("stats", {})
+    # cgroup v1: cache/rss, cgroup v2: file/anon
+    cache = mem_details.get("cache", mem_details.get("file", 0))
+    rss = mem_details.get("rss", mem_details.get("anon"))
+    if rss is None:
+        rss = memory_stats.get("usage", 0) - cache
+
+    blkio_stats = raw.get("blkio_stats") or {}
+    blk_read, blk_write = _sum_blkio(blkio_stats.get("io_service_bytes_recursive"))
+    blk_read_ops, blk_write_ops = _sum_blkio(blkio_stats.get("io_serviced_recursive"))
+
+    networks = (raw.get("networks") or {}).values()
+    return {
+        "rss": rss,
+        "cache": cache,
+        "blk_read": blk_read,
+        "blk_write": blk_write,
+        "blk_read_ops": blk_read_ops,
+        "blk_write_ops": blk_write_ops,
+        "net_rx": sum(net.get("rx_bytes", 0) for net in networks),
+        "net_tx": sum(net.get("tx_bytes", 0) for net in networks),
+        "pids": (raw.get("pids_stats") or {}).get("current", 0),
+    }
+
+
+def _image_digest(image: Image, image_name: str) -> str:
+    """Дайджест из registry для репозитория образа, иначе id (образ собран локально)."""
+    repo_digests = image.attrs.get("RepoDigests") or []
+    # Репозиторий без тега; двоеточие до последнего «/» – порт registry, а не тег
+    name = image_name.split("@")[0]
+    repository = name.rsplit(":", 1)[0] if ":" in name.rsplit("/", 1)[-1] else name
+    for repo_digest in repo_digests:
+        if repo_digest.split("@")[0] == repository:
+            return repo_digest
+    return repo_digests[0] if repo_digests else image.id
+
+
+def _sum_blkio(entries: list[dict] | None) -> tuple[int, int]:
+    """Суммы по операциям Read и Write по всем устройствам из blkio_stats."""
+    read = write = 0
+    for entry in entries or []:
+        op = entry.get("op", "").lower()
+        if op == "read":
+            read += entry.get("value", 0)
+        elif op == "write":
+            write += entry.get("value", 0)
+    return read, write
+
+
 def _create_tls_config(host_config: DockerHostConfig) -> docker.tls.TLSConfig | None:
     """Создает конфигурацию TLS для Docker клиента."""
     if not all(
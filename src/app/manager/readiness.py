@@ -0,0 +1,91 @@
+import re
+import socket
+import time
+from collections.abc import Callable
+
+from docker.errors import DockerException
+from docker.models.containers import Container
+from src.app.config.log import get_logger
+from src.app.manager.db.base_adapter import BaseAdapter
+from src.app.schemas.schema import ReadinessConfig
+
+logger = get_logger(__name__)
+
+
+def wait_until(
+    probe: Callable[[], bool],
+    deadline: float,
+    *,
+    initial_delay: float = 0.05,
+    max_delay: float = 2.0,
+    description: str = "",
+) -> None:
+    """
+    Повторяет probe до успеха с экспоненциально растущей паузой (initial_delay,
+    2·initial_delay, … не больше max_delay); после deadline (time.monotonic) –
+    TimeoutError.
+    """
+    delay = initial_delay
+    while not probe():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            msg = f"Не дождались готовности: {description}"
+            raise TimeoutError(msg)
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, max_delay)
+
+
+def tcp_open(host: str, port: int, timeout: float = 1.0) -> bool:
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def log_matches(container: Container, pattern: str, count: int = 1) -> bool:
+    """В логе контейнера не меньше count совпадений с pattern."""
+    try:
+        logs = container.logs(stdout=True, stderr=True).decode(errors="replace")
+    except DockerException:
+        return False
+    return len(re.findall(pattern, logs)) >= count
+
+
+def wait_for_database(
+    adapter: BaseAdapter,
+    readiness: ReadinessConfig,
+    host: str,
+    port: int,
+    container: Container | None = None,
+    log_fn: Callable[[str], None] = lambda _: None,
+) -> float:
+    """
+    Ждёт, пока СУБД начнёт отвечать на запросы; возвращает время ожидания в секундах.
+    Открытый порт ещё не значит готовность: docker-proxy принимает соединения
+    раньше СУБД, а PostgreSQL после старта может проигрывать WAL.
+    """
+    started = time.monotonic()
+    deadline = started + readiness.timeout
+    backoff = {"initial_delay": readiness.initial_delay, "max_delay": readiness.max_delay}
+
+    if readiness.tcp:
+        wait_until(
+            lambda: tcp_open(host, port),
+            deadline,
+            description=f"TCP {host}:{port}",
+            **backoff,
+        )
+    if readiness.log_pattern and container is not None:
+        wait_until(
+            lambda: log_matches(container, readiness.log_pattern, readiness.log_count),
+            deadline,
+            description=f"строка лога '{readiness.log_pattern}'",
+            **backoff,
+        )
+    wait_until(adapter.probe, deadline, description=f"ответ СУБД {host}:{port}", **backoff)
+
+    elapsed = time.monotonic() - started
+    log_fn(f"✅ СУБД готова за {elapsed:.2f} с.")
+    logger.info(f"СУБД {host}:{port} готова за {elapsed:.3f} с.")
+    return elapsed
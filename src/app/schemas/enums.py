@@ -22,6 +22,42 @@ class DataType(str, AutoName):
     bool = auto()
 
 
+class KeyOrder(str, AutoName):
+    random = auto()
+    sequential = auto()
+    reversed = auto()
+    clustered = auto()
+
+
+class InsertMethod(str, AutoName):
+    app = auto()  # как вставляет типичное приложение (pandas.to_sql)
+    bulk = auto()  # нативная массовая загрузка диалекта (COPY, executemany, ...)
+
+
+class RateProfile(str, AutoName):
+    constant = auto()
+    ramp = auto()
+    step = auto()
+    poisson = auto()
+
+
+class ExecutionMode(str, AutoName):
+    threads = auto()  # пул потоков, синхронный адаптер
+    asyncio = auto()  # asyncio, асинхронный двойник адаптера
+
+
+class ConnectionMode(str, AutoName):
+    pooled = auto()  # соединение берётся из пула на каждый запрос
+    null = auto()  # NullPool: новое подключение на каждый запрос
+    persistent = auto()  # у каждого потока своё соединение на весь шаг
+
+
+class PullPolicy(str, AutoName):
+    always = auto()  # всегда обращаться к registry
+    if_not_present = auto()  # скачивать, только если образа нет локально
+    never = auto()  # только локальный образ, без сети
+
+
 sql_type_mapping = {
     "int": Integer,
     # "str": Text,
@@ -1,5 +1,8 @@
+from typing import Any
+
 from pydantic import BaseModel, ConfigDict, Field
 from src.app.core.scenario_steps import ScenarioStep
+from src.app.schemas.enums import PullPolicy
 from src.app.storage.model import DockerImage
 
 
@@ -30,10 +33,69 @@ class DockerHostConfig(BaseModel):
     )
 
 
+class ContainerResources(BaseModel):
+    """
+    Ограничения ресурсов контейнера СУБД – ключ "resources" конфигурации образа.
+    Размеры памяти – байты или строка docker ('512m', '4g').
+    """
+
+    cpuset_cpus: str | None = Field(default=None, description="Ядра, например '2-5' или '2,4'")
+    cpus: float | None = Field(default=None, gt=0, description="Доля ядер, как docker --cpus")
+    cpu_quota: int | None = Field(default=None, gt=0, description="мкс CPU за cpu_period")
+    cpu_period: int | None = Field(default=None, gt=0, description="мкс, по умолчанию 100000")
+    mem_limit: int | str | None = None
+    # Равный mem_limit запрещает свопинг – иначе результаты зависят от диска хоста
+    memswap_limit: int | str | None = None
+    shm_size: int | str | None = Field(default=None, description="/dev/shm; Docker даёт 64m")
+
+    def run_kwargs(self) -> dict[str, Any]:
+        """Аргументы docker containers.run."""
+        kwargs = self.model_dump(exclude_none=True, exclude={"cpus"})
+        if self.cpus is not None:
+            kwargs["nano_cpus"] = int(self.cpus * 1_000_000_000)
+        return kwargs
+
+
+class ReadinessConfig(BaseModel):
+    """
+    Проверка готовности СУБД – ключ "readiness" конфигурации образа. Пробы
+    выполняются по порядку: TCP-порт, строка в логе контейнера (если задана),
+    запрос самой СУБД (SELECT 1, PING, status) – каждая с экспоненциальной паузой.
+    """
+
+    timeout: float = Field(default=120.0, gt=0, description="секунды на все пробы")
+    tcp: bool = True
+    # Регулярное выражение и сколько раз оно должно встретиться в логе (образ
+    # postgres пишет «ready to accept connections» дважды: после initdb и после рестарта)
+    log_pattern: str | None = None
+    log_count: int = Field(default=1, ge=1)
+    initial_delay: float = Field(default=0.05, gt=0)
+    max_delay: float = Field(default=2.0, gt=0)
+
+
 class TestSystemConfig(BaseModel):
     use_existing: bool = False
+    pull_policy: PullPolicy = PullPolicy.if_not_present
     stop_after: bool = False
     remove_after: bool = False
+    stats_interval_ms: int | None = Field(
+        default=None,
+        ge=10,
+        le=100,
+        description="Период опроса cgroup контейнера на локальном хосте (мс); "
+        "None – только docker stats",
+    )
+    random_host_port: bool = Field(
+        default=False,
+        description="Публиковать порт СУБД на свободный порт хоста, а не на тот же номер; "
+        "нужно для параллельных запусков одной СУБД",
+    )
+    db_cpu_count: int | None = Field(
+        default=None,
+        ge=1,
+        description="Выделить контейнеру СУБД столько ядер, а генератору нагрузки – остальные "
+        "(локальный Docker, если ядра не заданы в конфигурации образа); None – без привязки",
+    )
 
 
 class DbTestConf(BaseModel):
@@ -44,5 +106,25 @@ class DbTestConf(BaseModel):
         description="Конфигурация для подключения к Docker хосту. Если None, используется локальный хост.",
     )
     test_system_config: TestSystemConfig
+    container_name: str | None = Field(
+        default=None,
+        description="Имя контейнера; None – '<образ>_test'",
+    )
+    cpuset_cpus: str | None = Field(
+        default=None,
+        description="Ядра для контейнера СУБД (формат docker --cpuset-cpus, например '0-3')",
+    )
+    load_cpuset_cpus: str | None = Field(
+        default=None,
+        description="Ядра генератора нагрузки; None – все ядра, не занятые СУБД",
+    )
+    run_group_id: str | None = Field(
+        default=None,
+        description="Общий идентификатор серии запусков (матрицы), пишется в каждый результат",
+    )
+    run_tags: dict[str, Any] = Field(
+        default_factory=dict,
+        description="Метки запуска (вариант конфигурации, параметры сценария) для step_params",
+    )
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -1,24 +1,69 @@
-from sqlalchemy import select
+import datetime
+import json
+import operator
+import threading
+from collections import Counter
+from typing import Any
+
+from sqlalchemy import and_, delete, event, func, or_, select
+from sqlalchemy.dialects.sqlite import insert
 from src.app.config.config import settings
 from src.app.config.log import get_logger
+from src.app.core.resource_series import ResourceSeries
 from src.app.storage.db_manager.db import SQLiteDB
-from src.app.storage.model import TestResults
+from src.app.storage.model import ResultDimension, TestResults, TestRun
 
 logger = get_logger(__name__)
 
+PAGE_SIZE = 500
+# Поля результатов, значения которых ведутся в result_dimension для фильтров
+DIMENSION_FIELDS = ("db_image", "operation")
+
 
 class ResultStorage(SQLiteDB):
+    def __init__(self, db_file: str) -> None:
+        super().__init__(db_file)
+        event.listen(self.engine, "connect", _enable_wal)
+        self._version_connection = None
+        self._version_lock = threading.Lock()
+        # Значения фильтров: поле -> значения; действительны, пока не менялась база
+        self._distinct_cache: dict[str, list[str]] = {}
+        self._distinct_cache_version: int | None = None
+        self._distinct_cache_lock = threading.Lock()
 
     def insert_result(self, test_result: TestResults):
         with self.session_scope() as session:
             session.add(test_result)
-            return test_result.id
+            _count_dimensions(session, [test_result], 1)
+            session.flush()
+        self._invalidate_distinct_cache()
+        return test_result.id
+
+    def insert_results(self, test_results: list[TestResults]) -> list[int]:
+        """Пакетная запись: одна транзакция и один fsync на весь пакет."""
+        with self.session_scope() as session:
+            session.add_all(test_results)
+            _count_dimensions(session, test_results, 1)
+            session.flush()
+        self._invalidate_distinct_cache()
+        return [test_result.id for test_result in test_results]
+
+    def ensure_run(self, run_id: str, started_at: datetime.datetime | None = None) -> None:
+        """Создаёт запись запуска, если её ещё нет (ячейки матрицы делят одну запись)."""
+        with self.session_scope() as session:
+            session.execute(
+                insert(TestRun)
+                .values(id=run_id, started_at=started_at or datetime.datetime.now())
+                .on_conflict_do_nothing(index_elements=[TestRun.id]),
+            )
 
     def delete_result(self, record_id: int) -> None:
         with self.session_scope() as session:
             result = session.get(TestResults, record_id)
             if result:
                 session.delete(result)
+                _count_dimensions(session, [result], -1)
+        self._invalidate_distinct_cache()
 
     def select_all_results(
         self,
@@ -28,46 +73,189 @@ class ResultStorage(SQLiteDB):
         order: str | None = None,
     ) -> list[TestResults]:
         with self.session_scope() as session:
-            query = select(TestResults)
-            if db_image:
-                query = query.where(TestResults.db_image == db_image)
-            if operation:
-                query = query.where(TestResults.operation == operation)
+            query = _filtered(select(TestResults), db_image, operation)
 
             if sort:
                 sort_col = getattr(TestResults, sort, None)
                 if sort_col is not None:
                     if order and order.lower() == "desc":
-                        query = query.order_by(sort_col.desc())
+                        query = query.order_by(sort_col.desc(), TestResults.id.desc())
                     else:
-                        query = query.order_by(sort_col.asc())
+                        query = query.order_by(sort_col.asc(), TestResults.id.asc())
             else:
-                query = query.order_by(TestResults.timestamp.desc())
+                query = query.order_by(TestResults.timestamp.desc(), TestResults.id.desc())
             return session.scalars(query).all()
 
+    def count_results(self, db_image: str | None = None, operation: str | None = None) -> int:
+        with self.session_scope() as session:
+            query = _filtered(select(func.count(TestResults.id)), db_image, operation)
+            return session.scalar(query)
+
+    def select_results_page(
+        self,
+        db_image: str | None = None,
+        operation: str | None = None,
+        sort: str = "timestamp",
+        order: str = "desc",
+        after: tuple[Any, int] | None = None,
+        limit: int = PAGE_SIZE,
+    ) -> list[TestResults]:
+        """
+        Страница результатов с keyset-пагинацией: after – (значение столбца
+        сортировки, id) последней загруженной строки. В отличие от OFFSET
+        стоимость страницы не растёт с её номером; при равных значениях
+        порядок задаёт id.
+        """
+        sort_col = getattr(TestResults, sort)
+        desc = order.lower() == "desc"
+        with self.session_scope() as session:
+            query = _filtered(select(TestResults), db_image, operation)
+            if after is not None:
+                query = query.where(_after(sort_col, desc, *after))
+            if desc:
+                query = query.order_by(sort_col.desc(), TestResults.id.desc())
+            else:
+                query = query.order_by(sort_col.asc(), TestResults.id.asc())
+            return session.scalars(query.limit(limit)).all()
+
+    def max_result_id(self) -> int:
+        with self.session_scope() as session:
+            return session.scalar(select(func.max(TestResults.id))) or 0
+
+    def select_results_since(
+        self,
+        last_id: int,
+        db_image: str | None = None,
+        operation: str | None = None,
+    ) -> list[TestResults]:
+        """Результаты, добавленные после результата last_id (id растёт монотонно)."""
+        with self.session_scope() as session:
+            query = _filtered(select(TestResults), db_image, operation)
+            query = query.where(TestResults.id > last_id).order_by(TestResults.id)
+            return session.scalars(query).all()
+
+    def data_version(self) -> int:
+        """
+        Счётчик изменений базы (PRAGMA data_version): меняется, когда любое
+        другое соединение фиксирует транзакцию. Читается на отдельном соединении,
+        которое само ничего не пишет, поэтому проверка «изменилось ли что-то»
+        не трогает таблицы.
+        """
+        with self._version_lock:
+            if self._version_connection is None:
+                self._version_connection = self.engine.raw_connection()
+            cursor = self._version_connection.cursor()
+            try:
+                cursor.execute("PRAGMA data_version")
+                return cursor.fetchone()[0]
+            finally:
+                cursor.close()
+
     def select_result_by_id(self, result_id: int) -> TestResults:
         with self.session_scope() as session:
             return session.get(TestResults, result_id)
 
-    def get_distinct_db_images(self) -> list[str]:
+    def select_resource_series(self, result_id: int) -> ResourceSeries | None:
         with self.session_scope() as session:
-            rows = (
-                session.query(TestResults.db_image)
-                .distinct()
-                .order_by(TestResults.db_image)
-                .all()
+            raw = session.scalar(
+                select(TestResults.resource_series).where(TestResults.id == result_id),
             )
-        return [row[0] for row in rows]
+        if not raw:
+            return None
+        return ResourceSeries.from_dict(json.loads(raw))
+
+    def get_distinct_db_images(self) -> list[str]:
+        return self._distinct_values("db_image")
 
     def get_distinct_operations(self) -> list[str]:
-        with self.session_scope() as session:
-            rows = (
-                session.query(TestResults.operation)
-                .distinct()
-                .order_by(TestResults.operation)
-                .all()
-            )
-        return [row[0] for row in rows]
+        return self._distinct_values("operation")
+
+    def _distinct_values(self, field: str) -> list[str]:
+        """
+        Значения поля из result_dimension – O(числа значений), а не O(числа
+        результатов). Кэш сбрасывается при записи через это хранилище и при
+        смене data_version, если базу изменил другой процесс.
+        """
+        version = self.data_version()
+        with self._distinct_cache_lock:
+            if version != self._distinct_cache_version:
+                self._distinct_cache.clear()
+                self._distinct_cache_version = version
+            if field not in self._distinct_cache:
+                with self.session_scope() as session:
+                    self._distinct_cache[field] = session.scalars(
+                        select(ResultDimension.value)
+                        .where(ResultDimension.field == field)
+                        .order_by(ResultDimension.value),
+                    ).all()
+            return list(self._distinct_cache[field])
+
+    def _invalidate_distinct_cache(self) -> None:
+        with self._distinct_cache_lock:
+            self._distinct_cache.clear()
+
+
+def _enable_wal(dbapi_connection, _connection_record) -> None:
+    """
+    WAL: читатели (вкладка результатов) не блокируют запись во время теста,
+    а фиксация транзакции не требует fsync основного файла базы.
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+    finally:
+        cursor.close()
+
+
+def _count_dimensions(session, results: list[TestResults], delta: int) -> None:
+    """Изменяет счётчики result_dimension на delta для каждого результата."""
+    counts = Counter(
+        (field, getattr(result, field)) for result in results for field in DIMENSION_FIELDS
+    )
+    for (field, value), count in counts.items():
+        statement = insert(ResultDimension).values(
+            field=field,
+            value=value,
+            result_count=count * delta,
+        )
+        session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[ResultDimension.field, ResultDimension.value],
+                set_={
+                    "result_count": ResultDimension.result_count
+                    + statement.excluded.result_count,
+                },
+            ),
+        )
+    if delta < 0:
+        session.execute(delete(ResultDimension).where(ResultDimension.result_count <= 0))
+
+
+def _filtered(query, db_image: str | None, operation: str | None):
+    if db_image:
+        query = query.where(TestResults.db_image == db_image)
+    if operation:
+        query = query.where(TestResults.operation == operation)
+    return query
+
+
+def _after(sort_col, desc: bool, last_value: Any, last_id: int):
+    """
+    Условие «строка после (last_value, last_id)» в порядке сортировки.
+    SQLite ставит NULL первыми при ASC и последними при DESC.
+    """
+    compare = operator.lt if desc else operator.gt
+    id_after = compare(TestResults.id, last_id)
+    if last_value is None:
+        if desc:
+            return and_(sort_col.is_(None), id_after)
+        return or_(sort_col.is_not(None), and_(sort_col.is_(None), id_after))
+    value_after = or_(
+        compare(sort_col, last_value),
+        and_(sort_col == last_value, id_after),
+    )
+    return or_(value_after, sort_col.is_(None)) if desc else value_after
 
 
 result_manager = ResultStorage(settings.SQLITE_DB_URL)
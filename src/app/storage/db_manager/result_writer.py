@@ -0,0 +1,87 @@
+import queue
+import threading
+
+from src.app.config.log import get_logger
+from src.app.storage.db_manager.result_storage import ResultStorage
+from src.app.storage.model import TestResults
+
+logger = get_logger(__name__)
+
+_STOP = object()
+
+
+class ResultWriter:
+    """
+    Буферизованная запись результатов в фоновом потоке. Раннер кладёт
+    результаты в ограниченную очередь и сразу переходит к следующему шагу;
+    поток забирает всё накопившееся и пишет одним пакетом (одна транзакция).
+    Если очередь заполнена, put ждёт – память не растёт без предела.
+    Ошибка записи поднимается в put, flush или close.
+    """
+
+    def __init__(
+        self,
+        storage: ResultStorage,
+        max_pending: int = 1000,
+        batch_size: int = 200,
+    ) -> None:
+        self.storage = storage
+        self.batch_size = batch_size
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._error: Exception | None = None
+        self._thread = threading.Thread(target=self._run, name="result-writer", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> "ResultWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            self.close()
+        except Exception as e:
+            if exc_type is None:
+                raise
+            # Не подменяем исходную ошибку теста ошибкой записи
+            logger.exception(f"❗️ Ошибка записи результатов после сбоя теста: {e}")
+
+    def put(self, test_result: TestResults) -> None:
+        self._raise_error()
+        self._queue.put(test_result)
+
+    def flush(self) -> None:
+        """Ждёт, пока всё поставленное в очередь будет записано."""
+        self._queue.join()
+        self._raise_error()
+
+    def close(self) -> None:
+        """Записывает оставшееся и останавливает поток."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        self._raise_error()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            msg = f"Не удалось записать результаты: {self._error}"
+            raise RuntimeError(msg) from self._error
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = any(item is _STOP for item in batch)
+            test_results = [item for item in batch if item is not _STOP]
+            try:
+                if test_results and self._error is None:
+                    self.storage.insert_results(test_results)
+            except Exception as e:
+                logger.exception(f"❗️ Ошибка пакетной записи {len(test_results)} результатов: {e}")
+                self._error = e
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
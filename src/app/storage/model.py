@@ -2,18 +2,51 @@ import datetime
 import json
 from typing import Any
 
-from sqlalchemy import Column, DateTime, Float, Integer, String, Text
-from sqlalchemy.orm import declarative_base
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.orm import declarative_base, deferred
 from src.app.core.scenario_steps import ScenarioStep, deserialize_step
 
 Base = declarative_base()
 
 
+class TestRun(Base):
+    """Запуск или серия запусков (матрица), к которой относятся результаты."""
+
+    __tablename__ = "test_run"
+
+    id = Column(String, primary_key=True)
+    started_at = Column(DateTime, nullable=False)
+
+
+class ResultDimension(Base):
+    """
+    Различные значения полей результатов, по которым фильтруется вкладка
+    результатов, и число результатов с каждым значением. Ведётся при записи
+    и удалении результатов, чтобы не искать DISTINCT по всей test_results.
+    """
+
+    __tablename__ = "result_dimension"
+
+    field = Column(String, primary_key=True)  # имя столбца test_results
+    value = Column(Text, primary_key=True)
+    result_count = Column(Integer, nullable=False)
+
+
 class TestResults(Base):
     __tablename__ = "test_results"
+    # Индексы под фильтры и сортировку вкладки результатов (образ, операция, время).
+    # В SQLite id – это rowid, он неявно входит в каждый индекс, поэтому фильтр,
+    # сортировка по времени и DISTINCT по образу/операции обходятся одним индексом.
+    __table_args__ = (
+        Index("ix_test_results_image_operation_timestamp", "db_image", "operation", "timestamp"),
+        Index("ix_test_results_operation_timestamp", "operation", "timestamp"),
+        Index("ix_test_results_timestamp", "timestamp"),
+        Index("ix_test_results_run_group_id", "run_group_id"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    timestamp = Column(Text, nullable=False)
+    # Локальное время завершения шага, с микросекундами
+    timestamp = Column(DateTime, nullable=False)
     db_image = Column(Text, nullable=False)
     operation = Column(Text, nullable=False)
     num_records = Column(Integer, nullable=False)
@@ -21,6 +54,37 @@ class TestResults(Base):
     execution_time = Column(Float, nullable=True)
     memory_used = Column(Float, nullable=True)
     cpu_percent = Column(Float, nullable=True)
+    latency_p50 = Column(Float, nullable=True)  # мс
+    latency_p95 = Column(Float, nullable=True)  # мс
+    latency_p99 = Column(Float, nullable=True)  # мс
+    throughput = Column(Float, nullable=True)  # запросов или строк в секунду
+    error_count = Column(Integer, nullable=True)
+    pool_wait_p95 = Column(Float, nullable=True)  # мс, ожидание соединения
+    # Прирост счётчиков ввода-вывода контейнера за шаг
+    blk_read_bytes = Column(Integer, nullable=True)
+    blk_write_bytes = Column(Integer, nullable=True)
+    blk_read_ops = Column(Integer, nullable=True)
+    blk_write_ops = Column(Integer, nullable=True)
+    net_rx_bytes = Column(Integer, nullable=True)
+    net_tx_bytes = Column(Integer, nullable=True)
+    step_params = Column(Text, nullable=True)
+    # Повторы шага: execution_time и метрики выше – средние по repeat_count замерам
+    repeat_count = Column(Integer, nullable=True)
+    execution_time_stddev = Column(Float, nullable=True)
+    execution_time_ci95 = Column(Float, nullable=True)  # полуширина 95% ДИ среднего
+    # Общий идентификатор серии запусков (матрица образов и параметров)
+    run_group_id = Column(String, ForeignKey("test_run.id"), nullable=True)
+    # Секунды от запуска контейнера до первого успешного запроса к СУБД
+    readiness_time = Column(Float, nullable=True)
+    # repo@sha256:… образа СУБД (или id локально собранного) – для воспроизводимости
+    image_digest = Column(String, nullable=True)
+    # JSON, см. ResourceSeries.to_dict; грузится отдельно – ряд может быть большим
+    resource_series = deferred(Column(Text, nullable=True))
+
+    def get_step_params_as_dict(self) -> dict[str, Any]:
+        if not self.step_params:
+            return {}
+        return json.loads(self.step_params)
 
 
 class DockerImage(Base):
@@ -0,0 +1,37 @@
+"""add repeat statistics to test_results
+
+Revision ID: 0a6d9f3b8c52
+Revises: f2b8c4e6a731
+Create Date: 2026-10-18 17:11:38.290456
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0a6d9f3b8c52"
+down_revision: str | None = "f2b8c4e6a731"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("test_results", sa.Column("repeat_count", sa.Integer(), nullable=True))
+    op.add_column(
+        "test_results",
+        sa.Column("execution_time_stddev", sa.Float(), nullable=True),
+    )
+    op.add_column(
+        "test_results",
+        sa.Column("execution_time_ci95", sa.Float(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("test_results") as batch_op:
+        batch_op.drop_column("execution_time_ci95")
+        batch_op.drop_column("execution_time_stddev")
+        batch_op.drop_column("repeat_count")
@@ -0,0 +1,27 @@
+"""add run_group_id to test_results
+
+Revision ID: 3d5f7a9c1e46
+Revises: 0a6d9f3b8c52
+Create Date: 2026-10-18 18:02:14.517203
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3d5f7a9c1e46"
+down_revision: str | None = "0a6d9f3b8c52"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("test_results", sa.Column("run_group_id", sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("test_results") as batch_op:
+        batch_op.drop_column("run_group_id")
@@ -0,0 +1,27 @@
+"""add step_params to test_results
+
+Revision ID: 3f9a1c2d7b40
+Revises: ccdbe592ee4e
+Create Date: 2026-10-18 10:12:31.418204
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9a1c2d7b40"
+down_revision: str | None = "ccdbe592ee4e"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("test_results", sa.Column("step_params", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("test_results") as batch_op:
+        batch_op.drop_column("step_params")
@@ -0,0 +1,27 @@
+"""add readiness_time to test_results
+
+Revision ID: 5b9e1c3d7f20
+Revises: 3d5f7a9c1e46
+Create Date: 2026-10-18 19:14:52.906318
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b9e1c3d7f20"
+down_revision: str | None = "3d5f7a9c1e46"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("test_results", sa.Column("readiness_time", sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("test_results") as batch_op:
+        batch_op.drop_column("readiness_time")
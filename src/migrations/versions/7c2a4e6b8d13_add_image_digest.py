@@ -0,0 +1,27 @@
+"""add image_digest to test_results
+
+Revision ID: 7c2a4e6b8d13
+Revises: 5b9e1c3d7f20
+Create Date: 2026-10-18 19:48:27.113095
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c2a4e6b8d13"
+down_revision: str | None = "5b9e1c3d7f20"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("test_results", sa.Column("image_digest", sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("test_results") as batch_op:
+        batch_op.drop_column("image_digest")
@@ -0,0 +1,35 @@
+"""add latency and throughput metrics to test_results
+
+Revision ID: 8b2e4d6f1a93
+Revises: 3f9a1c2d7b40
+Create Date: 2026-10-18 11:40:05.902117
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8b2e4d6f1a93"
+down_revision: str | None = "3f9a1c2d7b40"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("test_results", sa.Column("latency_p50", sa.Float(), nullable=True))
+    op.add_column("test_results", sa.Column("latency_p95", sa.Float(), nullable=True))
+    op.add_column("test_results", sa.Column("latency_p99", sa.Float(), nullable=True))
+    op.add_column("test_results", sa.Column("throughput", sa.Float(), nullable=True))
+    op.add_column("test_results", sa.Column("error_count", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("test_results") as batch_op:
+        batch_op.drop_column("error_count")
+        batch_op.drop_column("throughput")
+        batch_op.drop_column("latency_p99")
+        batch_op.drop_column("latency_p95")
+        batch_op.drop_column("latency_p50")
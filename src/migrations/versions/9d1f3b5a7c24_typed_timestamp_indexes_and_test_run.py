@@ -0,0 +1,87 @@
+"""typed timestamp, result indexes and test_run table
+
+Revision ID: 9d1f3b5a7c24
+Revises: 7c2a4e6b8d13
+Create Date: 2026-10-18 20:31:06.448172
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9d1f3b5a7c24"
+down_revision: str | None = "7c2a4e6b8d13"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+INDEXES = (
+    ("ix_test_results_image_operation_timestamp", ["db_image", "operation", "timestamp"]),
+    ("ix_test_results_operation_timestamp", ["operation", "timestamp"]),
+    ("ix_test_results_timestamp", ["timestamp"]),
+    ("ix_test_results_run_group_id", ["run_group_id"]),
+)
+
+
+def _timestamp(type_: sa.types.TypeEngine) -> sa.Column:
+    return sa.Column("timestamp", type_, nullable=False)
+
+
+def _alter_timestamp(batch_op, existing_type, type_) -> None:
+    # SQLite пересоздаёт таблицу, и alter_column скопировал бы данные через
+    # CAST(timestamp AS DATETIME), а NUMERIC-аффинность обрезает строку до года.
+    # Поэтому там новый тип задаётся через reflect_args и данные копируются как есть.
+    if op.get_bind().dialect.name == "sqlite":
+        return
+    batch_op.alter_column(
+        "timestamp",
+        existing_type=existing_type,
+        type_=type_,
+        existing_nullable=False,
+        postgresql_using=f"timestamp::{'timestamp' if isinstance(type_, sa.DateTime) else 'text'}",
+    )
+
+
+def upgrade() -> None:
+    op.create_table(
+        "test_run",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("started_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    # Строки "%Y-%m-%d %H:%M:%S" приводим к формату DateTime SQLAlchemy с микросекундами
+    op.execute(
+        "UPDATE test_results SET timestamp = timestamp || '.000000' "
+        "WHERE length(timestamp) = 19",
+    )
+    op.execute(
+        "INSERT INTO test_run (id, started_at) "
+        "SELECT run_group_id, MIN(timestamp) FROM test_results "
+        "WHERE run_group_id IS NOT NULL GROUP BY run_group_id",
+    )
+
+    with op.batch_alter_table("test_results", reflect_args=[_timestamp(sa.DateTime())]) as batch_op:
+        _alter_timestamp(batch_op, sa.Text(), sa.DateTime())
+        batch_op.create_foreign_key(
+            "fk_test_results_run_group_id",
+            "test_run",
+            ["run_group_id"],
+            ["id"],
+        )
+
+    for name, columns in INDEXES:
+        op.create_index(name, "test_results", columns)
+
+
+def downgrade() -> None:
+    for name, _ in INDEXES:
+        op.drop_index(name, table_name="test_results")
+
+    with op.batch_alter_table("test_results", reflect_args=[_timestamp(sa.Text())]) as batch_op:
+        batch_op.drop_constraint("fk_test_results_run_group_id", type_="foreignkey")
+        _alter_timestamp(batch_op, sa.DateTime(), sa.Text())
+
+    op.execute("UPDATE test_results SET timestamp = substr(timestamp, 1, 19)")
+    op.drop_table("test_run")
@@ -0,0 +1,37 @@
+"""add result_dimension table
+
+Revision ID: b4e8d2f6a135
+Revises: 9d1f3b5a7c24
+Create Date: 2026-10-18 21:12:40.503917
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b4e8d2f6a135"
+down_revision: str | None = "9d1f3b5a7c24"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "result_dimension",
+        sa.Column("field", sa.String(), nullable=False),
+        sa.Column("value", sa.Text(), nullable=False),
+        sa.Column("result_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("field", "value"),
+    )
+    for field in ("db_image", "operation"):
+        op.execute(
+            "INSERT INTO result_dimension (field, value, result_count) "
+            f"SELECT '{field}', {field}, COUNT(*) FROM test_results GROUP BY {field}",
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("result_dimension")
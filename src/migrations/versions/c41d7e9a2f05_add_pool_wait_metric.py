@@ -0,0 +1,27 @@
+"""add pool wait metric to test_results
+
+Revision ID: c41d7e9a2f05
+Revises: 8b2e4d6f1a93
+Create Date: 2026-10-18 14:02:31.418522
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c41d7e9a2f05"
+down_revision: str | None = "8b2e4d6f1a93"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("test_results", sa.Column("pool_wait_p95", sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("test_results") as batch_op:
+        batch_op.drop_column("pool_wait_p95")
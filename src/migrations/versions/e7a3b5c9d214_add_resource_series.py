@@ -0,0 +1,27 @@
+"""add resource time series to test_results
+
+Revision ID: e7a3b5c9d214
+Revises: c41d7e9a2f05
+Create Date: 2026-10-18 15:20:47.163094
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e7a3b5c9d214"
+down_revision: str | None = "c41d7e9a2f05"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("test_results", sa.Column("resource_series", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("test_results") as batch_op:
+        batch_op.drop_column("resource_series")
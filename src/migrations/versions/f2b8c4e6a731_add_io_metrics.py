@@ -0,0 +1,38 @@
+"""add block and network io metrics to test_results
+
+Revision ID: f2b8c4e6a731
+Revises: e7a3b5c9d214
+Create Date: 2026-10-18 16:05:12.734810
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f2b8c4e6a731"
+down_revision: str | None = "e7a3b5c9d214"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+IO_COLUMNS = (
+    "blk_read_bytes",
+    "blk_write_bytes",
+    "blk_read_ops",
+    "blk_write_ops",
+    "net_rx_bytes",
+    "net_tx_bytes",
+)
+
+
+def upgrade() -> None:
+    for column in IO_COLUMNS:
+        op.add_column("test_results", sa.Column(column, sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("test_results") as batch_op:
+        for column in reversed(IO_COLUMNS):
+            batch_op.drop_column(column)
@@ -0,0 +1,33 @@
+import datetime
+from collections.abc import Callable
+
+import pytest
+from src.app.storage.db_manager.result_storage import ResultStorage
+from src.app.storage.model import Base, TestResults
+
+RESULT_DEFAULTS = {
+    "timestamp": datetime.datetime(2025, 5, 1, 10, 0, 0),
+    "db_image": "postgres:16",
+    "operation": "query",
+    "num_records": 0,
+    "execution_time": 1.0,
+    "run_group_id": "run1",
+}
+
+
+@pytest.fixture
+def storage(tmp_path) -> ResultStorage:
+    """Хранилище результатов на временной SQLite-базе со схемой из моделей."""
+    storage = ResultStorage(f"sqlite:///{tmp_path / 'results.db'}")
+    Base.metadata.create_all(storage.engine)
+    return storage
+
+
+@pytest.fixture
+def make_result() -> Callable[..., TestResults]:
+    """Фабрика TestResults: обязательные поля заполнены, нужные – переопределяются."""
+
+    def make(**fields) -> TestResults:
+        return TestResults(**{**RESULT_DEFAULTS, **fields})
+
+    return make
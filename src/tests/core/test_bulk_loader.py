@@ -0,0 +1,54 @@
+import sqlite3
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.dialects import oracle
+from src.app.core.scenario_steps import ColumnDefinition
+from src.app.manager.db.bulk_loader import ExecuteManyLoader
+from src.app.manager.db.utils import generate_batches
+from src.app.schemas.enums import DataType
+
+COLUMNS = {
+    "id": ColumnDefinition(data_type=DataType.int, primary_key=True),
+    "name": ColumnDefinition(data_type=DataType.str),
+}
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'bulk.db'}")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE items (id INTEGER, name TEXT)"))
+    yield engine
+    engine.dispose()
+
+
+def test_execute_many_loader_uses_driver_paramstyle(engine) -> None:
+    """
+    INSERT собирается в paramstyle драйвера: позиционный для SQLite,
+    именованный для Oracle (строки тогда передаются словарями).
+    """
+    ExecuteManyLoader().load(engine, "items", generate_batches(25, COLUMNS, chunk_size=10))
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT COUNT(*) FROM items")).scalar() == 25
+
+    oracle_engine = SimpleNamespace(dialect=oracle.dialect())
+    statement, names = ExecuteManyLoader._insert_statement(oracle_engine, "items", ["id", "name"])
+    assert statement.endswith("VALUES (:id, :name)")
+    assert names == ["id", "name"]
+
+
+def test_execute_many_loader_closes_cursor_on_error(engine) -> None:
+    """Курсор закрывается, даже если executemany упал."""
+    cursors = []
+
+    class RecordingLoader(ExecuteManyLoader):
+        def _prepare_cursor(self, cursor) -> None:
+            cursors.append(cursor)
+
+    with pytest.raises(sqlite3.OperationalError, match="no such table"):
+        RecordingLoader().load(engine, "missing", generate_batches(5, COLUMNS))
+
+    with pytest.raises(sqlite3.ProgrammingError, match="closed cursor"):
+        cursors[0].execute("SELECT 1")
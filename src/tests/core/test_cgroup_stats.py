@@ -0,0 +1,38 @@
+from src.app.manager.cgroup_stats import CgroupStats
+
+
+def _write_cgroup(path, usage_usec: int) -> None:
+    (path / "cpu.stat").write_text(f"usage_usec {usage_usec}\nuser_usec 1\nsystem_usec 2\n")
+    (path / "memory.current").write_text("3145728\n")
+    (path / "memory.stat").write_text("anon 2097152\nfile 1048576\n")
+    (path / "io.stat").write_text(
+        "8:0 rbytes=4096 wbytes=8192 rios=1 wios=2 dbytes=0 dios=0\n"
+        "8:16 rbytes=100 wbytes=0 rios=1 wios=0 dbytes=0 dios=0\n",
+    )
+    (path / "pids.current").write_text("7\n")
+
+
+def test_cgroup_sample(tmp_path) -> None:
+    """
+    Отсчёт собирается из файлов cgroup v2; CPU% – по приросту usage_usec.
+    """
+    _write_cgroup(tmp_path, usage_usec=1_000_000)
+    stats = CgroupStats(tmp_path)
+    stats.start()
+    first = stats.sample()
+
+    assert first["cpu_percent"] == 0.0
+    assert first["usage"] == 3145728
+    assert first["rss"] == 2097152
+    assert first["cache"] == 1048576
+    assert first["blk_read"] == 4196
+    assert first["blk_write"] == 8192
+    assert first["blk_read_ops"] == 2
+    assert first["blk_write_ops"] == 2
+    assert first["pids"] == 7
+    assert "peak" not in first  # memory.peak отсутствует
+
+    _write_cgroup(tmp_path, usage_usec=1_000_000 + 10_000_000)
+    second = stats.sample()
+    assert second["cpu_percent"] > 0
+    stats.close()
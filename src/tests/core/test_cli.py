@@ -0,0 +1,66 @@
+import json
+import subprocess
+import sys
+
+from src.app.cli import load_image, load_scenario_steps, main
+from src.app.core.scenario_steps import CreateTableStep, QueryStep
+
+
+def test_import_does_not_load_gui_stack() -> None:
+    """
+    Импорт CLI и разбор аргументов не тянут PyQt6, matplotlib и langchain.
+    """
+    code = (
+        "import sys; from src.app.cli import build_parser; "
+        "build_parser().parse_args(['--scenario', 's', '--image', 'i']); "
+        "print(sorted(m for m in ('PyQt6', 'matplotlib', 'langchain_core', 'docker') "
+        "if m in sys.modules))"
+    )
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+    assert output.strip() == "[]"
+
+
+def test_load_from_json_files(tmp_path) -> None:
+    scenario_file = tmp_path / "scenario.json"
+    scenario_file.write_text(
+        json.dumps(
+            {
+                "name": "smoke",
+                "steps": [
+                    {"step_type": "create", "table_name": "t", "columns": {}},
+                    {
+                        "step_type": "query",
+                        "query": "SELECT 1",
+                        "thread_count": 2,
+                        "request_count": 10,
+                        "measure": True,
+                        "repeat": 3,
+                    },
+                ],
+            },
+        ),
+    )
+    image_file = tmp_path / "image.json"
+    image_file.write_text(
+        json.dumps({"image_name": "postgres:16", "config": {"db_type": "postgresql"}}),
+    )
+
+    steps = load_scenario_steps(path=scenario_file)
+    assert isinstance(steps[0], CreateTableStep)
+    assert isinstance(steps[1], QueryStep)
+    assert steps[1].repeat == 3
+
+    image = load_image(path=image_file)
+    assert image.config_name == "postgres:16"
+    assert image.get_config_as_json() == {"db_type": "postgresql"}
+
+
+def test_failure_exit_code(tmp_path, capsys) -> None:
+    """
+    Ошибка запуска – ненулевой код выхода и сообщение в stderr.
+    """
+    missing = tmp_path / "missing.json"
+    code = main(["--scenario-file", str(missing), "--image-file", str(missing)])
+
+    assert code != 0
+    assert "missing.json" in capsys.readouterr().err
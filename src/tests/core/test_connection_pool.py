@@ -0,0 +1,90 @@
+import pytest
+from sqlalchemy import Pool, event
+from src.app.core.docker_test import _max_concurrency
+from src.app.core.query_runner import run_query_step
+from src.app.core.scenario_steps import QueryStep
+from src.app.manager.db.sql_adapter import SQLAdapter
+from src.app.schemas.enums import ConnectionMode
+
+
+@pytest.fixture
+def adapter(tmp_path):
+    adapter = SQLAdapter(db_type="sqlite", db_name=str(tmp_path / "pool.db"))
+    yield adapter
+    if adapter.engine is not None:
+        adapter.release_connections()
+        adapter.engine.dispose()
+
+
+@pytest.fixture
+def checkouts():
+    """DBAPI-соединения, выданные пулами SQLAlchemy за время теста."""
+    checked_out = []
+
+    def on_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+        checked_out.append(dbapi_connection)
+
+    event.listen(Pool, "checkout", on_checkout)
+    yield checked_out
+    event.remove(Pool, "checkout", on_checkout)
+
+
+def test_pool_sized_by_thread_count(adapter: SQLAdapter) -> None:
+    """Пул рассчитан на наибольший thread_count сценария и прогрет заранее."""
+    steps = [
+        QueryStep(query="SELECT 1", request_count=10, thread_count=2),
+        QueryStep(query="SELECT 1", request_count=10, thread_count=5),
+    ]
+    max_connections = _max_concurrency(steps)
+    adapter.connect(max_connections=max_connections)
+
+    assert max_connections == 5
+    assert adapter.engine.pool.size() == 5
+    assert adapter.engine.pool.checkedin() == 5
+
+
+def test_null_mode_connects_per_request(adapter: SQLAdapter, checkouts: list) -> None:
+    """В режиме null каждый запрос открывает своё соединение."""
+    adapter.connect(max_connections=4)
+    checkouts.clear()
+    step = QueryStep(
+        query="SELECT 1",
+        request_count=20,
+        thread_count=4,
+        connection_mode=ConnectionMode.null,
+    )
+    result = run_query_step(adapter, step)
+
+    assert result["request_count"] == 20
+    assert result["connection_mode"] == str(ConnectionMode.null)
+    assert len({id(connection) for connection in checkouts}) == 20
+
+
+def test_persistent_mode_reuses_thread_connection(adapter: SQLAdapter, checkouts: list) -> None:
+    """В режиме persistent поток держит одно соединение на весь шаг."""
+    adapter.connect(max_connections=4)
+    checkouts.clear()
+    step = QueryStep(
+        query="SELECT 1",
+        request_count=20,
+        thread_count=4,
+        connection_mode=ConnectionMode.persistent,
+    )
+    result = run_query_step(adapter, step)
+
+    assert result["request_count"] == 20
+    assert result["connection_mode"] == str(ConnectionMode.persistent)
+    assert 0 < len(checkouts) <= step.thread_count
+    # Соединения потоков возвращены в пул по окончании шага
+    assert adapter._persistent == []
+    assert adapter.engine.pool.checkedout() == 0
+
+
+def test_pool_wait_summary(adapter: SQLAdapter) -> None:
+    """Ожидание соединения замеряется для каждого запроса шага."""
+    adapter.connect(max_connections=2)
+    step = QueryStep(query="SELECT 1", request_count=15, thread_count=2)
+    result = run_query_step(adapter, step)
+
+    assert result["pool_wait"]["count"] == 15
+    assert result["pool_wait"]["max_ms"] >= result["pool_wait"]["p95_ms"] >= 0
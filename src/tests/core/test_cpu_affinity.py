@@ -0,0 +1,58 @@
+import os
+
+import pytest
+
+from src.app.manager import cpu_affinity
+from src.app.manager.cpu_affinity import (
+    format_cpuset,
+    parse_cpuset,
+    pinned_thread,
+    split_cores,
+)
+from src.app.schemas.schema import ContainerResources
+
+
+def _fake_topology(root, siblings: dict[int, str]) -> None:
+    for cpu, sibling_list in siblings.items():
+        topology = root / f"cpu{cpu}" / "topology"
+        topology.mkdir(parents=True)
+        (topology / "thread_siblings_list").write_text(sibling_list + "\n")
+
+
+def test_cpuset_roundtrip() -> None:
+    assert parse_cpuset("0-3,8, 10-11") == [0, 1, 2, 3, 8, 10, 11]
+    assert format_cpuset([3, 1, 2]) == "1,2,3"
+
+
+def test_split_keeps_hyperthreads_together(tmp_path, monkeypatch) -> None:
+    """
+    СУБД получает целые физические ядра с конца списка, нагрузка – остальные.
+    """
+    # 4 физических ядра по 2 гиперпотока: (0,4), (1,5), (2,6), (3,7)
+    _fake_topology(tmp_path, {cpu: f"{cpu % 4},{cpu % 4 + 4}" for cpu in range(8)})
+    monkeypatch.setattr(cpu_affinity, "CPU_SYSFS", tmp_path)
+
+    db_cpus, load_cpus = split_cores(list(range(8)), db_cores=4)
+    assert db_cpus == [2, 3, 6, 7]
+    assert load_cpus == [0, 1, 4, 5]
+
+    with pytest.raises(ValueError):
+        split_cores(list(range(8)), db_cores=8)
+
+
+def test_pinned_thread_restores_affinity() -> None:
+    before = os.sched_getaffinity(0)
+    cpu = min(before)
+    with pinned_thread([cpu]):
+        assert os.sched_getaffinity(0) == {cpu}
+    assert os.sched_getaffinity(0) == before
+
+
+def test_container_resources_run_kwargs() -> None:
+    resources = ContainerResources(cpuset_cpus="2-3", cpus=1.5, mem_limit="4g", shm_size="1g")
+    assert resources.run_kwargs() == {
+        "cpuset_cpus": "2-3",
+        "nano_cpus": 1_500_000_000,
+        "mem_limit": "4g",
+        "shm_size": "1g",
+    }
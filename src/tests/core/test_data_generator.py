@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+from src.app.core.scenario_steps import ColumnDefinition
+from src.app.manager.db.utils import UniqueKeys, _random_strings, generate_batches
+from src.app.schemas.enums import DataType, KeyOrder
+
+COLUMNS = {
+    "id": ColumnDefinition(data_type=DataType.int, primary_key=True),
+    "name": ColumnDefinition(data_type=DataType.str),
+    "price": ColumnDefinition(data_type=DataType.float),
+    "created": ColumnDefinition(data_type=DataType.date, primary_key=True),
+    "active": ColumnDefinition(data_type=DataType.bool),
+}
+
+
+def test_generate_batches_respects_chunk_size() -> None:
+    """
+    Генератор отдаёт порции не больше chunk_size и покрывает все строки подряд.
+    """
+    batches = list(generate_batches(1050, COLUMNS, chunk_size=100))
+
+    assert [len(b) for b in batches] == [100] * 10 + [50]
+    assert [b.start for b in batches] == list(range(0, 1050, 100))
+    assert all(set(b.columns) == set(COLUMNS) for b in batches)
+
+
+def test_generate_batches_unique_keys_across_chunks() -> None:
+    """
+    Значения колонок primary_key уникальны по всем порциям, а не только внутри одной.
+    """
+    batches = list(generate_batches(1000, COLUMNS, chunk_size=64))
+
+    ids = np.concatenate([b.columns["id"] for b in batches])
+    dates = np.concatenate([b.columns["created"] for b in batches])
+    assert len(np.unique(ids)) == 1000
+    assert len(np.unique(dates)) == 1000
+
+
+def test_random_strings_length_and_alphabet() -> None:
+    """
+    Случайные строки укладываются в заданный диапазон длин и алфавит.
+    """
+    values = _random_strings(10000, length=12, min_length=4, alphabet="hex")
+    lengths = np.char.str_len(values)
+
+    assert values.shape == (10000,)
+    assert lengths.min() >= 4
+    assert lengths.max() <= 12
+    assert set("".join(values[:100])) <= set("0123456789abcdef")
+
+
+@pytest.mark.parametrize("alphabet", ["", "ab\0c"])
+def test_column_definition_rejects_bad_alphabet(alphabet: str) -> None:
+    with pytest.raises(ValueError, match="Алфавит"):
+        ColumnDefinition(data_type=DataType.str, alphabet=alphabet)
+    with pytest.raises(ValueError, match="Алфавит"):
+        _random_strings(10, alphabet=alphabet)
+
+
+def test_unique_keys_are_permutation_for_every_order() -> None:
+    """
+    Для любого порядка ключи, собранные по порциям, образуют перестановку [0, n).
+    """
+    n = 10007
+    for order in KeyOrder:
+        unique_keys = UniqueKeys(n, order=order, cluster_size=100, seed=42)
+        keys = np.concatenate([unique_keys(s, min(s + 999, n)) for s in range(0, n, 999)])
+
+        assert np.array_equal(np.sort(keys), np.arange(n)), order
+
+    random_keys = UniqueKeys(n, seed=42)(0, n)
+    assert not np.array_equal(random_keys, np.arange(n))
+    assert np.array_equal(random_keys, UniqueKeys(n, seed=42)(0, n))
+
+
+def test_generate_batches_row_ranges_do_not_overlap() -> None:
+    """
+    Писатели с общим seed и непересекающимися row_range получают непересекающиеся ключи.
+    """
+    bounds = [0, 333, 700, 1000]
+    ids = np.concatenate(
+        [
+            batch.columns["id"]
+            for lo, hi in zip(bounds, bounds[1:], strict=False)
+            for batch in generate_batches(1000, COLUMNS, seed=7, row_range=(lo, hi))
+        ],
+    )
+
+    assert np.array_equal(np.sort(ids), np.arange(1000))
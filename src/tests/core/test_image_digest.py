@@ -0,0 +1,22 @@
+from types import SimpleNamespace
+
+from src.app.manager.docker_manager import _image_digest
+
+
+def _image(repo_digests: list[str]) -> SimpleNamespace:
+    return SimpleNamespace(id="sha256:local", attrs={"RepoDigests": repo_digests})
+
+
+def test_digest_matches_image_repository() -> None:
+    """
+    Берётся дайджест репозитория самого образа; порт registry – не тег.
+    """
+    image = _image(["mirror/postgres@sha256:aaa", "postgres@sha256:bbb"])
+    assert _image_digest(image, "postgres:16") == "postgres@sha256:bbb"
+
+    image = _image(["registry:5000/team/pg@sha256:ccc"])
+    assert _image_digest(image, "registry:5000/team/pg") == "registry:5000/team/pg@sha256:ccc"
+
+
+def test_locally_built_image_uses_id() -> None:
+    assert _image_digest(_image([]), "my-db:dev") == "sha256:local"
@@ -0,0 +1,74 @@
+import pytest
+from sqlalchemy import text
+from src.app.core.scenario_steps import ColumnDefinition, CreateTableStep, InsertDataStep
+from src.app.manager.db.base_adapter import effective_insert_params
+from src.app.manager.db.bulk_loader import _CommitCounter
+from src.app.manager.db.sql_adapter import SQLAdapter
+from src.app.schemas.enums import DataType, InsertMethod
+
+COLUMNS = {
+    "id": ColumnDefinition(data_type=DataType.int, primary_key=True),
+    "name": ColumnDefinition(data_type=DataType.str),
+}
+
+
+def _insert_step(**kwargs) -> InsertDataStep:
+    return InsertDataStep(table_name="items", num_records=95, columns=COLUMNS, **kwargs)
+
+
+@pytest.mark.parametrize(
+    ("batch_size", "rows_per_transaction", "max_batch_size", "expected"),
+    [
+        (None, None, None, (500, 500)),
+        (100, None, None, (100, 100)),
+        (100, 250, None, (100, 300)),
+        (100, 300, None, (100, 300)),
+        (100, 50, None, (100, 100)),
+        (5000, 2500, 1000, (1000, 3000)),
+    ],
+)
+def test_effective_insert_params(
+    batch_size: int | None,
+    rows_per_transaction: int | None,
+    max_batch_size: int | None,
+    expected: tuple[int, int],
+) -> None:
+    """
+    Размер пачки ограничивается max_batch_size, а интервал фиксации
+    округляется вверх до целого числа пачек.
+    """
+    step = _insert_step(batch_size=batch_size, rows_per_transaction=rows_per_transaction)
+    params = effective_insert_params(step, 500, max_batch_size)
+    assert (params["batch_size"], params["rows_per_transaction"]) == expected
+
+
+def test_commit_counter() -> None:
+    """Фиксация – как только в транзакции накопилось rows_per_transaction строк."""
+    commit = _CommitCounter(30)
+    assert [commit.add(10) for _ in range(7)] == [False, False, True, False, False, True, False]
+
+    every_batch = _CommitCounter(None)
+    assert [every_batch.add(10) for _ in range(3)] == [True, True, True]
+
+
+@pytest.mark.parametrize("insert_method", [InsertMethod.app, InsertMethod.bulk])
+def test_sqlite_insert_with_partial_transactions(tmp_path, insert_method: InsertMethod) -> None:
+    """
+    rows_per_transaction, не кратный batch_size, округляется до целых пачек;
+    последняя неполная транзакция тоже фиксируется.
+    """
+    adapter = SQLAdapter(db_type="sqlite", db_name=str(tmp_path / "insert.db"))
+    adapter.connect()
+    adapter.create_table(CreateTableStep(table_name="items", columns=COLUMNS))
+    step = _insert_step(insert_method=insert_method, batch_size=10, rows_per_transaction=25)
+
+    params = adapter.insert_data(step)
+
+    assert params == {
+        "insert_method": insert_method.value,
+        "batch_size": 10,
+        "rows_per_transaction": 30,
+    }
+    with adapter.engine.connect() as connection:
+        assert connection.execute(text("SELECT COUNT(*) FROM items")).scalar() == 95
+    adapter.engine.dispose()
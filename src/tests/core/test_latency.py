@@ -0,0 +1,47 @@
+import random
+import threading
+
+from src.app.core.latency import LatencyHistogram, LatencyRecorder
+
+
+def test_histogram_percentiles_within_precision() -> None:
+    """
+    Перцентили гистограммы совпадают с точными значениями с точностью ~0.1%.
+    """
+    values = [random.randint(1, 5_000_000) for _ in range(20000)]
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+
+    values.sort()
+    for q in (50, 95, 99):
+        exact = values[round(len(values) * q / 100) - 1]
+        assert abs(histogram.percentile(q) - exact) <= exact * 0.002
+    assert histogram.max_us == values[-1]
+    assert histogram.min_us == values[0]
+
+
+def test_recorder_merges_threads_and_roundtrips() -> None:
+    """
+    Замеры из разных потоков объединяются, сериализация не теряет данных.
+    """
+    recorder = LatencyRecorder()
+
+    def work() -> None:
+        for _ in range(1000):
+            recorder.record(0.002)
+        recorder.record_error()
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    merged = recorder.merged()
+    assert merged.count == 4000
+    assert merged.errors == 4
+
+    restored = LatencyHistogram.from_dict(merged.to_dict())
+    assert restored.summary() == merged.summary()
+    assert abs(restored.summary()["p50_ms"] - 2.0) < 0.01
@@ -0,0 +1,21 @@
+import pytest
+from src.app.core.load_profile import arrival_times
+from src.app.schemas.enums import RateProfile
+
+
+@pytest.mark.parametrize(
+    ("profile", "expected"),
+    [
+        (RateProfile.constant, 2000),
+        (RateProfile.ramp, 1100),  # среднее (100 + 1000) / 2 за 2 секунды
+        (RateProfile.poisson, 2000),
+    ],
+)
+def test_arrival_times_match_rate(profile: RateProfile, expected: int) -> None:
+    """
+    Число плановых запросов соответствует интенсивности профиля, моменты не убывают.
+    """
+    times = list(arrival_times(profile, 1000, 2.0, start_rate=100, seed=1))
+
+    assert abs(len(times) - expected) <= expected * 0.05
+    assert all(0 <= a <= b < 2.0 for a, b in zip(times, times[1:], strict=False))
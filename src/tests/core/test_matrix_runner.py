@@ -0,0 +1,86 @@
+import json
+import threading
+
+from src.app.core.docker_test import _plan_resources
+from src.app.core.matrix_runner import (
+    CpuSetAllocator,
+    MatrixConf,
+    _cell_test_conf,
+    expand_matrix,
+)
+from src.app.core.scenario_steps import QueryStep
+from src.app.schemas.enums import ExecutionMode
+from src.app.storage.model import DockerImage
+
+
+def _image(name: str) -> DockerImage:
+    config = {"db_type": "postgresql", "port": 5432, "env": {"POSTGRES_DB": "test_db"}}
+    return DockerImage(image_name=name, config_name=name, config=json.dumps(config))
+
+
+def test_matrix_expansion_and_cell_config() -> None:
+    """
+    Ячейки – произведение образов, вариантов и параметров; параметры попадают
+    в шаги, вариант – в конфигурацию образа, метки – в run_tags.
+    """
+    matrix = MatrixConf(
+        images=[_image("postgres:15"), _image("postgres:16")],
+        scenario_steps=[QueryStep(query="SELECT 1", thread_count=1, request_count=10)],
+        config_variants={"default": {}, "tuned": {"env": {"POSTGRES_INITDB_ARGS": "-k"}}},
+        step_params={"thread_count": [1, 8], "execution_mode": ["asyncio"]},
+    )
+    cells = expand_matrix(matrix)
+    assert len(cells) == 2 * 2 * 2
+    assert len({cell.index for cell in cells}) == len(cells)
+
+    cell = next(c for c in cells if c.variant == "tuned" and c.params["thread_count"] == 8)
+    conf = _cell_test_conf(matrix, cell, "group42", [2, 3], parallel=True)
+
+    step = conf.scenario_steps[0]
+    assert step.thread_count == 8
+    assert step.execution_mode is ExecutionMode.asyncio
+    assert conf.db_config.get_config_as_json()["env"] == {
+        "POSTGRES_DB": "test_db",
+        "POSTGRES_INITDB_ARGS": "-k",
+    }
+    assert conf.cpuset_cpus == "2,3"
+    assert conf.run_group_id == "group42"
+    assert conf.run_tags["config_variant"] == "tuned"
+    assert conf.test_system_config.random_host_port
+    names = {_cell_test_conf(matrix, c, "g", None, parallel=True).container_name for c in cells}
+    assert len(names) == len(cells)
+
+
+def test_cpuset_allocator_gives_disjoint_cores() -> None:
+    allocator = CpuSetAllocator(list(range(6)), cpus_per_run=2)
+    assert allocator.slots == 3
+
+    held = [allocator.acquire() for _ in range(3)]
+    assert sorted(cpu for cpus in held for cpu in cpus) == list(range(6))
+
+    acquired = []
+    waiter = threading.Thread(target=lambda: acquired.append(allocator.acquire()))
+    waiter.start()
+    waiter.join(0.1)
+    assert not acquired  # свободных ядер нет – ждём
+
+    allocator.release(held[1])
+    waiter.join(1)
+    assert acquired == [held[1]]
+
+
+def test_cell_load_cores_come_from_its_own_lease(monkeypatch) -> None:
+    """
+    Генератор нагрузки ячейки получает ядра из своей аренды, а не все ядра
+    вне её СУБД – иначе он занял бы ядра СУБД соседних ячеек.
+    """
+    monkeypatch.setattr("src.app.core.docker_test.available_cpus", lambda: list(range(8)))
+    matrix = MatrixConf(
+        images=[_image("postgres:16")],
+        scenario_steps=[QueryStep(query="SELECT 1", thread_count=1, request_count=10)],
+    )
+    cell = expand_matrix(matrix)[0]
+    conf = _cell_test_conf(matrix, cell, "g", [6, 7], parallel=True, load_cpus=[4, 5])
+    resources, load_cpus = _plan_resources(conf, {}, local=True)
+    assert resources.cpuset_cpus == "6,7"
+    assert load_cpus == [4, 5]
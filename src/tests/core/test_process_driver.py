@@ -0,0 +1,136 @@
+import asyncio
+import pickle
+import threading
+
+import pytest
+from sqlalchemy import Engine, event
+from src.app.core.docker_test import _max_concurrency
+from src.app.core.latency import LatencyHistogram
+from src.app.core.process_driver import _query_worker, _share
+from src.app.core.query_runner import QueryRun
+from src.app.core.scenario_steps import QueryStep
+from src.app.manager.db.sql_adapter import AsyncSQLAdapter, SQLAdapter
+from src.app.schemas.enums import ConnectionMode, ExecutionMode
+
+
+def test_shares_cover_total() -> None:
+    """
+    Доли нагрузки процессов отличаются не больше чем на 1 и в сумме дают целое.
+    """
+    for total in (1, 7, 100, 1001):
+        for parts in range(1, min(total, 16) + 1):
+            shares = [_share(total, parts, i) for i in range(parts)]
+            assert sum(shares) == total
+            assert max(shares) - min(shares) <= 1
+
+
+def test_query_runs_merge() -> None:
+    """
+    Результаты процессов объединяются: замеры суммируются, служебные метрики – максимум.
+    """
+    runs = []
+    for values, lag in (([100, 200], 1.0), ([300], 5.0)):
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+        runs.append(QueryRun(histogram, 1.0, extra={"max_dispatch_lag_ms": lag}))
+
+    run = pickle.loads(pickle.dumps(runs[0]))
+    run.merge(pickle.loads(pickle.dumps(runs[1])))
+    assert run.histogram.count == 3
+    assert run.histogram.max_us == 300
+    assert run.extra["max_dispatch_lag_ms"] == 5.0
+
+
+def test_adapter_pickles_without_connection(tmp_path) -> None:
+    """
+    В дочерний процесс адаптер передаётся без живого соединения.
+    """
+    adapter = SQLAdapter(db_type="sqlite", db_name=str(tmp_path / "test.db"))
+    adapter.engine = object()  # соединение, которое нельзя сериализовать
+
+    restored = pickle.loads(pickle.dumps(adapter))
+    assert restored.engine is None
+    assert restored.db_name == adapter.db_name
+
+
+def test_runner_pool_skips_steps_with_own_connections() -> None:
+    """
+    Пул раннера не растёт под шаги, которые открывают соединения сами:
+    процессы нагрузки и движок asyncio.
+    """
+    steps = [
+        QueryStep(query="SELECT 1", request_count=10, thread_count=8, process_count=4),
+        QueryStep(
+            query="SELECT 1",
+            request_count=10,
+            thread_count=32,
+            execution_mode=ExecutionMode.asyncio,
+        ),
+        QueryStep(query="SELECT 1", request_count=10, thread_count=3),
+    ]
+    assert _max_concurrency(steps) == 3
+    assert _max_concurrency(steps[:2]) == 1
+
+
+def test_async_persistent_connections_are_reused(tmp_path) -> None:
+    """
+    В режиме persistent асинхронный адаптер держит ровно max_connections
+    соединений и раздаёт их одновременным запросам.
+    """
+    pytest.importorskip("aiosqlite")
+    adapter = AsyncSQLAdapter(f"sqlite+aiosqlite:///{tmp_path / 'async.db'}")
+    step = QueryStep(query="SELECT 1", request_count=1, thread_count=3)
+
+    async def run() -> tuple[int, int]:
+        await adapter.connect(max_connections=3, connection_mode=ConnectionMode.persistent)
+        try:
+            await asyncio.gather(*(adapter.execute_query(step) for _ in range(10)))
+            return len(adapter._persistent), adapter._free_persistent.qsize()
+        finally:
+            await adapter.close()
+
+    assert asyncio.run(run()) == (3, 3)
+
+
+@pytest.mark.parametrize(
+    ("execution_mode", "sync_connects"),
+    [(ExecutionMode.threads, [4]), (ExecutionMode.asyncio, [])],
+)
+def test_query_worker_opens_one_pool(tmp_path, monkeypatch, execution_mode, sync_connects) -> None:
+    """
+    Процесс нагрузки открывает соединения только своего движка: для asyncio
+    синхронный пул не создаётся, и соединений не больше thread_count.
+    """
+    if execution_mode == ExecutionMode.asyncio:
+        pytest.importorskip("aiosqlite")
+    adapter = SQLAdapter(db_type="sqlite", db_name=str(tmp_path / "test.db"))
+    step = QueryStep(
+        query="SELECT 1",
+        request_count=20,
+        thread_count=4,
+        execution_mode=execution_mode,
+    )
+
+    connects = []
+    original_connect = SQLAdapter.connect
+
+    def counting_connect(self, max_connections=None, **kwargs) -> None:
+        connects.append(max_connections)
+        original_connect(self, max_connections=max_connections, **kwargs)
+
+    monkeypatch.setattr(SQLAdapter, "connect", counting_connect)
+    opened = []
+
+    def on_connect(dbapi_connection, connection_record) -> None:
+        opened.append(dbapi_connection)
+
+    event.listen(Engine, "connect", on_connect)
+    try:
+        run = _query_worker(threading.Barrier(1), adapter, step, 0.0)
+    finally:
+        event.remove(Engine, "connect", on_connect)
+
+    assert run.last_error is None
+    assert connects == sync_connects
+    assert 0 < len(opened) <= step.thread_count
@@ -0,0 +1,51 @@
+import socket
+
+import pytest
+from sqlalchemy import create_engine
+from src.app.manager import readiness
+from src.app.manager.db.sql_adapter import SQLAdapter
+from src.app.manager.readiness import tcp_open, wait_for_database, wait_until
+from src.app.schemas.schema import ReadinessConfig
+
+
+def test_wait_until_backs_off_exponentially(monkeypatch) -> None:
+    """
+    Паузы между пробами растут вдвое до max_delay.
+    """
+    sleeps = []
+    monkeypatch.setattr(readiness.time, "sleep", sleeps.append)
+    attempts = iter([False] * 6 + [True])
+
+    wait_until(lambda: next(attempts), deadline=float("inf"), initial_delay=0.1, max_delay=1.0)
+    assert sleeps == pytest.approx([0.1, 0.2, 0.4, 0.8, 1.0, 1.0])
+
+
+def test_wait_until_times_out() -> None:
+    with pytest.raises(TimeoutError):
+        wait_until(lambda: False, deadline=0, description="никогда")
+
+
+def test_wait_for_database(tmp_path) -> None:
+    """
+    Все пробы проходят: порт открыт, СУБД отвечает на SELECT 1.
+    """
+    with socket.socket() as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen()
+        port = server.getsockname()[1]
+        assert tcp_open("127.0.0.1", port)
+
+        adapter = SQLAdapter(db_type="sqlite", db_name=str(tmp_path / "test.db"))
+        elapsed = wait_for_database(adapter, ReadinessConfig(timeout=5), "127.0.0.1", port)
+    assert 0 <= elapsed < 5
+    assert not tcp_open("127.0.0.1", port)
+
+
+def test_failed_connect_does_not_sleep_after_last_attempt(tmp_path, monkeypatch) -> None:
+    sleeps = []
+    monkeypatch.setattr("src.app.manager.db.sql_adapter.time.sleep", sleeps.append)
+    adapter = SQLAdapter(db_type="sqlite", db_name=str(tmp_path / "missing" / "db.sqlite"))
+    adapter.engine = create_engine(adapter.db_url())
+
+    assert not adapter.test_connection(retries=3, delay=2)
+    assert sleeps == [2, 2]
@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+from src.app.core.scenario_steps import QueryStep
+from src.app.manager.db.redis_adapter import AsyncRedisAdapter
+from src.app.schemas.enums import ConnectionMode
+
+
+class _RespServer:
+    """Минимальный сервер RESP: на PING отвечает PONG, на остальное – OK."""
+
+    def __init__(self) -> None:
+        self.connections = 0
+        self.port = 0
+        self._server: asyncio.Server | None = None
+
+    async def __aenter__(self) -> "_RespServer":
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while header := await reader.readline():
+                args = []
+                for _ in range(int(header[1:])):
+                    length = int((await reader.readline())[1:])
+                    args.append((await reader.readexactly(length + 2))[:-2])
+                writer.write(b"+PONG\r\n" if args[0].upper() == b"PING" else b"+OK\r\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+@pytest.mark.parametrize(
+    ("connection_mode", "expected_connections"),
+    [
+        # Соединение проверки переиспользуется пулом
+        (ConnectionMode.pooled, 3),
+        (ConnectionMode.persistent, 3),
+        # Проверка при подключении и по соединению на каждый из 12 запросов
+        (ConnectionMode.null, 13),
+    ],
+)
+def test_async_redis_connection_modes(
+    connection_mode: ConnectionMode,
+    expected_connections: int,
+) -> None:
+    step = QueryStep(query="GET key", request_count=12, thread_count=3)
+
+    async def run() -> int:
+        async with _RespServer() as server:
+            adapter = AsyncRedisAdapter(host="127.0.0.1", port=server.port)
+            await adapter.connect(max_connections=3, connection_mode=connection_mode)
+
+            async def worker() -> None:
+                for _ in range(4):
+                    assert await adapter.execute_query(step) == "OK"
+
+            try:
+                await asyncio.gather(*(worker() for _ in range(3)))
+            finally:
+                await adapter.close()
+            return server.connections
+
+    assert asyncio.run(run()) == expected_connections
@@ -0,0 +1,32 @@
+import pytest
+
+from src.app.core.repeat_stats import summarize, t_quantile_975
+
+
+def test_summary_of_repeats() -> None:
+    """
+    Сводка по повторам: t-интервал по n - 1 степеням свободы вокруг среднего.
+    """
+    summary = summarize([10.0, 12.0, 11.0, 13.0, 9.0])
+
+    assert summary["n"] == 5
+    assert summary["mean"] == pytest.approx(11.0)
+    assert summary["median"] == 11.0
+    assert (summary["min"], summary["max"]) == (9.0, 13.0)
+    assert summary["stddev"] == pytest.approx(1.5811, rel=1e-4)
+    # t(0.975; 4) = 2.776, полуширина = 2.776 * 1.5811 / sqrt(5)
+    assert summary["ci95_high"] - summary["mean"] == pytest.approx(1.963, rel=1e-3)
+    assert summary["mean"] - summary["ci95_low"] == pytest.approx(1.963, rel=1e-3)
+
+
+def test_single_value_has_zero_width() -> None:
+    summary = summarize([4.2])
+    assert summary["stddev"] == 0.0
+    assert summary["ci95_low"] == summary["ci95_high"] == 4.2
+
+
+def test_t_quantile_is_conservative_between_table_points() -> None:
+    assert t_quantile_975(11) == t_quantile_975(10)
+    assert t_quantile_975(1000) == pytest.approx(1.96)
+    with pytest.raises(ValueError):
+        t_quantile_975(0)
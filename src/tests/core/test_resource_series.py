@@ -0,0 +1,45 @@
+import numpy as np
+
+from src.app.core.resource_series import ResourceSeries
+
+
+def test_full_series_is_thinned_not_truncated() -> None:
+    """
+    При заполнении ряд прореживается вдвое, а не теряет начало: первая и
+    последняя точки сохраняются, пики и счётчики – тоже.
+    """
+    series = ResourceSeries(capacity=5)
+    for i in range(12):
+        series.append(timestamp=i, cpu_percent=100 if i == 1 else 1, blk_read=i)
+
+    assert series.stride == 4
+    assert len(series) <= 5
+    assert series.column("timestamp").tolist() == [3, 7, 11]
+    assert series.column("cpu_percent").tolist() == [100, 1, 1]
+    assert series.column("blk_read")[-1] == 11
+    assert series.column("rss").tolist() == [0] * 3
+
+
+def test_downsample_keeps_peaks_and_counters() -> None:
+    """
+    Прореживание сохраняет пики мгновенных значений и последние значения счётчиков.
+    """
+    series = ResourceSeries(capacity=1000)
+    for i in range(1000):
+        series.append(timestamp=i, cpu_percent=100 if i == 457 else 1, blk_read=i * 4096)
+
+    points = series.downsample(100)
+    assert len(points["timestamp"]) == 100
+    assert points["cpu_percent"].max() == 100
+    assert points["blk_read"][-1] == 999 * 4096
+    assert np.all(np.diff(points["timestamp"]) > 0)
+
+
+def test_roundtrip() -> None:
+    series = ResourceSeries(capacity=3)
+    for i in range(4):
+        series.append(timestamp=i, rss=i * 1024, pids=i)
+
+    restored = ResourceSeries.from_dict(series.to_dict())
+    assert np.array_equal(restored.to_array(), series.to_array())
+    assert restored.stride == series.stride == 2
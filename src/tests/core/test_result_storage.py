@@ -0,0 +1,105 @@
+import datetime
+
+import pytest
+from sqlalchemy import text
+from src.app.storage.db_manager.result_storage import ResultStorage
+from src.app.storage.model import TestRun
+
+
+def test_ensure_run_is_idempotent(storage: ResultStorage) -> None:
+    started_at = datetime.datetime(2025, 5, 1, 10, 0, 0)
+    storage.ensure_run("run1", started_at)
+    storage.ensure_run("run1")
+    with storage.session_scope() as session:
+        runs = session.query(TestRun).all()
+    assert [(run.id, run.started_at) for run in runs] == [("run1", started_at)]
+
+
+def test_timestamps_keep_microseconds_and_order(storage: ResultStorage, make_result) -> None:
+    """
+    Шаги, завершившиеся в одну секунду, различаются по микросекундам,
+    а при равном времени порядок задаёт id.
+    """
+    base = datetime.datetime(2025, 5, 1, 10, 0, 0)
+    storage.ensure_run("run1", base)
+    first = storage.insert_result(make_result(timestamp=base.replace(microsecond=1)))
+    second = storage.insert_result(make_result(timestamp=base.replace(microsecond=2)))
+    third = storage.insert_result(make_result(timestamp=base.replace(microsecond=2)))
+
+    results = storage.select_all_results(db_image="postgres:16", operation="query")
+    assert [result.id for result in results] == [third, second, first]
+    assert results[-1].timestamp == base.replace(microsecond=1)
+
+
+def test_filtered_listing_uses_index(storage: ResultStorage) -> None:
+    with storage.engine.connect() as connection:
+        plan = connection.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT id FROM test_results "
+                "WHERE db_image = 'pg' AND operation = 'query' ORDER BY timestamp DESC",
+            ),
+        ).all()
+    detail = " ".join(row[-1] for row in plan)
+    assert "ix_test_results_image_operation_timestamp" in detail
+    assert "TEMP B-TREE" not in detail
+
+
+@pytest.mark.parametrize("order", ["asc", "desc"])
+def test_keyset_pages_cover_all_rows_once(storage: ResultStorage, make_result, order: str) -> None:
+    """
+    Страницы по столбцу с повторами и NULL дают ту же последовательность,
+    что и один запрос без пагинации.
+    """
+    base = datetime.datetime(2025, 5, 1, 10, 0, 0)
+    for i in range(11):
+        result = make_result(timestamp=base + datetime.timedelta(seconds=i))
+        result.latency_p50 = None if i % 4 == 0 else float(i % 3)
+        storage.insert_result(result)
+
+    expected = storage.select_results_page(sort="latency_p50", order=order, limit=100)
+    pages, after = [], None
+    while page := storage.select_results_page(
+        sort="latency_p50",
+        order=order,
+        after=after,
+        limit=3,
+    ):
+        pages.extend(page)
+        after = (page[-1].latency_p50, page[-1].id)
+
+    assert [result.id for result in pages] == [result.id for result in expected]
+    assert len(expected) == storage.count_results(operation="query") == 11
+    assert storage.count_results(db_image="mysql:8") == 0
+
+
+def test_data_version_and_results_since(storage: ResultStorage, make_result) -> None:
+    """Без записей версия не меняется; после записи новые строки – по id."""
+    version = storage.data_version()
+    assert storage.data_version() == version
+    assert storage.max_result_id() == 0
+
+    base = datetime.datetime(2025, 5, 1, 10, 0, 0)
+    first = storage.insert_result(make_result(timestamp=base))
+    assert storage.data_version() != version
+
+    second = storage.insert_result(make_result(timestamp=base, db_image="mysql:8"))
+    assert [result.id for result in storage.select_results_since(first)] == [second]
+    assert storage.select_results_since(first, db_image="postgres:16") == []
+    assert storage.max_result_id() == second
+
+
+def test_distinct_values_follow_inserts_and_deletes(storage: ResultStorage, make_result) -> None:
+    base = datetime.datetime(2025, 5, 1, 10, 0, 0)
+    first = storage.insert_result(make_result(timestamp=base))
+    second = storage.insert_result(make_result(timestamp=base))
+    mysql = storage.insert_result(make_result(timestamp=base, db_image="mysql:8"))
+    assert storage.get_distinct_db_images() == ["mysql:8", "postgres:16"]
+    assert storage.get_distinct_operations() == ["query"]
+
+    storage.delete_result(mysql)
+    storage.delete_result(first)
+    assert storage.get_distinct_db_images() == ["postgres:16"]
+
+    storage.delete_result(second)
+    assert storage.get_distinct_db_images() == []
+    assert storage.get_distinct_operations() == []
@@ -0,0 +1,39 @@
+import pytest
+from src.app.storage.db_manager.result_storage import ResultStorage
+from src.app.storage.db_manager.result_writer import ResultWriter
+from src.app.storage.model import TestResults
+
+
+class FailingStorage:
+    def insert_results(self, test_results: list[TestResults]) -> list[int]:
+        msg = "database is locked"
+        raise OSError(msg)
+
+
+def test_writer_flushes_everything_in_order(storage: ResultStorage, make_result) -> None:
+    with ResultWriter(storage, max_pending=4, batch_size=3) as writer:
+        for i in range(10):
+            writer.put(make_result(operation="insert", num_records=i))
+        writer.flush()
+        assert storage.count_results() == 10
+        writer.put(make_result(operation="insert", num_records=10))
+
+    results = storage.select_results_page(sort="id", order="asc", limit=100)
+    assert [result.num_records for result in results] == list(range(11))
+    assert storage.get_distinct_operations() == ["insert"]
+    with storage.engine.connect() as connection:
+        assert connection.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+
+
+def test_write_error_is_raised_on_close(make_result) -> None:
+    writer = ResultWriter(FailingStorage())
+    writer.put(make_result(operation="insert", num_records=1))
+    with pytest.raises(RuntimeError, match="database is locked"):
+        writer.close()
+
+
+def test_test_error_is_not_masked_by_write_error(make_result) -> None:
+    with pytest.raises(ValueError, match="step failed"), ResultWriter(FailingStorage()) as writer:
+        writer.put(make_result(operation="insert", num_records=1))
+        msg = "step failed"
+        raise ValueError(msg)